@@ -0,0 +1,143 @@
+""" Benchmarks of the entry points of :obj:`wc_test.core` with synthetic models of increasing size
+
+Each run appends one JSON record per model size and entry point to a results file so that
+the performance of wc_test can be tracked over time::
+
+    python benchmarks/benchmark_core.py
+    python benchmarks/benchmark_core.py --sizes 10 100 1000 --max-simulated-species 1000
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import core
+from wc_test import synthetic
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import time
+
+SIZES = (10, 100, 1000, 10000, 100000)
+RESULTS_FILENAME = os.path.join(os.path.dirname(__file__), 'results.jsonl')
+
+
+def get_commit():
+    """ Get the git commit of the working copy
+
+    Returns:
+        :obj:`str`: hash of the commit, or :obj:`None` if it can't be determined
+    """
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def time_func(func, repeats=1):
+    """ Get the shortest time of several calls to a function
+
+    Args:
+        func (:obj:`callable`): function
+        repeats (:obj:`int`, optional): number of calls
+
+    Returns:
+        :obj:`float`: shortest time (s)
+    """
+    times = []
+    for i_repeat in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark(n_species, simulate=True, repeats=3):
+    """ Time the entry points of :obj:`wc_test.core` with a synthetic model
+
+    Args:
+        n_species (:obj:`int`): number of species of the model
+        simulate (:obj:`bool`, optional): if :obj:`True`, also time the entry points which
+            simulate the model
+        repeats (:obj:`int`, optional): number of calls of each entry point which doesn't simulate
+
+    Returns:
+        :obj:`dict`: dictionary which maps the name of each entry point to its time (s)
+    """
+    times = {}
+    start = time.perf_counter()
+    model = synthetic.get_synthetic_model(n_species=n_species, n_submodels=max(1, n_species // 1000),
+                                          n_parameters=n_species, seed=0)
+    times['get_synthetic_model'] = time.perf_counter() - start
+
+    test_case = type('BenchmarkTestCase', (core.SimulationTestCase, ), {'MODEL': model})()
+
+    def set_up():
+        test_case.setUp()
+        test_case.tearDown()
+    times['setUp'] = time_func(set_up, repeats=repeats)
+
+    test_case.setUp()
+    try:
+        species_ids = [species.id for species in model.species]
+        reaction_ids = [reaction.id for reaction in model.reactions]
+
+        times['get_species'] = time_func(lambda: [test_case.get_species(id) for id in species_ids], repeats=repeats)
+
+        def change_parameter_values():
+            test_case.change_parameter_values({'parameter_{}'.format(i): 2. for i in range(n_species)})
+            test_case.undo_perturbations()
+        times['change_parameter_values'] = time_func(change_parameter_values, repeats=repeats)
+
+        def change_reaction_k_cat_parameter_values():
+            test_case.change_reaction_k_cat_parameter_values({id: 2e-3 for id in reaction_ids})
+            test_case.undo_perturbations()
+        times['change_reaction_k_cat_parameter_values'] = time_func(change_reaction_k_cat_parameter_values,
+                                                                    repeats=repeats)
+
+        def select_submodels():
+            test_case.select_submodels({'submodel_0': False})
+            test_case.undo_perturbations()
+        times['select_submodels'] = time_func(select_submodels, repeats=repeats)
+
+        if simulate:
+            times['simulate'] = time_func(lambda: test_case.simulate(end_time=10., checkpoint_period=5., seed=1))
+            times['sim_scan_parameters'] = time_func(lambda: test_case.sim_scan_parameters(
+                {'k_cat_0': [1e-3, 2e-3]}, end_time=10., checkpoint_period=5., seed=1))
+    finally:
+        test_case.tearDown()
+
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark wc_test with synthetic models of increasing size')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='numbers of species')
+    parser.add_argument('--max-simulated-species', type=int, default=10000,
+                        help='maximum number of species of the models which are simulated')
+    parser.add_argument('--repeats', type=int, default=3, help='number of calls of each entry point')
+    parser.add_argument('--output', default=RESULTS_FILENAME, help='path to append the results')
+    args = parser.parse_args()
+
+    metadata = {
+        'date': datetime.datetime.now().isoformat(),
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+    }
+    with open(args.output, 'a') as file:
+        for n_species in args.sizes:
+            times = benchmark(n_species, simulate=n_species <= args.max_simulated_species, repeats=args.repeats)
+            for entry_point, seconds in times.items():
+                record = dict(metadata, n_species=n_species, entry_point=entry_point, time=seconds)
+                file.write(json.dumps(record) + '\n')
+                print('{:>8d} {:<40} {:>10.4f} s'.format(n_species, entry_point, seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+""" Benchmark of the time required to import :obj:`wc_test`
+
+Each statement is timed in a fresh interpreter. The time to import :obj:`wc_test` is
+reported together with the time to import :obj:`wc_test` and all of its heavy dependencies,
+which is the import time that lazy imports avoid (see :obj:`wc_test.lazy`)::
+
+    python benchmarks/benchmark_import.py
+    python benchmarks/benchmark_import.py --repeats 10
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from benchmark_core import RESULTS_FILENAME, get_commit
+from wc_test import lazy
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+
+STATEMENTS = {
+    'import wc_test': 'import wc_test',
+    'import wc_test.core': 'import wc_test.core',
+    'import wc_test, heavy dependencies': 'import wc_test.core\n' + '\n'.join(
+        'import ' + name for name in lazy.HEAVY_MODULES),
+}
+
+
+def time_statement(statement, repeats=5):
+    """ Get the shortest time of several executions of a statement in fresh interpreters
+
+    Args:
+        statement (:obj:`str`): statement
+        repeats (:obj:`int`, optional): number of executions
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`float`: shortest time (s)
+            * :obj:`list` of :obj:`str`: heavy dependencies imported by the statement
+    """
+    script = '\n'.join([
+        'import json, sys, time',
+        'start = time.perf_counter()',
+        statement,
+        'duration = time.perf_counter() - start',
+        'print(json.dumps([duration, [name for name in {} if name in sys.modules]]))'.format(
+            repr(list(lazy.HEAVY_MODULES))),
+    ])
+    cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    for i_repeat in range(repeats):
+        duration, imported = json.loads(subprocess.check_output([sys.executable, '-c', script], cwd=cwd))
+        times.append(duration)
+    return min(times), imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the time required to import wc_test')
+    parser.add_argument('--repeats', type=int, default=5, help='number of imports of each statement')
+    parser.add_argument('--output', default=RESULTS_FILENAME, help='path to append the results')
+    args = parser.parse_args()
+
+    metadata = {
+        'date': datetime.datetime.now().isoformat(),
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+    }
+    with open(args.output, 'a') as file:
+        for entry_point, statement in STATEMENTS.items():
+            seconds, imported = time_statement(statement, repeats=args.repeats)
+            record = dict(metadata, entry_point=entry_point, time=seconds, heavy_modules=imported)
+            file.write(json.dumps(record) + '\n')
+            print('{:<40} {:>10.4f} s  {}'.format(entry_point, seconds, ', '.join(imported)))
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,7 @@ import wc_kb
 import wc_lang
 from wc_sim.simulation import Simulation
 from wc_sim.run_results import RunResults
+from wc_test import stoichiometry
 
 
 class KnowledgeBaseTestCase(unittest.TestCase):
@@ -33,35 +34,17 @@ class ModelTestCase(unittest.TestCase):
     """
 
     def test_reactions_balanced(self):
-        """ Check that each reaction is element and charge balanced
+        """ Check that each reaction is element and charge balanced, with the vectorized check of
+        :obj:`wc_test.core.ModelTestCase.assert_reactions_balanced`
 
         Raises:
             :obj:`Exception`: if one or more reactions is unbalanced
         """
-
-        imbalances = []
-        for reaction in self.MODEL.reactions:
-            imbalance = self.is_reaction_balanced(reaction)
-            if imbalance:
-                imbalances.append(imbalance)
-
+        imbalances = stoichiometry.get_reaction_imbalances(stoichiometry.get_stoichiometry(self.MODEL),
+                                                           stoichiometry.get_composition(self.MODEL))
         if imbalances:
-            msg = []
-            for imbalance in imbalances:
-                if imbalance.element:
-                    msg.append('Reaction {} is element imbalanced: {}'.format())
-                if imbalance.charge:
-                    msg.append('Reaction {} is charge imbalanced: {}'.format())
-
-            raise Exception('The following reactions are not balanced:\n  {}'.format('\n  '.join(msg)))
-
-    def is_reaction_balanced(self, reaction):
-        """ Check that a reaction is element and charge balanced
-
-        Returns:
-            imbalance
-        """
-        pass
+            raise Exception('The following reactions are not balanced:\n  {}'.format(
+                '\n  '.join(str(imbalance) for imbalance in imbalances)))
 
 
 class SubmodelTestCase(unittest.TestCase):
@@ -0,0 +1,137 @@
+""" Test of wc_test.cache
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import cache
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import wc_lang
+import wc_lang.io
+
+
+class ParsedFileCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dirname, 'model.txt')
+        with open(self.filename, 'w') as file:
+            file.write('abc')
+        self.cache_dir = os.path.join(self.dirname, 'cache')
+        self.n_reads = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def read(self, path):
+        self.n_reads += 1
+        with open(path, 'r') as file:
+            return {'value': file.read()}
+
+    def test_get(self):
+        parsed_file_cache = cache.ParsedFileCache()
+        obj = parsed_file_cache.get('model', self.filename, self.read)
+        self.assertEqual(obj, {'value': 'abc'})
+        self.assertIs(parsed_file_cache.get('model', self.filename, self.read), obj)
+        self.assertEqual(self.n_reads, 1)
+
+        parsed_file_cache.get('kb', self.filename, self.read)
+        self.assertEqual(self.n_reads, 2)
+
+        with open(self.filename, 'w') as file:
+            file.write('abcd')
+        self.assertEqual(parsed_file_cache.get('model', self.filename, self.read), {'value': 'abcd'})
+        self.assertEqual(self.n_reads, 3)
+
+        parsed_file_cache.clear()
+        parsed_file_cache.get('model', self.filename, self.read)
+        self.assertEqual(self.n_reads, 4)
+
+    def test_get_on_disk(self):
+        obj = cache.ParsedFileCache().get('model', self.filename, self.read, cache_dir=self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertEqual(self.n_reads, 1)
+
+        self.assertEqual(cache.ParsedFileCache().get('model', self.filename, self.read, cache_dir=self.cache_dir), obj)
+        self.assertEqual(self.n_reads, 1)
+
+
+class SimulationResultsCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.dirname, 'cache')
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def make_results(self, name, size):
+        results_dir = os.path.join(self.dirname, name)
+        os.mkdir(results_dir)
+        with open(os.path.join(results_dir, 'populations.h5'), 'wb') as file:
+            file.write(b'0' * size)
+        return results_dir
+
+    def test_get_key(self):
+        key = cache.SimulationResultsCache.get_key('abc', 10., 5., 1)
+        self.assertEqual(cache.SimulationResultsCache.get_key('abc', 10., 5., 1), key)
+        self.assertNotEqual(cache.SimulationResultsCache.get_key('abc', 10., 5., 2), key)
+        self.assertNotEqual(cache.SimulationResultsCache.get_key('abd', 10., 5., 1), key)
+        self.assertNotEqual(cache.SimulationResultsCache.get_key('abc', 10., 5., 1,
+                                                                  perturbation={'parameters': {'p': 1}}), key)
+
+    def test_get_set(self):
+        results_cache = cache.SimulationResultsCache(self.cache_dir)
+        self.assertEqual(results_cache.get('key_1'), None)
+
+        cached_results_dir = results_cache.set('key_1', self.make_results('results_1', 10))
+        self.assertEqual(results_cache.get('key_1'), cached_results_dir)
+        self.assertTrue(os.path.isfile(os.path.join(cached_results_dir, 'populations.h5')))
+
+        results_cache.clear()
+        self.assertEqual(results_cache.get('key_1'), None)
+
+    def test_evict(self):
+        results_cache = cache.SimulationResultsCache(self.cache_dir, max_size=25)
+        results_cache.set('key_1', self.make_results('results_1', 10))
+        os.utime(os.path.join(self.cache_dir, 'key_1'), (time.time() - 20, time.time() - 20))
+        results_cache.set('key_2', self.make_results('results_2', 10))
+        os.utime(os.path.join(self.cache_dir, 'key_2'), (time.time() - 10, time.time() - 10))
+
+        # using key_1 makes key_2 the least recently used results
+        results_cache.get('key_1')
+        results_cache.set('key_3', self.make_results('results_3', 10))
+
+        self.assertNotEqual(results_cache.get('key_1'), None)
+        self.assertEqual(results_cache.get('key_2'), None)
+        self.assertNotEqual(results_cache.get('key_3'), None)
+        self.assertEqual(cache.get_dir_size(self.cache_dir), 20)
+
+
+class GetModelHashTestCase(unittest.TestCase):
+    def test(self):
+        model = wc_lang.io.Reader().run('tests/fixtures/min_model.xlsx')[wc_lang.Model][0]
+        model_hash = cache.get_model_hash(model)
+        self.assertEqual(cache.get_model_hash(model.copy()), model_hash)
+
+        model.parameters.get_one(id='k_cat_trn_1').value = 1.
+        self.assertNotEqual(cache.get_model_hash(model), model_hash)
+
+    def test_serialize_value(self):
+        model = wc_lang.io.Reader().run('tests/fixtures/min_model.xlsx')[wc_lang.Model][0]
+        species = model.species.get_one(id='RNA_1[c]')
+
+        self.assertEqual(cache.serialize_value(None), 'None')
+        self.assertEqual(cache.serialize_value(1.5), '1.5')
+        self.assertEqual(cache.serialize_value(species), 'Species:RNA_1[c]')
+        self.assertEqual(cache.serialize_value({'b': 2, 'a': [1, 'x']}), "{'a': [1, 'x'], 'b': 2}")
+        self.assertEqual(cache.serialize_value(set([3, 1])), '{1, 3}')
+        self.assertEqual(cache.serialize_value(list(reversed(model.species))),
+                         cache.serialize_value(list(model.species)))
+
+        with self.assertRaisesRegex(ValueError, "can't be serialized stably"):
+            cache.serialize_value(object())
@@ -13,14 +13,26 @@ TODO:
 """
 
 from wc_onto import onto
+import asyncio
+import mock
+import numpy
 import os
+import shutil
+import tempfile
 import unittest
 import wc_kb
 import wc_kb.io
 import wc_lang
 import wc_lang.io
 import wc_sim
+import wc_test.cache
 import wc_test.core
+import wc_test.dependencies
+import wc_test.model_index
+import wc_test.parallel
+import wc_test.scan
+import wc_test.scheduling
+import wc_test.synthetic
 
 
 class KnowledgeBaseTestCaseTestCase(unittest.TestCase):
@@ -53,6 +65,73 @@ class ModelTestCaseTestCase(unittest.TestCase):
         self.assertTrue(self.test_case.model.is_equal(self.model))
         self.assertTrue(os.path.isdir(self.test_case.results_dir))
 
+    def test_setUp_from_path(self):
+        class TestCase(wc_test.core.ModelTestCase):
+            MODEL = self.MODEL_PATH
+
+        test_case_1 = TestCase()
+        test_case_1.setUp()
+        test_case_2 = TestCase()
+        test_case_2.setUp()
+
+        self.assertTrue(test_case_1.model.is_equal(self.model))
+        self.assertTrue(test_case_2.model.is_equal(self.model))
+        self.assertIsNot(test_case_1.model, test_case_2.model)
+        self.assertIs(wc_test.cache.parsed_file_cache.get('model', self.MODEL_PATH, None),
+                      wc_test.cache.parsed_file_cache.get('model', self.MODEL_PATH, None))
+
+        test_case_1.tearDown()
+        test_case_2.tearDown()
+
+    def test_share_model(self):
+        class TestCase(wc_test.core.ModelTestCase):
+            MODEL = self.model
+            SHARE_MODEL = True
+
+        test_case = TestCase()
+        test_case.setUp()
+        self.assertIs(test_case.model, self.model)
+
+        test_case.change_parameter_values({'mean_doubling_time': 5})
+        test_case.change_species_mean_init_concentrations({'RNA_1[c]': 444})
+        test_case.change_reaction_k_cat_parameter_values({'transcription_RNA_1': 6})
+        test_case.select_submodels({'degradation': False})
+        self.assertEqual(self.model.parameters.get_one(id='mean_doubling_time').value, 5)
+
+        test_case.tearDown()
+        self.assertEqual(self.model.parameters.get_one(id='mean_doubling_time').value, 28800)
+        self.assertEqual(self.model.parameters.get_one(id='k_cat_trn_1').value, 0.05)
+        self.assertEqual(self.model.parameters.get_one(id='k_cat_deg_1').value, 0.035)
+        self.assertEqual(self.model.species.get_one(id='RNA_1[c]').distribution_init_concentration.mean, 1000)
+
+        # changes made outside of the perturbation methods are detected
+        test_case = TestCase()
+        test_case.setUp()
+        self.model.parameters.get_one(id='mean_doubling_time').value = 5
+        with self.assertRaisesRegex(AssertionError, 'parameter mean_doubling_time value'):
+            test_case.tearDown()
+        self.model.parameters.get_one(id='mean_doubling_time').value = 28800
+
+        conc = self.model.species.get_one(id='RNA_1[c]').distribution_init_concentration
+        std = conc.std
+        test_case = TestCase()
+        test_case.setUp()
+        conc.std = std + 1.
+        with self.assertRaisesRegex(AssertionError, r'species RNA_1\[c\] std'):
+            test_case.tearDown()
+        conc.std = std
+
+        # the model is restored even if the results can't be removed
+        test_case = TestCase()
+        test_case.setUp()
+        results_dir = test_case.results_dir
+        test_case.change_parameter_values({'mean_doubling_time': 5})
+        with mock.patch.object(wc_test.core.shutil, 'rmtree', side_effect=OSError('busy')):
+            with self.assertRaisesRegex(OSError, 'busy'):
+                test_case.tearDown()
+        self.assertEqual(self.model.parameters.get_one(id='mean_doubling_time').value, 28800)
+        shutil.rmtree(results_dir)
+
     def test_select_submodels(self):
         test_case = self.test_case
         mod_submodels = {
@@ -67,6 +146,74 @@ class ModelTestCaseTestCase(unittest.TestCase):
                 self.assertEqual(reaction.rate_laws[0].
                                  expression.parameters.get_one(type=onto['WC:k_cat']).value, 0)
 
+    def test_assert_reactions_balanced(self):
+        class TestCase(wc_test.core.ModelTestCase):
+            MODEL = wc_test.synthetic.get_synthetic_model(n_species=5, seed=1)
+
+        test_case = TestCase()
+        test_case.setUp()
+        test_case.assert_reactions_balanced()
+
+        # changes to the model are checked without rebuilding its index
+        test_case.model.species_types.get_one(id='metabolite_0').structure.charge = 2
+        self.assertEqual([imbalance.reaction_id for imbalance in test_case.get_reaction_imbalances()],
+                         [reaction.id for reaction in test_case.model.reactions
+                          if 'metabolite_0[c]' in [part.species.id for part in reaction.participants]])
+        with self.assertRaisesRegex(AssertionError, 'not balanced:\n  Reaction reaction_0 is charge imbalanced: -2'):
+            test_case.assert_reactions_balanced()
+        test_case.tearDown()
+
+    def test_track_dependencies(self):
+        class TestCase(wc_test.core.ModelTestCase):
+            MODEL = self.model
+
+            def test_read(self):
+                self.get_species('RNA_1[c]')
+                self.change_parameter_values({'k_cat_trn_1': 0.1})
+
+            def test_structure(self):
+                self.get_orphan_species()
+
+            def test_fail(self):
+                self.get_reaction('transcription_RNA_1')
+                self.fail()
+
+            def test_read_directly(self):
+                self.model.species.get_one(id='RNA_1[c]')
+
+        dirname = tempfile.mkdtemp()
+        tracker = wc_test.dependencies.DependencyTracker(os.path.join(dirname, 'dependencies.json'))
+        with mock.patch.object(wc_test.dependencies, 'tracker', tracker):
+            result = unittest.TestResult()
+            for name in ['test_read', 'test_structure', 'test_fail', 'test_read_directly']:
+                TestCase(name).run(result)
+        shutil.rmtree(dirname)
+        self.assertEqual(result.testsRun, 4)
+        self.assertEqual(len(result.failures), 1)
+
+        hashes = wc_test.dependencies.get_component_hashes(self.model)
+        record = tracker.records[TestCase('test_read').id()]
+        self.assertTrue(record['passed'])
+        self.assertEqual(record['source_hash'], wc_test.dependencies.get_source_hash(TestCase))
+        self.assertEqual(record['components'], {
+            'parameters:k_cat_trn_1': hashes['parameters:k_cat_trn_1'],
+            'species:RNA_1[c]': hashes['species:RNA_1[c]'],
+        })
+        self.assertEqual(tracker.records[TestCase('test_structure').id()]['components'],
+                         {wc_test.dependencies.ALL_COMPONENTS: hashes[wc_test.dependencies.ALL_COMPONENTS]})
+        self.assertFalse(tracker.records[TestCase('test_fail').id()]['passed'])
+        self.assertEqual(tracker.records[TestCase('test_read_directly').id()]['components'],
+                         {wc_test.dependencies.ALL_COMPONENTS: hashes[wc_test.dependencies.ALL_COMPONENTS]})
+
+        history = wc_test.dependencies.DependencyHistory()
+        history.records = tracker.records
+        test_ids = [TestCase(name).id() for name in ['test_read', 'test_structure', 'test_fail', 'test_read_directly']]
+        self.assertEqual(history.get_affected(test_ids, [TestCase] * 4), [2])
+        self.model.parameters.get_one(id='k_cat_deg_1').value = 0.
+        self.assertEqual(history.get_affected(test_ids, [TestCase] * 4), [1, 2, 3])
+        self.model.parameters.get_one(id='k_cat_trn_1').value = 0.
+        self.assertEqual(history.get_affected(test_ids, [TestCase] * 4), [0, 1, 2, 3])
+
     def test_get_species(self):
         species = self.test_case.get_species('RNA_1[c]')
         self.assertIsInstance(species, wc_lang.core.Species)
@@ -85,6 +232,16 @@ class ModelTestCaseTestCase(unittest.TestCase):
         self.assertIsInstance(reaction, wc_lang.core.Reaction)
         self.assertEqual(reaction.id, 'degradation_RNA_1')
 
+    def test_get_parameter(self):
+        parameter = self.test_case.get_parameter('mean_doubling_time')
+        self.assertIsInstance(parameter, wc_lang.core.Parameter)
+        self.assertEqual(parameter.value, 28800)
+
+    def test_get_submodel(self):
+        submodel = self.test_case.get_submodel('transcription')
+        self.assertIsInstance(submodel, wc_lang.core.Submodel)
+        self.assertEqual(submodel.id, 'transcription')
+
     def test_change_parameter_values(self):
         test_case = self.test_case
         self.assertEqual(test_case.model.parameters.get_one(id='mean_doubling_time').value, 28800)
@@ -121,6 +278,33 @@ class ModelTestCaseTestCase(unittest.TestCase):
                          expression.parameters.get_one(type=onto['WC:k_cat']).value, 6)
 
 
+class ModelStructureTestCaseTestCase(unittest.TestCase):
+    def test_skip(self):
+        result = unittest.TestResult()
+        unittest.defaultTestLoader.loadTestsFromTestCase(wc_test.core.ModelStructureTestCase).run(result)
+        self.assertEqual(len(result.skipped), 6)
+
+    def test_structure(self):
+        class TestCase(wc_test.core.ModelStructureTestCase):
+            MODEL = wc_test.synthetic.get_synthetic_model(n_species=10, n_submodels=2, seed=1)
+
+        result = unittest.TestResult()
+        unittest.defaultTestLoader.loadTestsFromTestCase(TestCase).run(result)
+        self.assertEqual(result.testsRun, 6)
+        self.assertEqual(result.errors, [])
+        failed_tests = sorted(test._testMethodName for test, _ in result.failures)
+        self.assertTrue(set(failed_tests).issubset(['test_no_dead_end_species']))
+
+        TestCase.MODEL.parameters.get_one(id='k_cat_0').value = 0.
+        test_case = TestCase('test_submodels_active')
+        test_case.setUp()
+        self.assertEqual(test_case.get_blocked_reactions(), ['reaction_0'])
+        self.assertEqual(test_case.get_inactive_submodels(), [])
+        self.assertEqual(test_case.get_mass_imbalances(), {})
+        self.assertEqual(test_case.get_orphan_species(), [])
+        test_case.tearDown()
+
+
 class SimulationTestCaseTestCase(unittest.TestCase):
     MODEL_PATH = 'tests/fixtures/min_model.xlsx'
 
@@ -146,24 +330,273 @@ class SimulationTestCaseTestCase(unittest.TestCase):
         self.assertIsInstance(results[0], wc_sim.run_results.RunResults)
         self.assertIsInstance(results[1], wc_sim.run_results.RunResults)
 
-    @unittest.skip('Todo: implement')
+    def test_simulate_cache(self):
+        cache_dir = tempfile.mkdtemp()
+
+        class TestCase(wc_test.core.SimulationTestCase):
+            MODEL = self.model
+            SIMULATION_CACHE_DIR = cache_dir
+
+        run = wc_test.parallel.Simulator.run
+        try:
+            with mock.patch.object(wc_test.parallel.Simulator, 'run', autospec=True, side_effect=run) as mock_run:
+                test_case = TestCase()
+                test_case.setUp()
+                results = test_case.simulate(end_time=10., checkpoint_period=5., n_sims=2, seed=1)
+                populations = [result.get('populations') for result in results]
+                test_case.sim_scan_reactions({'transcription_RNA_1': [0.1]}, end_time=10., checkpoint_period=5., seed=1)
+                self.assertEqual(mock_run.call_count, 3)
+                test_case.tearDown()
+
+                # the results are reused by other test cases
+                test_case = TestCase()
+                test_case.setUp()
+                results = test_case.simulate(end_time=10., checkpoint_period=5., n_sims=2, seed=1)
+                test_case.sim_scan_reactions({'transcription_RNA_1': [0.1]}, end_time=10., checkpoint_period=5., seed=1)
+                self.assertEqual(mock_run.call_count, 3)
+                for result, result_populations in zip(results, populations):
+                    self.assertTrue(result.get('populations').equals(result_populations))
+
+                # other seeds are simulated
+                test_case.simulate(end_time=10., checkpoint_period=5., seed=3)
+                self.assertEqual(mock_run.call_count, 4)
+                test_case.tearDown()
+
+                # changed models are simulated
+                test_case = TestCase()
+                test_case.setUp()
+                test_case.change_reaction_k_cat_parameter_values({'degradation_RNA_1': 0.})
+                test_case.simulate(end_time=10., checkpoint_period=5., seed=1)
+                self.assertEqual(mock_run.call_count, 5)
+                test_case.tearDown()
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_simulate_shared_model(self):
+        class TestCase(wc_test.core.SimulationTestCase):
+            MODEL = self.model
+            SHARE_MODEL = True
+
+        model_hash = wc_test.cache.get_model_hash(self.model)
+        for i_test in range(2):
+            test_case = TestCase()
+            test_case.setUp()
+            self.assertIs(test_case.model, self.model)
+            test_case.simulate(end_time=10., checkpoint_period=5., seed=1)
+            test_case.change_reaction_k_cat_parameter_values({'transcription_RNA_1': 0.})
+            test_case.sim_scan_reactions({'degradation_RNA_1': [0., 0.1]}, end_time=10., checkpoint_period=5.)
+            test_case.tearDown()
+            self.assertEqual(wc_test.cache.get_model_hash(self.model), model_hash)
+
+    def test_simulate_memory_backend(self):
+        class TestCase(wc_test.core.SimulationTestCase):
+            MODEL = self.model
+            RESULTS_BACKEND = 'memory'
+
+        test_case = TestCase()
+        test_case.setUp()
+        results = test_case.simulate(end_time=10., checkpoint_period=5., n_sims=2, seed=1, n_workers=2)
+        self.assertEqual(os.listdir(test_case.results_dir), [])
+        test_case.tearDown()
+
+        self.assertEqual(len(results), 2)
+        self.assertIsInstance(results[0], wc_test.parallel.MemoryRunResults)
+        self.assertFalse(os.path.isdir(results[0].results_dir))
+
+        disk_results = self.test_case.simulate(end_time=10., checkpoint_period=5., n_sims=2, seed=1)
+        for result, disk_result in zip(results, disk_results):
+            self.assertTrue(result.get('populations').equals(disk_result.get('populations')))
+
+    def test_simulate_parallel(self):
+        results = self.test_case.simulate(end_time=10., checkpoint_period=5., n_sims=3, seed=1, n_workers=2)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(len(set(result.results_dir for result in results)), 3)
+
+        serial_results = self.test_case.simulate(end_time=10., checkpoint_period=5., n_sims=3, seed=1, n_workers=1)
+        for result, serial_result in zip(results, serial_results):
+            self.assertTrue(result.get('populations').equals(serial_result.get('populations')))
+
+    def test_simulate_async(self):
+        test_case = self.test_case
+        test_case.N_WORKERS = 2
+        perturbation = {'submodels': {'transcription': False}}
+
+        async def simulate():
+            return await asyncio.gather(
+                test_case.simulate_async(end_time=10., checkpoint_period=5., n_sims=2, seed=1),
+                test_case.simulate_async(end_time=10., checkpoint_period=5., seed=1, perturbation=perturbation),
+                test_case.sim_scan_async([{}, perturbation], end_time=10., checkpoint_period=5., seed=1))
+        results, perturbed_results, scan_results = asyncio.run(simulate())
+        self.assertEqual(len(results), 2)
+        self.assertIsInstance(results[0], wc_sim.run_results.RunResults)
+        self.assertEqual(len(test_case._simulation_pools), 1)
+
+        serial_results = test_case.simulate(end_time=10., checkpoint_period=5., n_sims=2, seed=1)
+        for result, serial_result in zip(results, serial_results):
+            self.assertTrue(result.get('populations').equals(serial_result.get('populations')))
+        self.assertTrue(scan_results[0].get('populations').equals(results[0].get('populations')))
+        self.assertTrue(scan_results[1].get('populations').equals(perturbed_results[0].get('populations')))
+
+        # the pool is replaced when the model is perturbed
+        test_case.change_parameter_values({'k_cat_trn_1': 0.})
+        asyncio.run(test_case.simulate_async(end_time=10., checkpoint_period=5., seed=1))
+        self.assertEqual(len(test_case._simulation_pools), 2)
+        test_case.undo_perturbations()
+
+        # functions run in threads
+        mean = asyncio.run(test_case.run_in_thread(numpy.mean, [1., 2.]))
+        self.assertEqual(mean, 1.5)
+
+        test_case.tearDown()
+        self.assertEqual(test_case._simulation_pools, [])
+
+    def test_record_durations(self):
+        dirname = tempfile.mkdtemp()
+        recorder = wc_test.scheduling.DurationRecorder(os.path.join(dirname, 'durations.json'))
+        with mock.patch.object(wc_test.scheduling, 'recorder', recorder):
+            class TestCase(wc_test.core.SimulationTestCase):
+                MODEL = self.model
+
+            test_case = TestCase()
+            test_case.setUp()
+            test_case.simulate(end_time=10., checkpoint_period=5., n_sims=2, seed=1)
+            test_case.tearDown()
+            test_case.doCleanups()
+        shutil.rmtree(dirname)
+
+        self.assertEqual(list(recorder.records.keys()), [test_case.id()])
+        record = recorder.records[test_case.id()]
+        self.assertGreater(record['duration'], 0.)
+        self.assertEqual(record['simulations'], [{
+            'model_hash': wc_test.cache.get_model_hash(self.model),
+            'end_time': 10.,
+            'checkpoint_period': 5.,
+            'n_sims': 2,
+        }])
+
+    def test_simulate_from_final_populations(self):
+        test_case = self.test_case
+        perturbations = [{}, {'submodels': {'transcription': False}}]
+        warm_up_results, perturbed_results = test_case.simulate_from_final_populations(
+            5., perturbations, end_time=10., checkpoint_period=5., seed=1, n_workers=2)
+        self.assertEqual(len(perturbed_results), 2)
+
+        # the perturbed simulations restart at time 0 from the final populations of the warm up
+        warm_up_populations = warm_up_results.get('populations')
+        for results in perturbed_results:
+            populations = results.get('populations')
+            self.assertEqual(populations.index.tolist(), [0., 5., 10.])
+            numpy.testing.assert_array_equal(populations.iloc[0].values,
+                                             warm_up_populations.iloc[-1][populations.columns].values)
+
+        # model is left unperturbed
+        self.assertEqual(test_case.get_species('RNA_1[c]').distribution_init_concentration.mean, 1000)
+        self.assertEqual(test_case.get_parameter('k_cat_trn_1').value, 0.05)
+
+    def test_estimate_statistic(self):
+        test_case = self.test_case
+
+        def statistic(run_results):
+            return run_results.get('populations')['RNA_1[c]'].values[-1]
+
+        estimate = test_case.estimate_statistic(statistic, end_time=10., checkpoint_period=5., half_width=numpy.inf,
+                                                min_sims=3, batch_size=2, max_sims=10, seed=1, n_workers=2)
+        self.assertTrue(estimate.converged)
+        self.assertEqual(estimate.n_sims, 3)
+
+        estimate = test_case.estimate_statistic(statistic, end_time=10., checkpoint_period=5., half_width=0.,
+                                                min_sims=2, batch_size=2, max_sims=4, seed=1)
+        self.assertEqual(estimate.n_sims, 4)
+        self.assertAlmostEqual(estimate.confidence, 1. - 0.05 / 2)
+
+        results = test_case.simulate(end_time=10., checkpoint_period=5., n_sims=4, seed=1)
+        numpy.testing.assert_array_equal(estimate.values, [statistic(result) for result in results])
+
+        with self.assertRaises(ValueError):
+            test_case.estimate_statistic(statistic, end_time=10.)
+        with self.assertRaisesRegex(ValueError, 'at most `max_sims`'):
+            test_case.estimate_statistic(statistic, end_time=10., half_width=1., min_sims=5, max_sims=4)
+        with self.assertRaisesRegex(ValueError, 'at least 2'):
+            test_case.estimate_statistic(statistic, end_time=10., half_width=1., min_sims=1)
+        with self.assertRaisesRegex(ValueError, 'at least 2'):
+            test_case.estimate_statistic(statistic, end_time=10., half_width=1., min_sims=0, max_sims=0)
+
+    def test_assert_statistic(self):
+        test_case = self.test_case
+
+        def statistic(run_results):
+            return 1.
+
+        estimate = test_case.assert_statistic(statistic, 1., 0.1, end_time=10., checkpoint_period=5.)
+        self.assertEqual(estimate.n_sims, 10)
+
+        with self.assertRaisesRegex(AssertionError, 'is not within'):
+            test_case.assert_statistic(statistic, 2., 0.1, end_time=10., checkpoint_period=5.)
+
     def test_delta_conc(self):
-        #test_case = self.test_case
-        #results = test_case.simulate(end_time=10., checkpoint_period=5.)
-        #delta = test_case.delta_conc(['RNA_1[c],RNA_2[c]'], results[0])
-        pass
+        test_case = self.test_case
+        results = test_case.simulate(end_time=10., checkpoint_period=5.)
+        delta = test_case.delta_conc(['RNA_1[c]', 'RNA_2[c]'], results[0])
+        populations = results[0].get('populations')
+        self.assertEqual(set(delta.keys()), set(['RNA_1[c]', 'RNA_2[c]']))
+        for species_id in ['RNA_1[c]', 'RNA_2[c]']:
+            self.assertEqual(delta[species_id], populations[species_id].values[-1] - populations[species_id].values[0])
 
-    @unittest.skip('Todo: implement')
     def test_avg_conc_time(self):
-        pass
+        avg_conc = self.test_case.avg_conc_time(['RNA_1[c]', 'RNA_2[c]'], end_time=10., checkpoint_period=5.)
+        self.assertEqual(set(avg_conc.keys()), set(['RNA_1[c]', 'RNA_2[c]']))
+        self.assertGreater(avg_conc['RNA_1[c]'], 0)
+
+    def test_reduce_runs(self):
+        test_case = self.test_case
+        stats = test_case.reduce_runs(3, end_time=10., checkpoint_period=5., species_ids=['RNA_1[c]', 'RNA_2[c]'],
+                                      reservoir_size=2, seed=1, n_workers=2)
+        self.assertEqual(stats.n, 3)
+        self.assertEqual(stats.species_ids, ['RNA_1[c]', 'RNA_2[c]'])
+        self.assertEqual(stats.times.tolist(), [0., 5., 10.])
+        self.assertEqual(stats.populations.mean.shape, (2, 3))
+        self.assertEqual(stats.populations.quantile(0.5).shape, (2, 3))
+
+        # results of each replicate are deleted once they have been reduced
+        self.assertEqual(os.listdir(test_case.results_dir), [])
+
+        results = test_case.simulate(end_time=10., checkpoint_period=5., n_sims=3, seed=1)
+        populations = numpy.array([result.get('populations')[['RNA_1[c]', 'RNA_2[c]']].values.T for result in results])
+        numpy.testing.assert_allclose(stats.populations.mean, populations.mean(axis=0))
+        numpy.testing.assert_allclose(stats.populations.var, populations.var(axis=0, ddof=1))
 
-    @unittest.skip('Todo: implement')
     def test_avg_conc_runs(self):
-        pass
+        avg_conc = self.test_case.avg_conc_runs(2, ['RNA_1[c]'], end_time=10., checkpoint_period=5.)
+        self.assertEqual(list(avg_conc.keys()), ['RNA_1[c]'])
+        self.assertEqual(avg_conc['RNA_1[c]'].shape, (3,))
 
-    @unittest.skip('Todo: implement')
     def test_get_growth_rate(self):
-        pass
+        growth_rate = self.test_case.get_growth_rate(end_time=10., checkpoint_period=5., n_sims=2, seed=1)
+        self.assertIsInstance(growth_rate, float)
+        self.assertTrue(numpy.isfinite(growth_rate))
+
+    def test_sim_scan_to_store(self):
+        test_case = self.test_case
+        points = wc_test.scan.get_scan_points(mod_reactions={'transcription_RNA_1': [0.05, 0.5]})
+        filename = os.path.join(test_case.results_dir, 'scan.h5')
+        with test_case.sim_scan_to_store(filename, points, end_time=10., checkpoint_period=5., n_sims=2,
+                                         seed=1, n_workers=2) as results_store:
+            self.assertEqual(results_store.get_populations().shape, (2, 2, len(results_store.species_ids), 3))
+            self.assertEqual(results_store.get_points(), points)
+            rna_1 = results_store.get_species('RNA_1[c]')
+        self.assertEqual(os.listdir(test_case.results_dir), ['scan.h5'])
+
+        results = test_case.sim_scan(points, end_time=10., checkpoint_period=5., seed=1)
+        for i_point, result in enumerate(results):
+            numpy.testing.assert_equal(rna_1[i_point, 0, :], result.get('populations')['RNA_1[c]'].values)
+
+    def test_simulate_to_store(self):
+        test_case = self.test_case
+        filename = os.path.join(test_case.results_dir, 'ensemble.h5')
+        with test_case.simulate_to_store(filename, end_time=10., checkpoint_period=5., n_sims=3) as results_store:
+            self.assertEqual(results_store.n_points, 1)
+            self.assertEqual(results_store.n_replicates, 3)
+            self.assertEqual(results_store.get_points(), [{}])
 
     def test_sim_scan_parameters(self):
         test_case = self.test_case
@@ -179,6 +612,23 @@ class SimulationTestCaseTestCase(unittest.TestCase):
         self.assertIsInstance(scan_results, list)
         self.assertIsInstance(scan_results[0], wc_sim.run_results.RunResults)
 
+    def test_sim_scan(self):
+        test_case = self.test_case
+        points = wc_test.scan.get_scan_points(mod_parameters={'mean_doubling_time': [5, 6]},
+                                              mod_reactions={'transcription_RNA_1': [0.55, 0.65]},
+                                              mode='grid')
+        scan_results = test_case.sim_scan(points, end_time=10., checkpoint_period=5., seed=1, n_workers=2)
+        self.assertEqual(len(scan_results), 4)
+        self.assertIsInstance(scan_results[0], wc_sim.run_results.RunResults)
+
+        # each point is simulated with its own copy of the model
+        self.assertEqual(test_case.model.parameters.get_one(id='mean_doubling_time').value, 28800)
+        self.assertEqual(test_case.model.parameters.get_one(id='k_cat_trn_1').value, 0.05)
+
+        serial_scan_results = test_case.sim_scan(points, end_time=10., checkpoint_period=5., seed=1, n_workers=1)
+        for result, serial_result in zip(scan_results, serial_scan_results):
+            self.assertTrue(result.get('populations').equals(serial_result.get('populations')))
+
     def test_sim_scan_species(self):
         test_case = self.test_case
         mod_species = {'RNA_1[c]': [5]}
@@ -206,3 +656,111 @@ class SimulationTestCaseTestCase(unittest.TestCase):
         scan_results = test_case.sim_scan_reactions(mod_reactions=mod_reactions, end_time=10., checkpoint_period=5.)
         self.assertIsInstance(scan_results, list)
         self.assertIsInstance(scan_results[0], wc_sim.run_results.RunResults)
+
+    def test_run_screen(self):
+        test_case = self.test_case
+        table = [
+            {'id': 'ko_trn_1', 'type': 'reaction', 'target': 'transcription_RNA_1'},
+            {'id': 'no_deg', 'type': 'submodel', 'target': 'degradation'},
+            {'id': 'ko_trn_1_deg_1', 'type': 'reaction', 'target': 'transcription_RNA_1;degradation_RNA_1'},
+            {'id': 'unknown', 'type': 'parameter', 'target': 'unknown_parameter'},
+        ]
+        filename = os.path.join(test_case.results_dir, 'screen.csv')
+        results = test_case.run_screen(table, filename, end_time=10., checkpoint_period=5.,
+                                       species_ids=['RNA_1[c]'], statistics=['initial', 'final'],
+                                       seed=1, n_workers=2, max_pending=1)
+        self.assertEqual(list(results.index), ['ko_trn_1', 'no_deg', 'ko_trn_1_deg_1', 'unknown'])
+        self.assertEqual(list(results.columns), ['seed', 'error', 'RNA_1[c] initial', 'RNA_1[c] final'])
+        self.assertEqual(set(results['seed']), set([1]))
+        self.assertEqual(os.listdir(test_case.results_dir), ['screen.csv'])
+
+        # without transcription or degradation, the population of RNA_1 doesn't change
+        self.assertEqual(results.loc['ko_trn_1_deg_1', 'error'], '')
+        self.assertEqual(results.loc['ko_trn_1_deg_1', 'RNA_1[c] final'], results.loc['ko_trn_1_deg_1', 'RNA_1[c] initial'])
+        self.assertNotEqual(results.loc['unknown', 'error'], '')
+
+        # the model isn't changed
+        self.assertEqual(test_case.model.parameters.get_one(id='k_cat_trn_1').value, 0.05)
+
+        # the summaries match serial simulations, and saved perturbations aren't simulated again
+        os.remove(filename)
+        test_case.run_screen(table[:2], filename, end_time=10., checkpoint_period=5.,
+                             species_ids=['RNA_1[c]'], statistics=['initial', 'final'], seed=1)
+        serial_results = test_case.run_screen(table, filename, end_time=10., checkpoint_period=5.,
+                                              species_ids=['RNA_1[c]'], statistics=['initial', 'final'],
+                                              seed=1)
+        self.assertTrue(serial_results.equals(results))
+        with open(filename, 'r') as file:
+            self.assertEqual(len(file.readlines()), 1 + len(table))
+
+        # failed perturbations are simulated again when the screen is resumed, unless disabled
+        test_case.run_screen(table, filename, end_time=10., checkpoint_period=5.,
+                             species_ids=['RNA_1[c]'], statistics=['initial', 'final'], seed=1,
+                             retry_failed=False)
+        with open(filename, 'r') as file:
+            self.assertEqual(len(file.readlines()), 1 + len(table))
+        retried_results = test_case.run_screen(table, filename, end_time=10., checkpoint_period=5.,
+                                               species_ids=['RNA_1[c]'], statistics=['initial', 'final'],
+                                               seed=1)
+        self.assertTrue(retried_results.equals(results))
+        with open(filename, 'r') as file:
+            self.assertEqual(len(file.readlines()), 2 + len(table))
+
+        # screens whose first perturbation fails
+        os.remove(filename)
+        error_first_table = table[-1:] + table[:-1]
+        error_first_results = test_case.run_screen(error_first_table, filename, end_time=10., checkpoint_period=5.,
+                                                   species_ids=['RNA_1[c]'], statistics=['initial', 'final'],
+                                                   seed=1)
+        self.assertTrue(error_first_results.equals(results.loc[[row['id'] for row in error_first_table]]))
+
+
+class SubmodelSimulationTestCaseTestCase(unittest.TestCase):
+    MODEL_PATH = 'tests/fixtures/min_model.xlsx'
+
+    def test_simulate(self):
+        class TestCase(wc_test.core.SubmodelSimulationTestCase):
+            MODEL = self.MODEL_PATH
+            SUBMODELS = ['transcription']
+            BOUNDARY = 'dynamic'
+
+        test_case = TestCase()
+        test_case.setUp()
+        self.assertEqual([submodel.id for submodel in test_case.model.submodels], ['transcription'])
+        self.assertIn('RNA_1[c]', test_case.boundary_species_ids)
+        results = test_case.simulate(end_time=100., checkpoint_period=10., seed=1)
+        populations = results[0].get('populations')['RNA_1[c]'].values
+        self.assertTrue((populations[1:] >= populations[:-1]).all())
+        reduced_model = test_case.model
+        extraction = TestCase._extraction
+        test_case.tearDown()
+
+        # the reduced model is extracted once per class and copied for each test
+        test_case = TestCase()
+        test_case.setUp()
+        self.assertIsNot(test_case.model, reduced_model)
+        self.assertIs(TestCase._extraction, extraction)
+        test_case.tearDown()
+
+    def test_all_submodels(self):
+        class TestCase(wc_test.core.SubmodelSimulationTestCase):
+            MODEL = self.MODEL_PATH
+
+        test_case = TestCase()
+        test_case.setUp()
+        self.assertEqual(len(test_case.model.submodels), 2)
+        self.assertEqual(test_case.boundary_species_ids, [])
+        test_case.tearDown()
+
+    def test_extract_submodels(self):
+        class TestCase(wc_test.core.ModelTestCase):
+            MODEL = self.MODEL_PATH
+            SHARE_MODEL = True
+
+        test_case = TestCase()
+        test_case.setUp()
+        shared_model = test_case.model
+        self.assertIn('RNA_1[c]', test_case.extract_submodels(['degradation']))
+        self.assertEqual([submodel.id for submodel in test_case.model.submodels], ['degradation'])
+        self.assertEqual(len(shared_model.submodels), 2)
+        test_case.tearDown()
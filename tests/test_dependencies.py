@@ -0,0 +1,189 @@
+""" Test of wc_test.dependencies
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import dependencies
+from wc_test import synthetic
+import os
+import shutil
+import tempfile
+import unittest
+import wc_test.core
+
+
+class ComponentHashesTestCase(unittest.TestCase):
+    def test_get_component_hashes(self):
+        model = synthetic.get_synthetic_model(n_species=5, n_parameters=2, seed=1)
+        hashes = dependencies.get_component_hashes(model)
+        for key in [dependencies.ALL_COMPONENTS, 'compartments:c', 'species:metabolite_0[c]', 'reactions:reaction_0',
+                    'parameters:parameter_0', 'parameters:k_cat_0', 'submodels:submodel_0']:
+            self.assertIn(key, hashes)
+        self.assertEqual(dependencies.get_component_hashes(model), hashes)
+
+        model.parameters.get_one(id='parameter_0').value = 2.
+        new_hashes = dependencies.get_component_hashes(model)
+        self.assertEqual(sorted(key for key in hashes if hashes[key] != new_hashes[key]),
+                         [dependencies.ALL_COMPONENTS, 'parameters:parameter_0'])
+
+        model.parameters.get_one(id='k_cat_0').value = 2.
+        hashes, new_hashes = new_hashes, dependencies.get_component_hashes(model)
+        self.assertEqual(sorted(key for key in hashes if hashes[key] != new_hashes[key]),
+                         [dependencies.ALL_COMPONENTS, 'parameters:k_cat_0', 'reactions:reaction_0'])
+
+        model.species.get_one(id='metabolite_1[c]').distribution_init_concentration.mean = 10.
+        hashes, new_hashes = new_hashes, dependencies.get_component_hashes(model)
+        self.assertEqual(sorted(key for key in hashes if hashes[key] != new_hashes[key]),
+                         [dependencies.ALL_COMPONENTS, 'species:metabolite_1[c]'])
+
+    def test_get_component_ids(self):
+        model = synthetic.get_synthetic_model(n_species=3, n_reactions=2, seed=1)
+        ids = dependencies.get_component_ids(model)
+        self.assertEqual(ids['species'], ['metabolite_0[c]', 'metabolite_1[c]', 'metabolite_2[c]'])
+        self.assertEqual(ids['reactions'], ['reaction_0', 'reaction_1'])
+        self.assertEqual(ids['submodels'], ['submodel_0'])
+
+    def test_get_source_hash(self):
+        self.assertEqual(len(dependencies.get_source_hash(ComponentHashesTestCase)), 64)
+        self.assertEqual(dependencies.get_source_hash(int), None)
+
+
+class OutcomeResultTestCase(unittest.TestCase):
+    def test_outcome(self):
+        class TestCase(unittest.TestCase):
+            def test_pass(self):
+                pass
+
+            def test_fail(self):
+                self.fail()
+
+            def test_error(self):
+                raise Exception()
+
+            def test_skip(self):
+                self.skipTest('skip')
+
+            def test_sub_test(self):
+                for i in range(2):
+                    with self.subTest(i=i):
+                        self.assertEqual(i, 0)
+
+        for name, passed in [('test_pass', True), ('test_fail', False), ('test_error', False),
+                             ('test_skip', False), ('test_sub_test', False)]:
+            result = unittest.TestResult()
+            outcome = dependencies.OutcomeResult(result)
+            TestCase(name).run(outcome)
+            self.assertEqual(outcome.passed, passed, name)
+            self.assertEqual(result.testsRun, 1)
+
+
+class DependencyTrackerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dirname, 'dependencies.json')
+        self.model = synthetic.get_synthetic_model(n_species=5, n_parameters=2, seed=1)
+
+        class TestCase(wc_test.core.ModelTestCase):
+            MODEL = self.model
+
+            def test(self):
+                pass
+        self.TestCase = TestCase
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_tracker(self):
+        tracker = dependencies.DependencyTracker()
+        self.assertFalse(tracker.enabled)
+
+        tracker = dependencies.DependencyTracker(self.filename)
+        self.assertTrue(tracker.enabled)
+        tracker.add('species', ['metabolite_0[c]'])
+        tracker.stop(self.model, 'source', True)
+        self.assertEqual(tracker.records, {})
+
+        hashes = dependencies.get_component_hashes(self.model)
+        tracker.start('test_a')
+        tracker.add('species', ['metabolite_0[c]'])
+        tracker.add_perturbation({'parameters': {'parameter_0': 1.}, 'init_populations': {'metabolite_1[c]': 1}})
+        tracker.stop(self.model, 'source', True)
+        self.assertEqual(tracker.records['test_a'], {
+            'passed': True,
+            'source_hash': 'source',
+            'components': {
+                'parameters:parameter_0': hashes['parameters:parameter_0'],
+                'species:metabolite_0[c]': hashes['species:metabolite_0[c]'],
+                'species:metabolite_1[c]': hashes['species:metabolite_1[c]'],
+            },
+        })
+
+        tracker.start('test_b')
+        tracker.add('species', ['metabolite_0[c]'])
+        tracker.add_model()
+        tracker.stop(self.model, 'source', False)
+        self.assertEqual(tracker.records['test_b']['components'],
+                         {dependencies.ALL_COMPONENTS: hashes[dependencies.ALL_COMPONENTS]})
+
+        # tests which don't record any components depend on all of the components
+        tracker.start('test_c')
+        tracker.stop(self.model, 'source', True)
+        self.assertEqual(tracker.records['test_c']['components'],
+                         {dependencies.ALL_COMPONENTS: hashes[dependencies.ALL_COMPONENTS]})
+
+        tracker.save()
+        history = dependencies.DependencyHistory(self.filename)
+        self.assertEqual(sorted(history.records.keys()), ['test_a', 'test_b', 'test_c'])
+
+    def test_get_affected(self):
+        test_id = self.TestCase('test').id()
+        source_hash = dependencies.get_source_hash(self.TestCase)
+        hashes = dependencies.get_component_hashes(self.model)
+        history = dependencies.DependencyHistory()
+        history.records = {
+            test_id: {
+                'passed': True,
+                'source_hash': source_hash,
+                'components': {'parameters:parameter_0': hashes['parameters:parameter_0']},
+            },
+        }
+
+        # unchanged
+        self.assertEqual(history.get_affected([test_id], [self.TestCase]), [])
+
+        # tests which aren't recorded, or aren't model tests
+        self.assertEqual(history.get_affected(['other_test'], [self.TestCase]), [0])
+        self.assertEqual(history.get_affected([test_id], [unittest.TestCase]), [0])
+
+        # failed test
+        history.records[test_id]['passed'] = False
+        self.assertEqual(history.get_affected([test_id], [self.TestCase]), [0])
+        history.records[test_id]['passed'] = True
+
+        # changed module
+        history.records[test_id]['source_hash'] = 'other'
+        self.assertEqual(history.get_affected([test_id], [self.TestCase]), [0])
+        history.records[test_id]['source_hash'] = source_hash
+
+        # changed component which the test doesn't depend on
+        self.model.parameters.get_one(id='parameter_1').value = 2.
+        self.assertEqual(history.get_affected([test_id], [self.TestCase]), [])
+
+        # changed component which the test depends on
+        self.model.parameters.get_one(id='parameter_0').value = 2.
+        self.assertEqual(history.get_affected([test_id], [self.TestCase]), [0])
+
+    def test_get_affected_tests(self):
+        suite = unittest.TestSuite([self.TestCase('test')])
+        history = dependencies.DependencyHistory()
+        self.assertEqual(dependencies.get_affected_tests(suite, history=history).countTestCases(), 1)
+
+        history.records[self.TestCase('test').id()] = {
+            'passed': True,
+            'source_hash': dependencies.get_source_hash(self.TestCase),
+            'components': {},
+        }
+        self.assertEqual(dependencies.get_affected_tests(suite, history=history).countTestCases(), 0)
@@ -0,0 +1,70 @@
+""" Test of wc_test.ensemble
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import ensemble
+from wc_test import trajectory
+import numpy
+import unittest
+
+
+class RunningStatisticsTestCase(unittest.TestCase):
+    def test_add(self):
+        values = numpy.random.RandomState(1).rand(20, 2, 3)
+
+        stats = ensemble.RunningStatistics()
+        for value in values:
+            stats.add(value)
+
+        self.assertEqual(stats.n, 20)
+        numpy.testing.assert_allclose(stats.mean, values.mean(axis=0))
+        numpy.testing.assert_allclose(stats.var, values.var(axis=0, ddof=1))
+        numpy.testing.assert_allclose(stats.std, values.std(axis=0, ddof=1))
+        numpy.testing.assert_allclose(stats.sem, values.std(axis=0, ddof=1) / numpy.sqrt(20))
+        numpy.testing.assert_array_equal(stats.min, values.min(axis=0))
+        numpy.testing.assert_array_equal(stats.max, values.max(axis=0))
+
+        with self.assertRaises(ValueError):
+            stats.quantile(0.5)
+
+    def test_var_one_value(self):
+        stats = ensemble.RunningStatistics()
+        stats.add([1., 2.])
+        self.assertTrue(numpy.all(numpy.isnan(stats.var)))
+
+    def test_quantile(self):
+        values = numpy.arange(5.).reshape((5, 1))
+
+        stats = ensemble.RunningStatistics(reservoir_size=10)
+        for value in values:
+            stats.add(value)
+        numpy.testing.assert_array_equal(stats.quantile(0.5), [2.])
+        numpy.testing.assert_array_equal(stats.quantile([0., 1.]), [[0.], [4.]])
+
+        stats = ensemble.RunningStatistics(reservoir_size=100, seed=1)
+        for value in numpy.random.RandomState(1).rand(10000, 1):
+            stats.add(value)
+        self.assertEqual(stats._reservoir.shape, (100, 1))
+        self.assertAlmostEqual(stats.quantile(0.5)[0], 0.5, delta=0.15)
+
+
+class EnsembleStatisticsTestCase(unittest.TestCase):
+    def test_add(self):
+        stats = ensemble.EnsembleStatistics(species_ids=['B[c]'])
+        stats.add(trajectory.Trajectory([0., 1.], ['A[c]', 'B[c]'], [[1., 2.], [3., 4.]]))
+        stats.add(trajectory.Trajectory([0., 1.], ['A[c]', 'B[c]'], [[1., 2.], [5., 6.]]))
+        self.assertEqual(stats.n, 2)
+        numpy.testing.assert_array_equal(stats.populations.mean, [[4., 5.]])
+        self.assertEqual(list(stats.to_dict(stats.populations.mean).keys()), ['B[c]'])
+
+        with self.assertRaises(ValueError):
+            stats.add(trajectory.Trajectory([0., 2.], ['A[c]', 'B[c]'], [[1., 2.], [5., 6.]]))
+
+    def test_all_species(self):
+        stats = ensemble.EnsembleStatistics()
+        stats.add(trajectory.Trajectory([0., 1.], ['A[c]', 'B[c]'], [[1., 2.], [3., 4.]]))
+        self.assertEqual(stats.species_ids, ['A[c]', 'B[c]'])
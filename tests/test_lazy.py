@@ -0,0 +1,46 @@
+""" Test of wc_test.lazy
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import lazy
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+
+class LazyModuleTestCase(unittest.TestCase):
+    def test_import_module(self):
+        module = lazy.import_module('json')
+        self.assertIsInstance(module, lazy.LazyModule)
+        self.assertEqual(module.__name__, 'json')
+        self.assertIs(module.dumps, json.dumps)
+        self.assertIn('dumps', dir(module))
+
+    def test_import_on_first_use(self):
+        name = 'wc_test_lazy_fixture'
+        module = lazy.import_module(name)
+        self.assertNotIn(name, sys.modules)
+        with self.assertRaises(ModuleNotFoundError):
+            module.value
+
+    def test_submodule(self):
+        module = lazy.import_module('json')
+        self.assertIs(module.decoder.JSONDecoder, json.JSONDecoder)
+
+    def test_missing_attribute(self):
+        module = lazy.import_module('json')
+        with self.assertRaisesRegex(AttributeError, 'has no attribute'):
+            module.undefined_attribute
+
+    def test_import_wc_test_doesnt_import_heavy_modules(self):
+        script = 'import json, sys, wc_test; print(json.dumps([name for name in {} if name in sys.modules]))'.format(
+            repr(list(lazy.HEAVY_MODULES)))
+        cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        imported = json.loads(subprocess.check_output([sys.executable, '-c', script], cwd=cwd))
+        self.assertEqual(imported, [])
@@ -0,0 +1,86 @@
+""" Test of wc_test.model_index
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import model_index
+import mock
+import numpy
+import unittest
+import wc_lang
+import wc_lang.io
+
+
+class ModelIndexTestCase(unittest.TestCase):
+    MODEL_PATH = 'tests/fixtures/min_model.xlsx'
+
+    def setUp(self):
+        self.model = wc_lang.io.Reader().run(self.MODEL_PATH)[wc_lang.Model][0]
+
+    def test_get(self):
+        index = model_index.ModelIndex(self.model)
+        self.assertIs(index.get_species('RNA_1[c]'), self.model.species.get_one(id='RNA_1[c]'))
+        self.assertIs(index.get_reaction('transcription_RNA_1'), self.model.reactions.get_one(id='transcription_RNA_1'))
+        self.assertIs(index.get_parameter('mean_doubling_time'), self.model.parameters.get_one(id='mean_doubling_time'))
+        self.assertIs(index.get_submodel('transcription'), self.model.submodels.get_one(id='transcription'))
+        self.assertIs(index.get_reaction_k_cat('transcription_RNA_1'), self.model.parameters.get_one(id='k_cat_trn_1'))
+        self.assertEqual(set(k_cat.id for k_cat in index.get_submodel_k_cats('degradation')),
+                         set(['k_cat_deg_1', 'k_cat_deg_2', 'k_cat_deg_3', 'k_cat_deg_4', 'k_cat_deg_5']))
+        self.assertEqual(index.get_species('undefined[c]'), None)
+
+    def test_get_k_cats_changed(self):
+        index = model_index.ModelIndex(self.model)
+        k_cat_trn = self.model.parameters.get_one(id='k_cat_trn_1')
+        k_cat_deg = self.model.parameters.get_one(id='k_cat_deg_1')
+        self.assertIs(index.get_reaction_k_cat('transcription_RNA_1'), k_cat_trn)
+
+        # changes to rate laws are seen without rebuilding the index
+        expression = self.model.reactions.get_one(id='transcription_RNA_1').rate_laws[0].expression
+        expression.parameters.remove(k_cat_trn)
+        expression.parameters.add(k_cat_deg)
+        self.assertTrue(index.is_current())
+        self.assertIs(index.get_reaction_k_cat('transcription_RNA_1'), k_cat_deg)
+        self.assertIn(k_cat_deg, index.get_submodel_k_cats('transcription'))
+        self.assertNotIn(k_cat_trn, index.get_submodel_k_cats('transcription'))
+
+    def test_get_molecular_weights(self):
+        index = model_index.ModelIndex(self.model)
+        weights = index.get_molecular_weights(['H[c]', 'RNA_1[c]'])
+        numpy.testing.assert_allclose(weights, [1.008, 15992.297])
+
+        # changes to the structures of species are seen without rebuilding the index
+        self.model.species.get_one(id='H[c]').species_type.structure.molecular_weight = 2.016
+        numpy.testing.assert_allclose(index.get_molecular_weights(['H[c]', 'RNA_1[c]']), [2.016, 15992.297])
+
+    def test_get_index(self):
+        index = model_index.get_index(self.model)
+        self.assertIs(index.model, self.model)
+        self.assertIs(model_index.get_index(self.model), index)
+        self.assertIsNot(model_index.get_index(self.model.copy()), index)
+
+        # index is updated when components are added or renamed
+        self.assertTrue(index.is_current())
+        parameter = self.model.parameters.create(id='new_parameter', value=1.)
+        self.assertFalse(index.is_current())
+        self.assertIs(model_index.get_index(self.model).get_parameter('new_parameter'), parameter)
+        self.assertTrue(index.is_current())
+
+        parameter.id = 'renamed_parameter'
+        self.assertEqual(index.get_parameter('new_parameter'), None)
+        self.assertIs(index.get_parameter('renamed_parameter'), parameter)
+
+    def test_get_missing(self):
+        index = model_index.get_index(self.model)
+        with mock.patch.object(index, 'update', wraps=index.update) as update:
+            for i_lookup in range(3):
+                self.assertEqual(index.get_species('undefined[c]'), None)
+                self.assertEqual(index.get_reaction_k_cat('undefined_reaction'), None)
+            self.assertEqual(update.call_count, 0)
+
+            # missing components are looked up again after components are added
+            parameter = self.model.parameters.create(id='new_parameter', value=1.)
+            self.assertIs(index.get_parameter('new_parameter'), parameter)
+            self.assertEqual(update.call_count, 1)
@@ -0,0 +1,77 @@
+""" Test of wc_test.network
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import network
+from wc_test import stoichiometry
+from wc_test import synthetic
+import numpy
+import unittest
+
+
+class NetworkTestCase(unittest.TestCase):
+    def setUp(self):
+        # reaction_0: metabolite_0 ==> metabolite_1
+        # reaction_1: metabolite_1 ==> metabolite_2
+        # reaction_2: metabolite_2 ==> metabolite_0
+        # reaction_3: metabolite_0 ==> metabolite_3
+        # metabolite_4 doesn't participate in any reaction
+        self.model = model = synthetic.get_synthetic_model(n_species=5, n_reactions=4, n_submodels=2)
+        for reaction, (i_reactant, i_product) in zip(model.reactions, [(0, 1), (1, 2), (2, 0), (0, 3)]):
+            for participant in list(reaction.participants):
+                reaction.participants.remove(participant)
+            reaction.participants.add(model.species[i_reactant].species_coefficients.get_or_create(coefficient=-1.))
+            reaction.participants.add(model.species[i_product].species_coefficients.get_or_create(coefficient=1.))
+
+    def test_get_orphan_species(self):
+        self.assertEqual(network.get_orphan_species(stoichiometry.get_stoichiometry(self.model)), ['metabolite_4[c]'])
+
+    def test_get_dead_end_species(self):
+        stoich = stoichiometry.get_stoichiometry(self.model)
+        self.assertEqual(network.get_dead_end_species(stoich), ['metabolite_3[c]'])
+
+        self.model.reactions.get_one(id='reaction_3').reversible = True
+        stoich = stoichiometry.get_stoichiometry(self.model)
+        self.assertEqual(network.get_dead_end_species(stoich), [])
+
+    def test_get_blocked_reactions(self):
+        stoich = stoichiometry.get_stoichiometry(self.model)
+        populations = network.get_init_populations(self.model)
+        numpy.testing.assert_equal(populations, [1000.] * 5)
+        self.assertEqual(network.get_blocked_reactions(stoich, network.get_rate_law_activities(self.model), populations), [])
+
+        populations = numpy.zeros((5,))
+        self.assertEqual(network.get_blocked_reactions(stoich, network.get_rate_law_activities(self.model), populations),
+                         ['reaction_0', 'reaction_1', 'reaction_2', 'reaction_3'])
+
+        # metabolite_2 ==> metabolite_0 ==> metabolite_1, metabolite_3
+        populations[2] = 1.
+        self.model.parameters.get_one(id='k_cat_1').value = 0.
+        self.assertEqual(network.get_blocked_reactions(stoich, network.get_rate_law_activities(self.model), populations),
+                         ['reaction_1'])
+
+    def test_get_rate_law_activities(self):
+        self.model.parameters.get_one(id='k_cat_1').value = 0.
+        activities = network.get_rate_law_activities(self.model)
+        self.assertEqual(activities.forward.tolist(), [True, False, True, True])
+        self.assertEqual(activities.backward.tolist(), [False] * 4)
+        self.assertEqual(activities.active.tolist(), [True, False, True, True])
+
+    def test_get_quantity_imbalances(self):
+        stoich = stoichiometry.get_stoichiometry(self.model)
+        self.assertEqual(network.get_quantity_imbalances(stoich, numpy.full((5,), 180.)), {})
+
+        weights = numpy.array([180., 180., numpy.nan, 200., 180.])
+        self.assertEqual(network.get_quantity_imbalances(stoich, weights), {'reaction_3': 20.})
+
+    def test_get_inactive_submodels(self):
+        self.assertEqual(network.get_inactive_submodels(self.model, network.get_rate_law_activities(self.model)), [])
+
+        self.model.parameters.get_one(id='k_cat_1').value = 0.
+        self.model.parameters.get_one(id='k_cat_3').value = 0.
+        self.assertEqual(network.get_inactive_submodels(self.model, network.get_rate_law_activities(self.model)),
+                         ['submodel_1'])
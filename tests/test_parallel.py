@@ -0,0 +1,156 @@
+""" Test of wc_test.parallel
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import parallel
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+import wc_lang
+import wc_lang.io
+import wc_sim.run_results
+
+
+class ParallelTestCase(unittest.TestCase):
+    def test_get_seeds(self):
+        self.assertEqual(parallel.get_seeds(3, seed=10), [10, 11, 12])
+
+        seeds = parallel.get_seeds(4)
+        self.assertEqual(len(seeds), 4)
+        self.assertEqual(seeds, list(range(seeds[0], seeds[0] + 4)))
+
+    def test_get_results_root(self):
+        self.assertEqual(parallel.get_results_root('disk'), None)
+        self.assertIn(parallel.get_results_root('tmpfs'), [parallel.TMPFS_DIR, None])
+        with self.assertRaisesRegex(ValueError, 'must be one of'):
+            parallel.get_results_root('unknown')
+
+    def test_MemoryRunResults(self):
+        results = parallel.MemoryRunResults('results', {'populations': 1})
+        self.assertEqual(results.get('populations'), 1)
+        with self.assertRaisesRegex(KeyError, 'not loaded'):
+            results.get('observables')
+        self.assertIs(parallel.load_run_results(results), results)
+
+
+class SimulatorTestCase(unittest.TestCase):
+    MODEL_PATH = 'tests/fixtures/min_model.xlsx'
+
+    def setUp(self):
+        self.model = wc_lang.io.Reader().run(self.MODEL_PATH)[wc_lang.Model][0]
+        self.results_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.results_dir)
+
+    def test_run(self):
+        simulator = parallel.Simulator(self.model)
+        perturbation = {'reactions': {'transcription_RNA_1': 0.5}}
+
+        results_dir = simulator.run(10., 5., 1, tempfile.mkdtemp(dir=self.results_dir), perturbation=perturbation)
+        populations = wc_sim.run_results.RunResults(results_dir).get('populations')
+
+        # perturbation is reverted after the run
+        self.assertEqual(self.model.parameters.get_one(id='k_cat_trn_1').value, 0.05)
+
+        # results are the same as those of a simulation of a perturbed copy of the model
+        model = self.model.copy()
+        model.parameters.get_one(id='k_cat_trn_1').value = 0.5
+        results_dir = parallel.Simulator(model).run(10., 5., 1, tempfile.mkdtemp(dir=self.results_dir))
+        self.assertTrue(populations.equals(wc_sim.run_results.RunResults(results_dir).get('populations')))
+
+        # simulator can be reused
+        results_dir = simulator.run(10., 5., 1, tempfile.mkdtemp(dir=self.results_dir), perturbation=perturbation)
+        self.assertTrue(populations.equals(wc_sim.run_results.RunResults(results_dir).get('populations')))
+
+    def test_run_in_memory(self):
+        simulator = parallel.Simulator(self.model)
+        results_dir = tempfile.mkdtemp(dir=self.results_dir)
+        populations = wc_sim.run_results.RunResults(simulator.run(10., 5., 1, results_dir)).get('populations')
+
+        results = simulator.run(10., 5., 1, tempfile.mkdtemp(dir=self.results_dir), in_memory=['populations'])
+        self.assertIsInstance(results, parallel.MemoryRunResults)
+        self.assertFalse(os.path.isdir(results.results_dir))
+        self.assertTrue(populations.equals(results.get('populations')))
+
+
+class SimulationPoolTestCase(unittest.TestCase):
+    MODEL_PATH = 'tests/fixtures/min_model.xlsx'
+
+    def setUp(self):
+        self.model = wc_lang.io.Reader().run(self.MODEL_PATH)[wc_lang.Model][0]
+        self.results_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.results_dir)
+
+    def test_submit(self):
+        perturbation = {'reactions': {'transcription_RNA_1': 0.5}}
+        with parallel.SimulationPool(self.model, n_workers=2) as pool:
+            futures = [
+                pool.submit(10., 5., 1, tempfile.mkdtemp(dir=self.results_dir)),
+                pool.submit(10., 5., 1, tempfile.mkdtemp(dir=self.results_dir), perturbation=perturbation),
+            ]
+            results_dirs = [future.result() for future in futures]
+
+        simulator = parallel.Simulator(self.model)
+        for results_dir, perturbation in zip(results_dirs, [None, perturbation]):
+            serial_results_dir = simulator.run(10., 5., 1, tempfile.mkdtemp(dir=self.results_dir),
+                                                perturbation=perturbation)
+            self.assertTrue(wc_sim.run_results.RunResults(results_dir).get('populations').equals(
+                wc_sim.run_results.RunResults(serial_results_dir).get('populations')))
+
+    def test_submit_shared_model(self):
+        with parallel.SharedModel(self.model, dirname=self.results_dir) as shared_model:
+            with parallel.SimulationPool(self.model, n_workers=2, shared_model=shared_model) as pool:
+                results_dir = pool.submit(10., 5., 1, tempfile.mkdtemp(dir=self.results_dir)).result()
+        self.assertFalse(os.path.isfile(shared_model.filename))
+
+        serial_results_dir = parallel.Simulator(self.model).run(10., 5., 1, tempfile.mkdtemp(dir=self.results_dir))
+        self.assertTrue(wc_sim.run_results.RunResults(results_dir).get('populations').equals(
+            wc_sim.run_results.RunResults(serial_results_dir).get('populations')))
+
+
+class SharedModelTestCase(unittest.TestCase):
+    MODEL_PATH = 'tests/fixtures/min_model.xlsx'
+
+    def setUp(self):
+        self.model = wc_lang.io.Reader().run(self.MODEL_PATH)[wc_lang.Model][0]
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_load(self):
+        with parallel.SharedModel(self.model, dirname=self.dirname) as shared_model:
+            self.assertEqual(os.path.dirname(shared_model.filename), self.dirname)
+            model = shared_model.load()
+            self.assertTrue(model.is_equal(self.model))
+        self.assertFalse(os.path.isfile(shared_model.filename))
+
+    def test_pickle(self):
+        with parallel.SharedModel(self.model, dirname=self.dirname) as shared_model:
+            self.assertLess(len(pickle.dumps(shared_model)), 1000)
+            self.assertLess(len(pickle.dumps(shared_model)), len(pickle.dumps(self.model)))
+
+            copy = pickle.loads(pickle.dumps(shared_model))
+            self.assertEqual(copy.filename, shared_model.filename)
+            self.assertTrue(copy.load().is_equal(self.model))
+
+    def test_run_simulations(self):
+        seeds = [1, 2]
+        with parallel.SharedModel(self.model, dirname=self.dirname) as shared_model:
+            results_dirs = parallel.run_simulations(self.model, 10., 5., seeds,
+                                                    [tempfile.mkdtemp(dir=self.dirname) for seed in seeds],
+                                                    n_workers=2, shared_model=shared_model)
+        serial_results_dirs = parallel.run_simulations(self.model, 10., 5., seeds,
+                                                       [tempfile.mkdtemp(dir=self.dirname) for seed in seeds])
+        for results_dir, serial_results_dir in zip(results_dirs, serial_results_dirs):
+            self.assertTrue(wc_sim.run_results.RunResults(results_dir).get('populations').equals(
+                wc_sim.run_results.RunResults(serial_results_dir).get('populations')))
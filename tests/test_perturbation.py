@@ -0,0 +1,155 @@
+""" Test of wc_test.perturbation
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_onto import onto
+from wc_test import perturbation
+import unittest
+import wc_lang
+import wc_lang.io
+
+
+class Obj(object):
+    def __init__(self, value):
+        self.value = value
+
+
+class UndoLogTestCase(unittest.TestCase):
+    def test_undo(self):
+        obj_1 = Obj(1)
+        obj_2 = Obj(2)
+
+        undo_log = perturbation.UndoLog()
+        undo_log.set_value(obj_1, 'value', 10)
+        undo_log.set_value(obj_2, 'value', 20)
+        undo_log.set_value(obj_1, 'value', 100)
+        self.assertEqual(len(undo_log), 3)
+        self.assertEqual(obj_1.value, 100)
+        self.assertEqual(obj_2.value, 20)
+
+        undo_log.undo()
+        self.assertEqual(len(undo_log), 0)
+        self.assertEqual(obj_1.value, 1)
+        self.assertEqual(obj_2.value, 2)
+
+    def test_add(self):
+        obj = Obj(1)
+        undo_log = perturbation.UndoLog()
+        undo_log.set_value(obj, 'value', 2)
+        undo_log.add(lambda: setattr(obj, 'value', obj.value * 10))
+        undo_log.undo()
+        self.assertEqual(obj.value, 10)
+
+    def test_set_value(self):
+        obj = Obj(1)
+        perturbation.set_value(obj, 'value', 2)
+        self.assertEqual(obj.value, 2)
+
+        undo_log = perturbation.UndoLog()
+        perturbation.set_value(obj, 'value', 3, undo_log=undo_log)
+        self.assertEqual(obj.value, 3)
+        undo_log.undo()
+        self.assertEqual(obj.value, 2)
+
+
+class ChangedValuesTestCase(unittest.TestCase):
+    def test_get_changed_values(self):
+        nan = float('nan')
+        values = {('parameter', 'p_1', 'value'): 1., ('species', 's_1[c]', 'std'): nan}
+        self.assertEqual(perturbation.get_changed_values(values, dict(values)), [])
+        self.assertEqual(perturbation.get_changed_values(values, {
+            ('parameter', 'p_1', 'value'): 2.,
+            ('species', 's_1[c]', 'std'): nan,
+            ('species', 's_2[c]', 'mean'): 3.,
+        }), [('parameter', 'p_1', 'value'), ('species', 's_2[c]', 'mean')])
+
+
+class PerturbationTestCase(unittest.TestCase):
+    MODEL_PATH = 'tests/fixtures/min_model.xlsx'
+
+    def setUp(self):
+        self.model = wc_lang.io.Reader().run(self.MODEL_PATH)[wc_lang.Model][0]
+
+    def test_apply_perturbation(self):
+        values = perturbation.get_perturbable_values(self.model)
+        self.assertEqual(values[('parameter', 'mean_doubling_time', 'value')], 28800)
+        self.assertEqual(values[('species', 'RNA_1[c]', 'mean')], 1000)
+
+        undo_log = perturbation.UndoLog()
+        perturbation.apply_perturbation(self.model, {
+            'submodels': {'degradation': False},
+            'parameters': {'mean_doubling_time': 5},
+            'species': {'RNA_1[c]': 444},
+            'reactions': {'transcription_RNA_1': 6},
+        }, undo_log=undo_log)
+        self.assertEqual(self.model.parameters.get_one(id='mean_doubling_time').value, 5)
+        self.assertEqual(self.model.parameters.get_one(id='k_cat_trn_1').value, 6)
+        self.assertEqual(self.model.parameters.get_one(id='k_cat_deg_1').value, 0)
+        self.assertEqual(self.model.species.get_one(id='RNA_1[c]').distribution_init_concentration.mean, 444)
+
+        undo_log.undo()
+        self.assertEqual(perturbation.get_perturbable_values(self.model), values)
+
+    def test_knock_out_reversible_reaction(self):
+        reaction = self.model.reactions.get_one(id='transcription_RNA_1')
+        reaction.reversible = True
+        forward_k_cat = self.model.parameters.get_one(id='k_cat_trn_1')
+        backward_k_cat = self.model.parameters.create(id='k_cat_trn_1_backward', type=onto['WC:k_cat'], value=0.01)
+        rate_law = self.model.rate_laws.create(id='transcription_RNA_1-backward', reaction=reaction,
+                                               direction=wc_lang.RateLawDirection.backward)
+        rate_law.expression, error = wc_lang.RateLawExpression.deserialize(backward_k_cat.id, {
+            wc_lang.Parameter: {backward_k_cat.id: backward_k_cat},
+        })
+        self.assertEqual(error, None)
+
+        # new k_cats are applied to the first rate law
+        undo_log = perturbation.UndoLog()
+        perturbation.change_reaction_k_cat_parameter_values(self.model, {'transcription_RNA_1': 0.5}, undo_log=undo_log)
+        self.assertEqual(forward_k_cat.value, 0.5)
+        self.assertEqual(backward_k_cat.value, 0.01)
+        undo_log.undo()
+
+        # knockouts are applied to all of the rate laws
+        perturbation.change_reaction_k_cat_parameter_values(self.model, {'transcription_RNA_1': 0.}, undo_log=undo_log)
+        self.assertEqual(forward_k_cat.value, 0.)
+        self.assertEqual(backward_k_cat.value, 0.)
+        undo_log.undo()
+        self.assertEqual(forward_k_cat.value, 0.05)
+        self.assertEqual(backward_k_cat.value, 0.01)
+
+    def test_set_init_populations(self):
+        species = self.model.species.get_one(id='RNA_1[c]')
+        conc = species.distribution_init_concentration
+        std = conc.std
+        n_concs = len(self.model.distribution_init_concentrations)
+        no_conc_species = [s for s in self.model.species if s.distribution_init_concentration is None]
+        values = perturbation.get_perturbable_values(self.model)
+
+        undo_log = perturbation.UndoLog()
+        populations = {'RNA_1[c]': 12.}
+        if no_conc_species:
+            populations[no_conc_species[0].id] = 5.
+        perturbation.set_init_populations(self.model, populations, undo_log=undo_log)
+        self.assertEqual(conc.mean, 12.)
+        self.assertEqual(conc.std, 0.)
+        if no_conc_species:
+            self.assertEqual(no_conc_species[0].distribution_init_concentration.mean, 5.)
+
+        # the standard deviations and created initial concentrations are part of the perturbable values
+        changed = perturbation.get_changed_values(values, perturbation.get_perturbable_values(self.model))
+        self.assertIn(('species', 'RNA_1[c]', 'std'), changed)
+        if no_conc_species:
+            self.assertIn(('species', no_conc_species[0].id, 'mean'), changed)
+            self.assertIn(('model', self.model.id, 'distribution_init_concentrations'), changed)
+
+        undo_log.undo()
+        self.assertEqual(perturbation.get_changed_values(values, perturbation.get_perturbable_values(self.model)), [])
+        self.assertEqual(conc.mean, 1000)
+        self.assertEqual(conc.std, std)
+        self.assertEqual(len(self.model.distribution_init_concentrations), n_concs)
+        if no_conc_species:
+            self.assertEqual(no_conc_species[0].distribution_init_concentration, None)
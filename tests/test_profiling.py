@@ -0,0 +1,74 @@
+""" Test of wc_test.profiling
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import profiling
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class ProfilerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_disabled(self):
+        profiler = profiling.Profiler()
+        with profiler.phase('simulate'):
+            pass
+        self.assertIsInstance(profiler.phase('simulate'), profiling.NullPhase)
+        self.assertEqual(profiler.records, [])
+
+    def test_phase(self):
+        profiler = profiling.Profiler(enabled=True)
+        profiler.test_id = 'test_1'
+        with profiler.phase('simulate'):
+            sum(range(10000))
+        with profiler.phase('analysis'):
+            pass
+        with profiler.phase('simulate'):
+            pass
+
+        self.assertEqual([record['phase'] for record in profiler.records], ['simulate', 'analysis', 'simulate'])
+        record = profiler.records[0]
+        self.assertEqual(sorted(record.keys()), sorted(profiling.FIELDS))
+        self.assertEqual(record['test'], 'test_1')
+        self.assertGreater(record['wall_time'], 0.)
+        self.assertGreaterEqual(record['cpu_time'], 0.)
+        self.assertGreater(record['peak_rss'], 0)
+        self.assertGreaterEqual(record['peak_rss_increase'], 0)
+
+        summary = profiler.get_summary()
+        self.assertEqual([(phase['phase'], phase['count']) for phase in summary], [('simulate', 2), ('analysis', 1)])
+        self.assertIn('simulate', profiler.format_summary())
+
+        profiler.clear()
+        self.assertEqual(profiler.records, [])
+
+    def test_write(self):
+        profiler = profiling.Profiler(enabled=True)
+        with profiler.phase('read'):
+            pass
+
+        filename = os.path.join(self.dirname, 'report.json')
+        profiler.write(filename)
+        with open(filename, 'r') as file:
+            report = json.load(file)
+        self.assertEqual(report['records'][0]['phase'], 'read')
+        self.assertEqual(report['summary'][0]['count'], 1)
+
+        filename = os.path.join(self.dirname, 'report.csv')
+        profiler.write(filename)
+        with open(filename, 'r') as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(rows[0]['phase'], 'read')
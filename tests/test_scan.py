@@ -0,0 +1,53 @@
+""" Test of wc_test.scan
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import scan
+import unittest
+
+
+class ScanTestCase(unittest.TestCase):
+    def test_get_scan_points_zip(self):
+        points = scan.get_scan_points(mod_parameters={'p_1': [1, 2], 'p_2': [3, 4]},
+                                      mod_reactions={'r_1': [5, 6]})
+        self.assertEqual(points, [
+            {'parameters': {'p_1': 1, 'p_2': 3}, 'reactions': {'r_1': 5}},
+            {'parameters': {'p_1': 2, 'p_2': 4}, 'reactions': {'r_1': 6}},
+        ])
+
+        with self.assertRaises(SyntaxError):
+            scan.get_scan_points(mod_parameters={'p_1': [1, 2], 'p_2': [3]})
+
+    def test_get_scan_points_grid(self):
+        points = scan.get_scan_points(mod_parameters={'p_1': [1, 2]},
+                                      mod_species={'s_1[c]': [3, 4, 5]},
+                                      mode='grid')
+        self.assertEqual(len(points), 6)
+        self.assertEqual(points[0], {'parameters': {'p_1': 1}, 'species': {'s_1[c]': 3}})
+        self.assertEqual(points[-1], {'parameters': {'p_1': 2}, 'species': {'s_1[c]': 5}})
+
+    def test_get_scan_points_latin_hypercube(self):
+        points = scan.get_scan_points(mod_parameters={'p_1': (0., 1.)},
+                                      mod_reactions={'r_1': (10., 20.)},
+                                      mode='latin_hypercube', n_samples=10, seed=1)
+        self.assertEqual(len(points), 10)
+
+        # each stratum of each axis is sampled exactly once
+        self.assertEqual(sorted(int(point['parameters']['p_1'] * 10) for point in points), list(range(10)))
+        self.assertEqual(sorted(int(point['reactions']['r_1'] - 10.) for point in points), list(range(10)))
+
+        self.assertEqual(points, scan.get_scan_points(mod_parameters={'p_1': (0., 1.)},
+                                                      mod_reactions={'r_1': (10., 20.)},
+                                                      mode='latin_hypercube', n_samples=10, seed=1))
+
+        with self.assertRaises(ValueError):
+            scan.get_scan_points(mod_parameters={'p_1': (0., 1.)}, mode='latin_hypercube')
+
+    def test_get_scan_points_errors(self):
+        self.assertEqual(scan.get_scan_points(), [])
+        with self.assertRaises(ValueError):
+            scan.get_scan_points(mod_parameters={'p_1': [1]}, mode='unknown')
@@ -0,0 +1,254 @@
+""" Test of wc_test.scheduling
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import scheduling
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+
+
+
+def save_records(filename, i_process, n_saves):
+    """ Save records to a history one at a time, as a process running tests would """
+    for i_save in range(n_saves):
+        history = scheduling.DurationHistory()
+        history.filename = filename
+        history.records['test_{}_{}'.format(i_process, i_save)] = {'duration': 1., 'date': 0., 'simulations': []}
+        history.save()
+
+
+class DurationHistoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dirname, 'durations.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_save_and_load(self):
+        history = scheduling.DurationHistory(self.filename)
+        self.assertEqual(history.records, {})
+        history.records['test_a'] = {'duration': 2., 'date': 0., 'simulations': []}
+        history.save()
+
+        # records of other processes are merged
+        other_history = scheduling.DurationHistory()
+        other_history.filename = self.filename
+        other_history.records['test_b'] = {'duration': 3., 'date': 0., 'simulations': []}
+        other_history.save()
+
+        history = scheduling.DurationHistory(self.filename)
+        self.assertEqual(sorted(history.records.keys()), ['test_a', 'test_b'])
+        self.assertEqual(history.records['test_a']['duration'], 2.)
+
+    def test_save_concurrently(self):
+        n_processes = 4
+        n_saves = 10
+        processes = [multiprocessing.Process(target=save_records, args=(self.filename, i_process, n_saves))
+                     for i_process in range(n_processes)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+
+        history = scheduling.DurationHistory(self.filename)
+        self.assertEqual(sorted(history.records.keys()), sorted(
+            'test_{}_{}'.format(i_process, i_save) for i_process in range(n_processes) for i_save in range(n_saves)))
+
+    def test_get_durations(self):
+        history = scheduling.DurationHistory()
+        self.assertEqual(history.get_default_duration(), 0.)
+        self.assertEqual(history.get_durations(['test_a']), [0.])
+
+        history.records = {
+            'test_a': {'duration': 1.},
+            'test_b': {'duration': 4.},
+            'test_c': {'duration': 10.},
+        }
+        self.assertEqual(history.get_default_duration(), 4.)
+        self.assertEqual(history.get_durations(['test_c', 'test_d']), [10., 4.])
+
+        history.records['test_d'] = {'duration': 6.}
+        self.assertEqual(history.get_default_duration(), 5.)
+
+
+class DurationRecorderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dirname, 'durations.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_disabled(self):
+        recorder = scheduling.DurationRecorder()
+        self.assertFalse(recorder.enabled)
+
+    def test_record(self):
+        recorder = scheduling.DurationRecorder(self.filename)
+        self.assertTrue(recorder.enabled)
+
+        recorder.add_simulations('hash', 10., 1., 2)
+        recorder.stop()
+        self.assertEqual(recorder.records, {})
+
+        recorder.start('test_a')
+        recorder.add_simulations('hash', 10., 1., 2)
+        recorder.stop()
+        self.assertEqual(list(recorder.records.keys()), ['test_a'])
+        self.assertGreaterEqual(recorder.records['test_a']['duration'], 0.)
+        self.assertEqual(recorder.records['test_a']['simulations'], [
+            {'model_hash': 'hash', 'end_time': 10., 'checkpoint_period': 1., 'n_sims': 2},
+        ])
+
+        recorder.save()
+        with open(self.filename, 'r') as file:
+            self.assertEqual(list(json.load(file)['tests'].keys()), ['test_a'])
+
+
+class ShardingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.history = scheduling.DurationHistory()
+        self.history.records = {
+            'test_a': {'duration': 1.},
+            'test_b': {'duration': 40.},
+            'test_c': {'duration': 20.},
+            'test_d': {'duration': 20.},
+            'test_e': {'duration': 2.},
+        }
+
+    def test_order_longest_first(self):
+        test_ids = ['test_a', 'test_b', 'test_c', 'test_d', 'test_e', 'test_f']
+        order = scheduling.order_longest_first(test_ids, self.history)
+        self.assertEqual([test_ids[i_test] for i_test in order],
+                         ['test_b', 'test_c', 'test_d', 'test_f', 'test_e', 'test_a'])
+
+    def test_get_shards(self):
+        test_ids = ['test_a', 'test_b', 'test_c', 'test_d', 'test_e']
+        shards = scheduling.get_shards(test_ids, self.history, 2)
+        self.assertEqual([[test_ids[i_test] for i_test in shard] for shard in shards],
+                         [['test_b', 'test_e'], ['test_c', 'test_d', 'test_a']])
+        self.assertEqual(sorted(i_test for shard in shards for i_test in shard), list(range(5)))
+
+        shards = scheduling.get_shards(test_ids, self.history, 10)
+        self.assertEqual(len(shards), 10)
+        self.assertEqual(sum(len(shard) for shard in shards), 5)
+
+        shards = scheduling.get_shards(test_ids, scheduling.DurationHistory(), 2)
+        self.assertEqual([len(shard) for shard in shards], [3, 2])
+
+        with self.assertRaisesRegex(ValueError, 'must be positive'):
+            scheduling.get_shards(test_ids, self.history, 0)
+
+    def test_get_shard(self):
+        suite = unittest.TestSuite([
+            unittest.defaultTestLoader.loadTestsFromTestCase(ExampleTestCase),
+        ])
+        history = scheduling.DurationHistory()
+        history.records = {
+            ExampleTestCase('test_a').id(): {'duration': 10.},
+            ExampleTestCase('test_b').id(): {'duration': 6.},
+            ExampleTestCase('test_c').id(): {'duration': 5.},
+        }
+
+        shard = scheduling.get_shard(suite, 0, 2, history=history)
+        self.assertEqual([test.id().rpartition('.')[2] for test in shard], ['test_a'])
+        shard = scheduling.get_shard(suite, 1, 2, history=history)
+        self.assertEqual([test.id().rpartition('.')[2] for test in shard], ['test_b', 'test_c'])
+
+        with self.assertRaisesRegex(ValueError, 'must be between'):
+            scheduling.get_shard(suite, 2, 2, history=history)
+
+
+class WorkQueueTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_queue(self):
+        queue = scheduling.WorkQueue(self.dirname)
+        self.assertEqual(queue.claim(), None)
+        self.assertTrue(queue.fill(['test_a', 'test_b', 'test_c']))
+
+        other_queue = scheduling.WorkQueue(self.dirname)
+        self.assertFalse(other_queue.fill(['test_c', 'test_b', 'test_a']))
+
+        name, test_id = queue.claim()
+        self.assertEqual(test_id, 'test_a')
+        self.assertEqual(list(other_queue), ['test_b', 'test_c'])
+        queue.complete(name)
+        self.assertEqual(queue.claim(), None)
+        self.assertEqual(len(os.listdir(os.path.join(self.dirname, 'done'))), 3)
+
+    def test_claim_known(self):
+        queue = scheduling.WorkQueue(self.dirname)
+        queue.fill(['test_a', 'test_b', 'test_c'])
+
+        # tests which the worker can't run are returned to the queue for the other workers
+        released = set()
+        name, test_id = queue.claim_known(set(['test_b']), released)
+        self.assertEqual(test_id, 'test_b')
+        self.assertEqual(len(released), 1)
+        queue.complete(name)
+        self.assertEqual(queue.claim_known(set(['test_b']), released), None)
+        self.assertEqual(list(scheduling.WorkQueue(self.dirname)), ['test_a', 'test_c'])
+
+    def test_release(self):
+        queue = scheduling.WorkQueue(self.dirname)
+        queue.fill(['test_a', 'test_b'])
+        name, test_id = queue.claim()
+        queue.release(name)
+        self.assertEqual(queue.claim()[1], 'test_a')
+
+    def test_fill_timeout(self):
+        queue = scheduling.WorkQueue(self.dirname)
+        open(os.path.join(self.dirname, 'filled'), 'w').close()
+        with self.assertRaises(TimeoutError):
+            queue.fill(['test_a'], timeout=0.)
+
+    def test_run_from_queue(self):
+        suite = unittest.defaultTestLoader.loadTestsFromTestCase(ExampleTestCase)
+        result = unittest.TestResult()
+        scheduling.run_from_queue(suite, self.dirname, result, history=scheduling.DurationHistory())
+        self.assertEqual(result.testsRun, 3)
+
+        result = unittest.TestResult()
+        scheduling.run_from_queue(suite, self.dirname, result, history=scheduling.DurationHistory())
+        self.assertEqual(result.testsRun, 0)
+
+    def test_run_from_queue_other_tests(self):
+        # tests which a worker didn't collect are run by the other workers
+        suite = unittest.defaultTestLoader.loadTestsFromTestCase(ExampleTestCase)
+        tests = list(suite)
+        scheduling.WorkQueue(self.dirname).fill([test.id() for test in tests])
+
+        result = unittest.TestResult()
+        scheduling.run_from_queue(unittest.TestSuite(tests[1:2]), self.dirname, result,
+                                  history=scheduling.DurationHistory())
+        self.assertEqual(result.testsRun, 1)
+
+        result = unittest.TestResult()
+        scheduling.run_from_queue(suite, self.dirname, result, history=scheduling.DurationHistory())
+        self.assertEqual(result.testsRun, 2)
+
+
+class ExampleTestCase(unittest.TestCase):
+    def test_a(self):
+        pass
+
+    def test_b(self):
+        pass
+
+    def test_c(self):
+        pass
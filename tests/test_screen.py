@@ -0,0 +1,144 @@
+""" Test of wc_test.screen
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import screen
+from wc_test import trajectory
+import math
+import numpy
+import os
+import pandas
+import shutil
+import tempfile
+import unittest
+
+
+class ScreenTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_perturbation(self):
+        self.assertEqual(screen.get_perturbation('reaction', 'r_1'), {'reactions': {'r_1': 0.}})
+        self.assertEqual(screen.get_perturbation('reaction', 'r_1; r_2', ''), {'reactions': {'r_1': 0., 'r_2': 0.}})
+        self.assertEqual(screen.get_perturbation('parameter', 'p_1', '2.5'), {'parameters': {'p_1': 2.5}})
+        self.assertEqual(screen.get_perturbation('parameter', 'p_1', float('nan')), {'parameters': {'p_1': 0.}})
+        self.assertEqual(screen.get_perturbation('species', 's_1[c]', 10), {'species': {'s_1[c]': 10.}})
+        self.assertEqual(screen.get_perturbation('submodel', 'sm_1'), {'submodels': {'sm_1': False}})
+        self.assertEqual(screen.get_perturbation('submodel', 'sm_1', 'on'), {'submodels': {'sm_1': True}})
+
+        with self.assertRaisesRegex(ValueError, 'must be one of'):
+            screen.get_perturbation('gene', 'g_1')
+        with self.assertRaisesRegex(ValueError, 'at least one target'):
+            screen.get_perturbation('reaction', ' ; ')
+        with self.assertRaisesRegex(ValueError, 'Invalid submodel status'):
+            screen.get_perturbation('submodel', 'sm_1', 'maybe')
+
+    def test_read_screen(self):
+        rows = [
+            {'id': 'ko_1', 'type': 'reaction', 'target': 'r_1'},
+            {'type': 'submodel', 'target': 'sm_1', 'value': 'false'},
+        ]
+        expected = [
+            ('ko_1', {'reactions': {'r_1': 0.}}),
+            ('1', {'submodels': {'sm_1': False}}),
+        ]
+        self.assertEqual(screen.read_screen(rows), expected)
+        self.assertEqual(screen.read_screen(pandas.DataFrame(rows)), expected)
+
+        filename = os.path.join(self.dirname, 'screen.csv')
+        with open(filename, 'w') as file:
+            file.write('id,type,target,value\n')
+            file.write('ko_1,reaction,r_1,\n')
+            file.write(',submodel,sm_1,false\n')
+        self.assertEqual(screen.read_screen(filename), expected)
+
+        with self.assertRaisesRegex(ValueError, 'defined multiple times'):
+            screen.read_screen([rows[0], rows[0]])
+        with self.assertRaisesRegex(ValueError, 'Perturbation ko_2 is invalid'):
+            screen.read_screen([{'id': 'ko_2', 'type': 'gene', 'target': 'g_1'}])
+
+    def test_summarize(self):
+        traj = trajectory.Trajectory([0., 1.], ['A[c]', 'B[c]'], [[1., 3.], [2., 2.]])
+        self.assertEqual(screen.summarize(traj), {'A[c] final': 3., 'B[c] final': 2.})
+        self.assertEqual(screen.summarize(traj, species_ids=['A[c]'], statistics=['initial', 'delta']),
+                         {'A[c] initial': 1., 'A[c] delta': 2.})
+
+    def test_results(self):
+        filename = os.path.join(self.dirname, 'results.csv')
+        with screen.ScreenResults(filename) as results:
+            self.assertEqual(results.completed, set())
+            results.add('ko_1', 1, metrics={'A[c] final': 3., 'B[c] final': 2.})
+            results.add('ko_2', 1, error='KeyError: r_2')
+            with self.assertRaisesRegex(ValueError, 'different from those of the screen'):
+                results.add('ko_3', 1, metrics={'C[c] final': 1.})
+
+        # simulate an interruption while a row is written
+        with open(filename, 'a') as file:
+            file.write('ko_3,1,,1.0')
+
+        with screen.ScreenResults(filename) as results:
+            self.assertEqual(results.completed, set(['ko_1']))
+            self.assertEqual(results.failed, set(['ko_2']))
+            self.assertEqual(results.columns, ['id', 'seed', 'error', 'A[c] final', 'B[c] final'])
+            results.add('ko_3', 1, metrics={'A[c] final': 4., 'B[c] final': 0.})
+
+        table = screen.read_results(filename, ids=['ko_3', 'ko_2', 'ko_1', 'ko_4'])
+        self.assert_results(table)
+
+    def test_results_error_first(self):
+        filename = os.path.join(self.dirname, 'results.csv')
+        with screen.ScreenResults(filename) as results:
+            results.add('ko_2', 1, error='KeyError: r_2')
+            self.assertEqual(results.columns, ['id', 'seed', 'error'])
+
+        # the columns of the metrics are added when the first perturbation succeeds, including after resuming
+        with screen.ScreenResults(filename) as results:
+            self.assertEqual(results.completed, set())
+            self.assertEqual(results.failed, set(['ko_2']))
+            results.add('ko_1', 1, metrics={'A[c] final': 3., 'B[c] final': 2.})
+            self.assertEqual(results.columns, ['id', 'seed', 'error', 'A[c] final', 'B[c] final'])
+            results.add('ko_3', 1, metrics={'A[c] final': 4., 'B[c] final': 0.})
+
+        with screen.ScreenResults(filename) as results:
+            self.assertEqual(results.completed, set(['ko_1', 'ko_3']))
+            self.assertEqual(results.failed, set(['ko_2']))
+
+        table = screen.read_results(filename, ids=['ko_3', 'ko_2', 'ko_1', 'ko_4'])
+        self.assert_results(table)
+
+    def test_results_retry(self):
+        filename = os.path.join(self.dirname, 'results.csv')
+        with screen.ScreenResults(filename) as results:
+            results.add('ko_1', 1, metrics={'A[c] final': 3., 'B[c] final': 2.})
+            results.add('ko_2', 1, error='MemoryError: ')
+
+        # retried perturbations supersede their failures
+        with screen.ScreenResults(filename) as results:
+            self.assertEqual(results.failed, set(['ko_2']))
+            results.add('ko_2', 1, metrics={'A[c] final': 5., 'B[c] final': 1.})
+            self.assertEqual(results.completed, set(['ko_1', 'ko_2']))
+            self.assertEqual(results.failed, set())
+
+        with screen.ScreenResults(filename) as results:
+            self.assertEqual(results.completed, set(['ko_1', 'ko_2']))
+            self.assertEqual(results.failed, set())
+
+        table = screen.read_results(filename)
+        self.assertEqual(list(table.index), ['ko_1', 'ko_2'])
+        self.assertEqual(table.loc['ko_2', 'error'], '')
+        self.assertEqual(table.loc['ko_2', 'A[c] final'], 5.)
+
+    def assert_results(self, table):
+        self.assertEqual(list(table.index), ['ko_3', 'ko_2', 'ko_1', 'ko_4'])
+        self.assertEqual(list(table.columns), ['seed', 'error', 'A[c] final', 'B[c] final'])
+        self.assertEqual(table.loc['ko_1', 'A[c] final'], 3.)
+        self.assertEqual(table.loc['ko_2', 'error'], 'KeyError: r_2')
+        self.assertTrue(math.isnan(table.loc['ko_2', 'A[c] final']))
+        self.assertTrue(numpy.isnan(table.loc['ko_4', 'A[c] final']))
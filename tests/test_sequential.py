@@ -0,0 +1,50 @@
+""" Test of wc_test.sequential
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import sequential
+import numpy
+import unittest
+
+
+class SequentialEstimateTestCase(unittest.TestCase):
+    def test_estimate(self):
+        estimate = sequential.SequentialEstimate([1., 2., 3.], confidence=0.95)
+        self.assertEqual(estimate.n_sims, 3)
+        self.assertEqual(estimate.mean, 2.)
+        self.assertAlmostEqual(estimate.half_width, 4.302652729911275 / numpy.sqrt(3))
+        self.assertAlmostEqual(estimate.lower, 2. - estimate.half_width)
+        self.assertAlmostEqual(estimate.upper, 2. + estimate.half_width)
+        self.assertIn('3 replicates', str(estimate))
+
+    def test_is_decided(self):
+        estimate = sequential.SequentialEstimate([9.9, 10., 10.1])
+        self.assertTrue(estimate.is_within(10., 1.))
+        self.assertFalse(estimate.is_outside(10., 1.))
+        self.assertTrue(estimate.is_outside(20., 1.))
+        self.assertFalse(estimate.is_within(10.5, 0.5))
+        self.assertFalse(estimate.is_outside(10.5, 0.5))
+
+        self.assertTrue(estimate.is_decided(half_width=1.))
+        self.assertFalse(estimate.is_decided(half_width=0.01))
+        self.assertTrue(estimate.is_decided(expected=20., margin=1.))
+        self.assertFalse(estimate.is_decided(expected=10.5, margin=0.5))
+        self.assertFalse(estimate.is_decided())
+
+    def test_get_n_looks(self):
+        self.assertEqual(sequential.get_n_looks(10, 100, 1), 91)
+        self.assertEqual(sequential.get_n_looks(10, 100, 4), 24)
+        self.assertEqual(sequential.get_n_looks(2, 4, 8), 1)
+        self.assertEqual(sequential.get_n_looks(10, 10, 4), 1)
+
+    def test_get_look_confidence(self):
+        self.assertAlmostEqual(sequential.get_look_confidence(0.95, 1), 0.95)
+        self.assertAlmostEqual(sequential.get_look_confidence(0.95, 5), 0.99)
+
+    def test_get_confidence_interval_half_width(self):
+        self.assertEqual(sequential.get_confidence_interval_half_width([1.]), numpy.inf)
+        self.assertEqual(sequential.get_confidence_interval_half_width([1., 1., 1.]), 0.)
@@ -0,0 +1,57 @@
+""" Test of wc_test.stoichiometry
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import stoichiometry
+from wc_test import synthetic
+from wc_utils.util.chem import EmpiricalFormula
+import numpy
+import unittest
+
+
+class StoichiometryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.model = synthetic.get_synthetic_model(n_species=5, n_reactions=8, seed=1)
+
+    def test_get_stoichiometry(self):
+        stoich = stoichiometry.get_stoichiometry(self.model)
+        self.assertEqual(stoich.species_ids, [species.id for species in self.model.species])
+        self.assertEqual(stoich.reaction_ids, [reaction.id for reaction in self.model.reactions])
+        self.assertEqual(stoich.matrix.shape, (8, 5))
+        numpy.testing.assert_equal(numpy.asarray(stoich.matrix.sum(axis=1)).ravel(), numpy.zeros(8))
+        self.assertEqual(stoich.matrix[0, 0], -1.)
+
+    def test_get_composition(self):
+        self.model.species_types[1].structure = None
+        composition = stoichiometry.get_composition(self.model)
+        self.assertEqual(sorted(composition.elements), ['C', 'H', 'O'])
+        self.assertEqual(composition.matrix.shape, (5, 3))
+        self.assertEqual(composition.matrix[0, composition.elements.index('C')], 6.)
+        self.assertEqual(composition.defined.tolist(), [True, False, True, True, True])
+
+    def test_get_reaction_imbalances(self):
+        stoich = stoichiometry.get_stoichiometry(self.model)
+        self.assertEqual(stoichiometry.get_reaction_imbalances(stoich, stoichiometry.get_composition(self.model)), [])
+
+        structure = self.model.species_types.get_one(id='metabolite_0').structure
+        structure.empirical_formula = EmpiricalFormula('C6H12O7')
+        structure.charge = -1
+        imbalances = stoichiometry.get_reaction_imbalances(stoich, stoichiometry.get_composition(self.model))
+
+        expected_reaction_ids = [reaction.id for reaction in self.model.reactions
+                                 if 'metabolite_0[c]' in [part.species.id for part in reaction.participants]]
+        self.assertEqual([imbalance.reaction_id for imbalance in imbalances], expected_reaction_ids)
+
+        imbalance = imbalances[0]
+        self.assertEqual(imbalance.reaction_id, 'reaction_0')
+        self.assertEqual(imbalance.elements, {'O': -1.})
+        self.assertEqual(imbalance.charge, 1.)
+        self.assertEqual(str(imbalance), 'Reaction reaction_0 is element imbalanced: O: -1; charge imbalanced: +1')
+
+        # reactions with species whose formulae are undefined are not checked
+        self.model.species_types.get_one(id='metabolite_0').structure = None
+        self.assertEqual(stoichiometry.get_reaction_imbalances(stoich, stoichiometry.get_composition(self.model)), [])
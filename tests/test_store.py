@@ -0,0 +1,87 @@
+""" Test of wc_test.store
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import store
+from wc_test import trajectory
+import numpy
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class ResultsStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dirname, 'results.h5')
+        self.times = numpy.array([0., 5., 10.])
+        self.species_ids = ['A[c]', 'B[c]', 'C[c]']
+        self.points = [{'parameters': {'p': 1.}}, {'parameters': {'p': 2.}, 'reactions': {'r': 3.}}]
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def write(self, compression='gzip'):
+        results_store = store.ResultsStore.create(self.filename, self.species_ids, self.times, 2,
+                                                  n_replicates=2, points=self.points, compression=compression)
+        populations = numpy.arange(2 * 2 * 3 * 3, dtype=numpy.float64).reshape((2, 2, 3, 3))
+        for i_point in range(2):
+            for i_replicate in range(2):
+                results_store.write(i_point, i_replicate, trajectory.Trajectory(
+                    self.times, self.species_ids, populations[i_point, i_replicate]))
+        results_store.close()
+        return populations
+
+    def test_write_and_read(self):
+        populations = self.write()
+
+        with store.ResultsStore(self.filename) as results_store:
+            self.assertEqual(results_store.n_points, 2)
+            self.assertEqual(results_store.n_replicates, 2)
+            self.assertEqual(results_store.species_ids, self.species_ids)
+            numpy.testing.assert_equal(results_store.times, self.times)
+            numpy.testing.assert_equal(results_store.get_populations(), populations)
+            numpy.testing.assert_equal(results_store.get_species('B[c]'), populations[:, :, 1, :])
+            numpy.testing.assert_equal(results_store.get_point(1), populations[1])
+            numpy.testing.assert_equal(results_store.get_populations(points=1, species_ids=['C[c]', 'A[c]']),
+                                       populations[1][:, [2, 0], :])
+            with self.assertRaisesRegex(KeyError, 'not part of the store'):
+                results_store.get_species('D[c]')
+
+            axes, values = results_store.get_parameter_table()
+            self.assertEqual(axes, [('parameters', 'p'), ('reactions', 'r')])
+            numpy.testing.assert_equal(values, [[1., numpy.nan], [2., 3.]])
+            self.assertEqual(results_store.get_points(), self.points)
+
+    def test_submodels(self):
+        points = [{'submodels': {'sm_1': False}}, {'parameters': {'p': 2.}, 'submodels': {'sm_1': True}}]
+        store.ResultsStore.create(self.filename, self.species_ids, self.times, 2, points=points).close()
+        with store.ResultsStore(self.filename) as results_store:
+            axes, values = results_store.get_parameter_table()
+            self.assertEqual(axes, [('submodels', 'sm_1'), ('parameters', 'p')])
+            numpy.testing.assert_equal(values, [[0., numpy.nan], [1., 2.]])
+            self.assertEqual(results_store.get_points(), points)
+
+        with self.assertRaisesRegex(ValueError, 'which set init_populations cannot be saved'):
+            store.get_parameter_table([{'init_populations': {'A[c]': 10}}])
+
+    def test_write_different_times(self):
+        results_store = store.ResultsStore.create(self.filename, self.species_ids, self.times, 1)
+        with self.assertRaisesRegex(ValueError, 'times of the store'):
+            results_store.write(0, 0, trajectory.Trajectory([0., 1.], self.species_ids, numpy.zeros((3, 2))))
+        results_store.close()
+
+    def test_memmap(self):
+        populations = self.write(compression=None)
+        with store.ResultsStore(self.filename) as results_store:
+            numpy.testing.assert_equal(results_store.memmap(), populations)
+
+        self.write()
+        with store.ResultsStore(self.filename) as results_store:
+            with self.assertRaisesRegex(ValueError, 'memory-mapped'):
+                results_store.memmap()
@@ -0,0 +1,60 @@
+""" Test of wc_test.submodels
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import submodels
+import unittest
+import wc_lang
+import wc_lang.io
+
+
+class ExtractSubmodelsTestCase(unittest.TestCase):
+    MODEL_PATH = 'tests/fixtures/min_model.xlsx'
+
+    def setUp(self):
+        self.model = wc_lang.io.Reader().run(self.MODEL_PATH)[wc_lang.Model][0]
+
+    def test_extract_submodels(self):
+        n_reactions = len(self.model.reactions)
+        model, boundary_species_ids = submodels.extract_submodels(self.model, ['transcription'], boundary='dynamic')
+
+        self.assertEqual([submodel.id for submodel in model.submodels], ['transcription'])
+        self.assertTrue(all(reaction.submodel.id == 'transcription' for reaction in model.reactions))
+        self.assertTrue(all(rate_law.reaction.submodel.id == 'transcription' for rate_law in model.rate_laws))
+        self.assertEqual(model.parameters.get(id='k_cat_deg_1'), [])
+        self.assertEqual(len(model.parameters.get(id='k_cat_trn_1')), 1)
+        self.assertEqual(len(model.parameters.get(id='mean_doubling_time')), 1)
+        self.assertEqual(len(model.parameters.get(id='density_c')), 1)
+
+        self.assertIn('RNA_1[c]', boundary_species_ids)
+        self.assertIn('RNA_1[c]', [part.species.id for part in
+                                   model.reactions.get_one(id='transcription_RNA_1').participants])
+        participant_ids = set(part.species.id for reaction in model.reactions for part in reaction.participants)
+        self.assertEqual(set(species.id for species in model.species), participant_ids)
+        self.assertEqual(len(model.distribution_init_concentrations), len(model.species))
+
+        # the model is copied
+        self.assertEqual(len(self.model.reactions), n_reactions)
+        self.assertEqual(len(self.model.submodels), 2)
+
+    def test_extract_submodels_fixed_boundary(self):
+        model, boundary_species_ids = submodels.extract_submodels(self.model, ['transcription'])
+        self.assertIn('RNA_1[c]', boundary_species_ids)
+        participant_ids = set(part.species.id for reaction in model.reactions for part in reaction.participants)
+        self.assertEqual(participant_ids.intersection(boundary_species_ids), set())
+
+    def test_extract_all_submodels(self):
+        model, boundary_species_ids = submodels.extract_submodels(self.model, ['transcription', 'degradation'])
+        self.assertEqual(boundary_species_ids, [])
+        self.assertEqual(len(model.reactions), len(self.model.reactions))
+        self.assertEqual(len(model.species), len(self.model.species))
+
+    def test_extract_submodels_errors(self):
+        with self.assertRaisesRegex(ValueError, 'does not contain submodels: unknown'):
+            submodels.extract_submodels(self.model, ['transcription', 'unknown'])
+        with self.assertRaisesRegex(ValueError, 'Boundary mode must be one of'):
+            submodels.extract_submodels(self.model, ['transcription'], boundary='unknown')
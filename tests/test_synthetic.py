@@ -0,0 +1,45 @@
+""" Test of wc_test.synthetic
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_onto import onto
+from wc_test import synthetic
+import unittest
+import wc_test.core
+
+
+class SyntheticModelTestCase(unittest.TestCase):
+    def test_get_synthetic_model(self):
+        model = synthetic.get_synthetic_model(n_species=20, n_reactions=30, n_submodels=3, n_parameters=5, seed=1)
+        self.assertEqual(len(model.species), 20)
+        self.assertEqual(len(model.reactions), 30)
+        self.assertEqual(len(model.submodels), 3)
+        self.assertEqual(len(model.parameters.get(type=onto['WC:k_cat'])), 30)
+        self.assertEqual(len(model.parameters.get(id='parameter_4')), 1)
+        self.assertEqual(len(model.submodels.get_one(id='submodel_0').reactions), 10)
+        for reaction in model.reactions:
+            self.assertEqual(sorted(part.coefficient for part in reaction.participants), [-1., 1.])
+            self.assertNotEqual(reaction.participants[0].species, reaction.participants[1].species)
+
+        self.assertEqual(synthetic.get_synthetic_model(n_species=20, seed=1).reactions[5].participants[1].species.id,
+                         synthetic.get_synthetic_model(n_species=20, seed=1).reactions[5].participants[1].species.id)
+
+    def test_get_synthetic_model_errors(self):
+        with self.assertRaisesRegex(ValueError, 'at least two species'):
+            synthetic.get_synthetic_model(n_species=1)
+        with self.assertRaisesRegex(ValueError, 'at least one submodel'):
+            synthetic.get_synthetic_model(n_submodels=0)
+
+    def test_simulate(self):
+        class TestCase(wc_test.core.SimulationTestCase):
+            MODEL = synthetic.get_synthetic_model(n_species=10, seed=1)
+
+        test_case = TestCase()
+        test_case.setUp()
+        results = test_case.simulate(end_time=10., checkpoint_period=5., seed=1)
+        self.assertEqual(results[0].get('populations').shape, (3, 10))
+        test_case.tearDown()
@@ -0,0 +1,62 @@
+""" Test of wc_test.trajectory
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import trajectory
+import mock
+import numpy
+import pandas
+import unittest
+
+
+class TrajectoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.populations = pandas.DataFrame(
+            [[1., 10.], [3., 8.], [2., 12.]],
+            index=[0., 5., 10.],
+            columns=['A[c]', 'B[c]'])
+        self.run_results = mock.Mock(get=mock.Mock(return_value=self.populations))
+
+    def test_statistics(self):
+        traj = trajectory.Trajectory.from_run_results(self.run_results)
+        numpy.testing.assert_array_equal(traj.times, [0., 5., 10.])
+        self.assertEqual(traj.species_ids, ['A[c]', 'B[c]'])
+        numpy.testing.assert_array_equal(traj.get_populations(['B[c]']), [[10., 8., 12.]])
+
+        numpy.testing.assert_array_equal(traj.initial(), [1., 10.])
+        numpy.testing.assert_array_equal(traj.final(), [2., 12.])
+        numpy.testing.assert_array_equal(traj.delta(), [1., 2.])
+        numpy.testing.assert_array_equal(traj.delta(['B[c]', 'A[c]']), [2., 1.])
+        numpy.testing.assert_array_equal(traj.mean(), [2., 10.])
+        numpy.testing.assert_array_equal(traj.min(), [1., 8.])
+        numpy.testing.assert_array_equal(traj.max(), [3., 12.])
+        numpy.testing.assert_array_equal(traj.auc(), [22.5, 95.])
+
+        summary = traj.summarize(['A[c]'], statistics=['delta', 'auc'])
+        self.assertEqual(set(summary.keys()), set(['delta', 'auc']))
+        numpy.testing.assert_array_equal(summary['auc'], [22.5])
+
+        with self.assertRaisesRegex(KeyError, 'C\\[c\\]'):
+            traj.delta(['C[c]'])
+
+    def test_fit_exponential_growth(self):
+        times = numpy.linspace(0., 10., 11)
+        values = numpy.array([2. * numpy.exp(0.1 * times), 3. * numpy.exp(-0.2 * times)])
+        rates, init_values = trajectory.fit_exponential_growth(times, values)
+        numpy.testing.assert_allclose(rates, [0.1, -0.2])
+        numpy.testing.assert_allclose(init_values, [2., 3.])
+
+        rates, init_values = trajectory.fit_exponential_growth(times, values[0])
+        numpy.testing.assert_allclose(rates, [0.1])
+
+        with self.assertRaises(ValueError):
+            trajectory.fit_exponential_growth([0.], [[1.]])
+
+    def test_get_trajectory(self):
+        traj = trajectory.get_trajectory(self.run_results)
+        self.assertIs(trajectory.get_trajectory(self.run_results), traj)
+        self.run_results.get.assert_called_once_with('populations')
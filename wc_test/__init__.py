@@ -1,4 +1,5 @@
-from .core import KnowledgeBaseTestCase, ModelTestCase, SimulationTestCase
+from .core import (KnowledgeBaseTestCase, ModelTestCase, ModelStructureTestCase, SimulationTestCase,
+                   SubmodelSimulationTestCase)
 
 # read version
 from ._version import __version__
@@ -0,0 +1,345 @@
+""" Caches of parsed knowledge bases and models, and of simulation results
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import lazy
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import warnings
+
+wc_sim = lazy.import_module('wc_sim')
+
+
+class ParsedFileCache(object):
+    """ Process-wide cache of knowledge bases and models parsed from files
+
+    Each file is parsed once per process (and, optionally, once across processes with
+    an on-disk cache of pickled objects). Files are identified by their path, modification
+    time, and size so that edited files are re-parsed.
+
+    Attributes:
+        _objects (:obj:`dict`): dictionary which maps keys of files to the objects parsed
+            from them
+    """
+
+    def __init__(self):
+        self._objects = {}
+
+    def get(self, kind, path, read, cache_dir=None):
+        """ Get the object parsed from a file
+
+        Args:
+            kind (:obj:`str`): type of the object (e.g., :obj:`model`)
+            path (:obj:`str`): path to the file
+            read (:obj:`callable`): function which parses the file and returns the object
+            cache_dir (:obj:`str`, optional): directory for the on-disk cache
+
+        Returns:
+            :obj:`obj_tables.Model`: object parsed from the file; the object is shared
+                and should be copied before it is modified
+        """
+        key = self.get_key(kind, path)
+        obj = self._objects.get(key, None)
+        if obj is None and cache_dir:
+            obj = self._load(key, cache_dir)
+        if obj is None:
+            obj = read(path)
+            if cache_dir:
+                self._save(key, obj, cache_dir)
+        self._objects[key] = obj
+        return obj
+
+    def clear(self):
+        """ Remove all objects from the in-memory cache """
+        self._objects.clear()
+
+    @staticmethod
+    def get_key(kind, path):
+        """ Get the key of a file
+
+        Args:
+            kind (:obj:`str`): type of the object (e.g., :obj:`model`)
+            path (:obj:`str`): path to the file
+
+        Returns:
+            :obj:`tuple`: key
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        return (kind, path, stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _get_filename(key, cache_dir):
+        """ Get the path to the on-disk cache of a file
+
+        Args:
+            key (:obj:`tuple`): key of the file
+            cache_dir (:obj:`str`): directory for the on-disk cache
+
+        Returns:
+            :obj:`str`: path
+        """
+        return os.path.join(cache_dir, hashlib.sha256(repr(key).encode()).hexdigest() + '.pkl')
+
+    def _load(self, key, cache_dir):
+        """ Load an object from the on-disk cache
+
+        Args:
+            key (:obj:`tuple`): key of the file
+            cache_dir (:obj:`str`): directory for the on-disk cache
+
+        Returns:
+            :obj:`obj_tables.Model`: object, or :obj:`None` if the object isn't cached
+        """
+        filename = self._get_filename(key, cache_dir)
+        if not os.path.isfile(filename):
+            return None
+        try:
+            with open(filename, 'rb') as file:
+                return pickle.load(file)
+        except Exception as exception:
+            warnings.warn('Cache {} could not be loaded: {}'.format(filename, str(exception)), UserWarning)
+            return None
+
+    def _save(self, key, obj, cache_dir):
+        """ Save an object to the on-disk cache
+
+        Args:
+            key (:obj:`tuple`): key of the file
+            obj (:obj:`obj_tables.Model`): object
+            cache_dir (:obj:`str`): directory for the on-disk cache
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        filename = self._get_filename(key, cache_dir)
+        file, temp_filename = tempfile.mkstemp(dir=cache_dir)
+        try:
+            with os.fdopen(file, 'wb') as file:
+                pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_filename, filename)
+        except Exception as exception:
+            os.remove(temp_filename)
+            warnings.warn('Object could not be cached: {}'.format(str(exception)), UserWarning)
+
+
+# cache shared by all test cases
+parsed_file_cache = ParsedFileCache()
+
+
+class SimulationResultsCache(object):
+    """ On-disk cache of the results of simulations, keyed by the content of the simulated
+    model, the simulation arguments, and the seed
+
+    Each entry is a directory of results. When the size of the cache exceeds its budget,
+    the least recently used entries are evicted.
+
+    Attributes:
+        cache_dir (:obj:`str`): directory of the cache
+        max_size (:obj:`int`): maximum size of the cache (bytes)
+    """
+
+    def __init__(self, cache_dir, max_size=10 * 2 ** 30):
+        """
+        Args:
+            cache_dir (:obj:`str`): directory of the cache
+            max_size (:obj:`int`, optional): maximum size of the cache (bytes)
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def get_key(model_hash, end_time, checkpoint_period, seed, perturbation=None):
+        """ Get the key of the results of a simulation
+
+        Args:
+            model_hash (:obj:`str`): hash of the model (see :obj:`get_model_hash`)
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`): checkpoint period
+            seed (:obj:`int`): seed
+            perturbation (:obj:`dict`, optional): perturbation of the model
+
+        Returns:
+            :obj:`str`: key
+        """
+        args = json.dumps([model_hash, getattr(wc_sim, '__version__', None), end_time, checkpoint_period, seed, perturbation or {}],
+                          sort_keys=True, default=str)
+        return hashlib.sha256(args.encode()).hexdigest()
+
+    def get(self, key):
+        """ Get the cached results of a simulation, and mark them as recently used
+
+        Args:
+            key (:obj:`str`): key
+
+        Returns:
+            :obj:`str`: path to the results, or :obj:`None` if the results aren't cached
+        """
+        results_dir = os.path.join(self.cache_dir, key)
+        if not os.path.isdir(results_dir):
+            return None
+        os.utime(results_dir)
+        return results_dir
+
+    def set(self, key, results_dir):
+        """ Save a copy of the results of a simulation, and evict the least recently used
+        results if the cache is over budget
+
+        Args:
+            key (:obj:`str`): key
+            results_dir (:obj:`str`): path to the results
+
+        Returns:
+            :obj:`str`: path to the cached results
+        """
+        cached_results_dir = os.path.join(self.cache_dir, key)
+        if not os.path.isdir(cached_results_dir):
+            temp_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix='.')
+            shutil.copytree(results_dir, os.path.join(temp_dir, key))
+            try:
+                os.rename(os.path.join(temp_dir, key), cached_results_dir)
+            except OSError:
+                # another process cached the same results
+                pass
+            shutil.rmtree(temp_dir)
+        self.evict(keep=[key])
+        return cached_results_dir
+
+    def evict(self, keep=()):
+        """ Evict the least recently used results until the cache is within its budget
+
+        Args:
+            keep (:obj:`list` of :obj:`str`, optional): keys which shouldn't be evicted
+        """
+        entries = []
+        total_size = 0
+        for key in os.listdir(self.cache_dir):
+            results_dir = os.path.join(self.cache_dir, key)
+            if key.startswith('.') or not os.path.isdir(results_dir):
+                continue
+            size = get_dir_size(results_dir)
+            entries.append((os.path.getmtime(results_dir), key, size))
+            total_size += size
+
+        for _, key, size in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if key not in keep:
+                shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+                total_size -= size
+
+    def clear(self):
+        """ Remove all results from the cache """
+        shutil.rmtree(self.cache_dir)
+        os.makedirs(self.cache_dir)
+
+
+def get_dir_size(dirname):
+    """ Get the total size of the files in a directory
+
+    Args:
+        dirname (:obj:`str`): path to the directory
+
+    Returns:
+        :obj:`int`: size (bytes)
+    """
+    size = 0
+    for root, _, filenames in os.walk(dirname):
+        for filename in filenames:
+            size += os.path.getsize(os.path.join(root, filename))
+    return size
+
+
+def get_model_hash(model):
+    """ Get a hash of the content of a model which is stable across sessions
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+
+    Returns:
+        :obj:`str`: hash
+    """
+    return get_objects_hash(model.get_related())
+
+
+def get_objects_hash(objs):
+    """ Get a hash of the content of a set of objects which is independent of their order
+
+    Args:
+        objs (:obj:`list` of :obj:`obj_tables.Model`): objects
+
+    Returns:
+        :obj:`str`: hash
+    """
+    lines = sorted(serialize_object(obj) for obj in objs)
+
+    hash = hashlib.sha256()
+    for line in lines:
+        hash.update(line.encode())
+        hash.update(b'\n')
+    return hash.hexdigest()
+
+
+def serialize_object(obj):
+    """ Serialize the values of the attributes of an object, with related objects
+    represented by their serialized ids
+
+    Args:
+        obj (:obj:`obj_tables.Model`): object
+
+    Returns:
+        :obj:`str`: serialized values
+    """
+    cls = obj.__class__
+    values = [cls.__name__]
+    for name, attr in cls.Meta.attributes.items():
+        value = getattr(obj, name)
+        try:
+            values.append('{}={}'.format(name, attr.serialize(value)))
+        except Exception:
+            values.append('{}={}'.format(name, serialize_value(value)))
+    return '\t'.join(values)
+
+
+def serialize_value(value):
+    """ Serialize a value which its attribute can't serialize, such that the serialization
+    is stable across sessions
+
+    Related objects are represented by their serialized ids, and the order of collections of
+    related objects is ignored.
+
+    Args:
+        value (:obj:`object`): value
+
+    Returns:
+        :obj:`str`: serialized value
+
+    Raises:
+        :obj:`ValueError`: if the value can't be serialized stably, e.g., because its
+            representation contains its address
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return repr(value)
+    if hasattr(value.__class__, 'Meta') and hasattr(value, 'serialize'):
+        return '{}:{}'.format(value.__class__.__name__, value.serialize())
+    if isinstance(value, dict):
+        return '{{{}}}'.format(', '.join(sorted('{}: {}'.format(serialize_value(key), serialize_value(val))
+                                                for key, val in value.items())))
+    if isinstance(value, (set, frozenset)) or (
+            isinstance(value, (list, tuple))
+            and all(hasattr(item.__class__, 'Meta') and hasattr(item, 'serialize') for item in value)):
+        return '{{{}}}'.format(', '.join(sorted(serialize_value(item) for item in value)))
+    if isinstance(value, (list, tuple)):
+        return '[{}]'.format(', '.join(serialize_value(item) for item in value))
+
+    serialized = repr(value)
+    if ' at 0x' in serialized:
+        raise ValueError('{} objects can\'t be serialized stably'.format(value.__class__.__name__))
+    return serialized
@@ -11,15 +11,102 @@ TODO:
 - mod_parameters values are INTs in change_methods, but LISTs for sim_scan methods, synchornize
 """
 
+from wc_test import cache
+from wc_test import dependencies
+from wc_test import ensemble
+from wc_test import lazy
+from wc_test import model_index
+from wc_test import network
+from wc_test import parallel
+from wc_test import perturbation
+from wc_test import profiling
+from wc_test import scan
+from wc_test import scheduling
+from wc_test import screen
+from wc_test import sequential
+from wc_test import stoichiometry
+from wc_test import submodels
+from wc_test import store
+from wc_test import trajectory
+import asyncio
+import concurrent.futures
+import functools
+import numpy
+import shutil
 import tempfile
 import unittest
-import wc_kb
-import wc_kb.io
-import wc_lang
-import wc_lang.io
-from wc_onto import onto
-from wc_sim.simulation import Simulation
-from wc_sim.run_results import RunResults
+
+wc_kb = lazy.import_module('wc_kb')
+wc_lang = lazy.import_module('wc_lang')
+
+
+def get_kb(kb, cache_dir=None):
+    """ Get a copy of a knowledge base
+
+    Knowledge bases are only read once per file per process.
+
+    Args:
+        kb (:obj:`wc_kb.KnowledgeBase` or :obj:`str`): knowledge base or path to a
+            knowledge base file
+        cache_dir (:obj:`str`, optional): path to a directory in which to cache parsed
+            knowledge bases between sessions
+
+    Returns:
+        :obj:`wc_kb.KnowledgeBase`: copy of the knowledge base
+    """
+    if not isinstance(kb, wc_kb.KnowledgeBase):
+        kb = cache.parsed_file_cache.get('kb', kb, read_kb, cache_dir=cache_dir)
+    with profiling.profiler.phase('copy'):
+        return kb.copy()
+
+
+def get_model(model, cache_dir=None, copy=True):
+    """ Get a model, or a copy of a model
+
+    Models are only read once per file per process.
+
+    Args:
+        model (:obj:`wc_lang.Model` or :obj:`str`): model or path to a model file
+        cache_dir (:obj:`str`, optional): path to a directory in which to cache parsed
+            models between sessions
+        copy (:obj:`bool`, optional): if :obj:`False`, return the shared model rather than
+            a copy
+
+    Returns:
+        :obj:`wc_lang.Model`: model
+    """
+    if not isinstance(model, wc_lang.Model):
+        model = cache.parsed_file_cache.get('model', model, read_model, cache_dir=cache_dir)
+    if copy:
+        with profiling.profiler.phase('copy'):
+            model = model.copy()
+    return model
+
+
+def read_kb(path):
+    """ Read a knowledge base from a file
+
+    Args:
+        path (:obj:`str`): path to the file
+
+    Returns:
+        :obj:`wc_kb.KnowledgeBase`: knowledge base
+    """
+    with profiling.profiler.phase('read'):
+        return wc_kb.io.Reader().run(path)[wc_kb.KnowledgeBase][0]
+
+
+def read_model(path):
+    """ Read a model from a file
+
+    Args:
+        path (:obj:`str`): path to the file
+
+    Returns:
+        :obj:`wc_lang.Model`: model
+    """
+    with profiling.profiler.phase('read'):
+        return wc_lang.io.Reader().run(path)[wc_lang.Model][0]
 
 
 class KnowledgeBaseTestCase(unittest.TestCase):
@@ -31,14 +118,15 @@ class KnowledgeBaseTestCase(unittest.TestCase):
     Class attributes:
         KB (:obj:`wc_kb.KnowledgeBase` or :obj:`str`): knowledge base or path to a 
             knowledge base file
+        CACHE_DIR (:obj:`str`): path to a directory in which to cache parsed knowledge
+            bases between sessions
     """
     KB = None
+    CACHE_DIR = None
 
     def setUp(self):
-        if isinstance(self.KB, wc_kb.KnowledgeBase):
-            self.kb = self.KB.copy()
-        else:
-            self.kb = wc_kb.io.Reader().run(self.KB)[wc_kb.KnowledgeBase][0]
+        profiling.profiler.test_id = self.id()
+        self.kb = get_kb(self.KB, cache_dir=self.CACHE_DIR)
 
 
 class ModelTestCase(unittest.TestCase):
@@ -48,179 +136,1185 @@ class ModelTestCase(unittest.TestCase):
         model (:obj:`wc_lang.Model`): model
         kb (:obj:`wc_kb.KnowledgeBase`): knowledge base
         results_dir (:obj:`str`): path to directory where results will be stored
+        undo_log (:obj:`perturbation.UndoLog`): log of the perturbations of the model
+        _shared_model (:obj:`wc_lang.Model`): shared model
+        _model_values (:obj:`dict`): perturbable values of the shared model before the test
 
     Class attributes:
         MODEL (:obj:`wc_lang.Model` or :obj:`str`): model or path to a model file
         KB (:obj:`wc_kb.KnowledgeBase` or :obj:`str`): knowledge base or path to a 
             knowledge base file
+        CACHE_DIR (:obj:`str`): path to a directory in which to cache parsed models and
+            knowledge bases between sessions
+        SHARE_MODEL (:obj:`bool`): if :obj:`True`, share one model among all tests rather
+            than copying it for each test. Perturbations made through the methods of this
+            class are reverted by :obj:`tearDown`, which fails if any perturbable value of the
+            model is left changed.
     """
 
     MODEL = None
     KB = None
+    CACHE_DIR = None
+    SHARE_MODEL = False
 
     def setUp(self):
-        if isinstance(self.MODEL, wc_lang.Model):
-            self.model = self.MODEL.copy()
-        else:
-            self.model = wc_lang.io.Reader().run(self.MODEL)[wc_lang.Model][0]
+        profiling.profiler.test_id = self.id()
+        if scheduling.recorder.enabled:
+            scheduling.recorder.start(self.id())
+            self.addCleanup(scheduling.recorder.stop)
+        self.model = self.load_model()
+        self.undo_log = perturbation.UndoLog()
+        if self.SHARE_MODEL:
+            self._shared_model = self.model
+            self._model_values = perturbation.get_perturbable_values(self.model)
 
-        if isinstance(self.KB, wc_kb.KnowledgeBase):
-            self.kb = self.KB.copy()
-        elif self.KB is not None:
-            self.kb = wc_kb.io.Reader().run(self.KB)[wc_kb.KnowledgeBase][0]
+        if self.KB is not None:
+            self.kb = get_kb(self.KB, cache_dir=self.CACHE_DIR)
 
-        self.results_dir = tempfile.mkdtemp()
+        self.results_dir = tempfile.mkdtemp(dir=self.get_results_root())
 
     def tearDown(self):
-        shutil.rmtree(self.results_dir)
+        # revert the perturbations first so that the shared model is restored even if the results can't be removed
+        try:
+            self.undo_perturbations()
+        finally:
+            shutil.rmtree(self.results_dir)
+        if self.SHARE_MODEL:
+            self.assert_model_unchanged()
+
+    def run(self, result=None):
+        if not dependencies.tracker.enabled or self.MODEL is None:
+            return super(ModelTestCase, self).run(result)
+
+        # record the components which the test depends on, and whether it passed
+        if result is None:
+            result = self.defaultTestResult()
+        outcome = dependencies.OutcomeResult(result)
+        dependencies.tracker.start(self.id())
+        super(ModelTestCase, self).run(outcome)
+        dependencies.tracker.stop(self.get_source_model(), dependencies.get_source_hash(self.__class__),
+                                  outcome.passed)
+        return result
+
+    @classmethod
+    def get_source_model(cls):
+        """ Get the unperturbed model of the tests
+
+        Returns:
+            :obj:`wc_lang.Model`: :obj:`MODEL`, or the model read from :obj:`MODEL`; the model
+                is shared and shouldn't be modified
+        """
+        return get_model(cls.MODEL, cache_dir=cls.CACHE_DIR, copy=False)
+
+    def get_model_components(self):
+        """ Get the components of :obj:`get_source_model` which the model of the test contains
+
+        Returns:
+            :obj:`dict`: dictionary which maps each type of component to the ids of the
+                components of the type, or :obj:`None` if the model contains all components
+        """
+        return None
+
+    def track_model(self):
+        """ Record that the test depends on all of the components of its model (see
+        :obj:`dependencies`)
+        """
+        if dependencies.tracker.enabled:
+            components = self.get_model_components()
+            if components is None:
+                dependencies.tracker.add_model()
+            else:
+                for component_type, ids in components.items():
+                    dependencies.tracker.add(component_type, ids)
+
+    def load_model(self):
+        """ Get the model of a test
+
+        Returns:
+            :obj:`wc_lang.Model`: copy of :obj:`MODEL`, or :obj:`MODEL` itself if :obj:`SHARE_MODEL`
+        """
+        return get_model(self.MODEL, cache_dir=self.CACHE_DIR, copy=not self.SHARE_MODEL)
+
+    def get_results_root(self):
+        """ Get the directory in which to create :obj:`results_dir`
+
+        Returns:
+            :obj:`str`: path to the directory, or :obj:`None` for the default temporary directory
+        """
+        return None
+
+    def profile(self, phase):
+        """ Get a context manager which records the wall time, CPU time, and peak memory of a
+        phase of the test, if profiling is enabled (see :obj:`profiling`)
+
+        Args:
+            phase (:obj:`str`): name of the phase (e.g., :obj:`analysis`)
+
+        Returns:
+            :obj:`profiling.Phase` or :obj:`profiling.NullPhase`: context manager
+        """
+        return profiling.profiler.phase(phase)
+
+    def undo_perturbations(self):
+        """ Revert all of the perturbations made to the model """
+        self.undo_log.undo()
+
+    def assert_model_unchanged(self):
+        """ Check that the perturbable values of the shared model are the same as before the test
+
+        Raises:
+            :obj:`AssertionError`: if any value of the model is changed
+        """
+        values = perturbation.get_perturbable_values(self._shared_model)
+        changed = perturbation.get_changed_values(self._model_values, values)
+        if changed:
+            self.fail('The following values of the shared model were left changed:\n  {}'.format(
+                '\n  '.join('{} {} {}'.format(type, id, attr) for type, id, attr in changed)))
+
+    def get_reaction_imbalances(self, atol=1e-8):
+        """ Get the element and charge imbalances of the reactions of the model
+
+        The imbalances are calculated by multiplying sparse reactions x species stoichiometry
+        and species x elements composition matrices, which are built from the current model
+        on each call so that changes to participants, formulae, and charges are checked.
+        Reactions which involve species whose empirical formulae are undefined are not checked.
+
+        Args:
+            atol (:obj:`float`, optional): absolute tolerance
+
+        Returns:
+            :obj:`list` of :obj:`stoichiometry.ReactionImbalance`: imbalance of each imbalanced
+                reaction
+        """
+        self.track_model()
+        return stoichiometry.get_reaction_imbalances(stoichiometry.get_stoichiometry(self.model),
+                                                     stoichiometry.get_composition(self.model), atol=atol)
+
+    def assert_reactions_balanced(self, atol=1e-8):
+        """ Check that each reaction is element and charge balanced
+
+        Args:
+            atol (:obj:`float`, optional): absolute tolerance
+
+        Raises:
+            :obj:`AssertionError`: if one or more reactions is unbalanced
+        """
+        imbalances = self.get_reaction_imbalances(atol=atol)
+        if imbalances:
+            self.fail('The following reactions are not balanced:\n  {}'.format(
+                '\n  '.join(str(imbalance) for imbalance in imbalances)))
+
+    def get_orphan_species(self):
+        """ Get the species which don't participate in any reaction
+
+        Returns:
+            :obj:`list` of :obj:`str`: ids of the orphan species
+        """
+        self.track_model()
+        return network.get_orphan_species(stoichiometry.get_stoichiometry(self.model))
+
+    def get_dead_end_species(self):
+        """ Get the species which can only be produced or only be consumed
+
+        Returns:
+            :obj:`list` of :obj:`str`: ids of the dead-end species
+        """
+        self.track_model()
+        return network.get_dead_end_species(stoichiometry.get_stoichiometry(self.model))
+
+    def get_blocked_reactions(self):
+        """ Get the reactions which can never fire because they have no active rate law, or
+        because one of their reactants is initially absent and can never be produced
+
+        Returns:
+            :obj:`list` of :obj:`str`: ids of the blocked reactions
+        """
+        self.track_model()
+        return network.get_blocked_reactions(stoichiometry.get_stoichiometry(self.model),
+                                             network.get_rate_law_activities(self.model),
+                                             network.get_init_populations(self.model))
+
+    def get_mass_imbalances(self, atol=1e-8):
+        """ Get the reactions which aren't mass balanced; reactions which involve species whose
+        molecular weights are undefined are not checked
+
+        Args:
+            atol (:obj:`float`, optional): absolute tolerance (g mol^-1)
+
+        Returns:
+            :obj:`dict`: dictionary which maps the id of each reaction which isn't mass
+                balanced to the net molecular weight that it produces
+        """
+        self.track_model()
+        stoich = stoichiometry.get_stoichiometry(self.model)
+        weights = model_index.get_index(self.model).get_molecular_weights(stoich.species_ids)
+        return network.get_quantity_imbalances(stoich, numpy.where(weights > 0, weights, numpy.nan), atol=atol)
+
+    def get_inactive_submodels(self):
+        """ Get the submodels which have no reactions with active rate laws
+
+        Returns:
+            :obj:`list` of :obj:`str`: ids of the inactive submodels
+        """
+        self.track_model()
+        return network.get_inactive_submodels(self.model, network.get_rate_law_activities(self.model))
 
     def get_species(self, id):
-        return self.model.species.get_one(id=id)
+        dependencies.tracker.add('species', [id])
+        return model_index.get_index(self.model).get_species(id)
 
     def get_reaction(self, id):
-        return self.model.reactions.get_one(id=id)
+        dependencies.tracker.add('reactions', [id])
+        return model_index.get_index(self.model).get_reaction(id)
+
+    def get_parameter(self, id):
+        dependencies.tracker.add('parameters', [id])
+        return model_index.get_index(self.model).get_parameter(id)
+
+    def get_submodel(self, id):
+        dependencies.tracker.add('submodels', [id])
+        return model_index.get_index(self.model).get_submodel(id)
 
     """ Methods to perturb model """
     # todo: use wc_lang.transform.ChangeValueTransform
 
     def select_submodels(self, mod_submodels):
         """ Turn off all submodels, except the ones listed in submodel_ids """
-        for id, status in mod_submodels.items():
-            if not status:
-                submodel = self.model.submodels.get_one(id=id)
-                for reaction in submodel.reactions:
-                    for rate_law in reaction.rate_laws:
-                        rate_law.expression.parameters.get_one(type=onto['WC:k_cat']).value = 0
+        dependencies.tracker.add('submodels', mod_submodels)
+        perturbation.select_submodels(self.model, mod_submodels, undo_log=self.undo_log)
+
+    def extract_submodels(self, submodel_ids, boundary='fixed'):
+        """ Replace the model with a reduced copy which contains only selected submodels and
+        the species and parameters that they reach
+
+        Unlike :obj:`select_submodels`, the reactions of the other submodels are removed
+        rather than turned off, so that they are not simulated.
+
+        Args:
+            submodel_ids (:obj:`list` of :obj:`str`): ids of the submodels to keep
+            boundary (:obj:`str`, optional): treatment of the species which also participate
+                in the other submodels (see :obj:`submodels.BOUNDARY_MODES`)
+
+        Returns:
+            :obj:`list` of :obj:`str`: ids of the boundary species
+        """
+        dependencies.tracker.add('submodels', submodel_ids)
+        self.model, boundary_species_ids = submodels.extract_submodels(self.model, submodel_ids, boundary=boundary)
+        return boundary_species_ids
 
     def change_parameter_values(self, mod_parameters):
-        for id, value in mod_parameters.items():
-            self.model.parameters.get_one(id=id).value = value
+        dependencies.tracker.add('parameters', mod_parameters)
+        perturbation.change_parameter_values(self.model, mod_parameters, undo_log=self.undo_log)
 
     def change_species_mean_init_concentrations(self, mod_species):
-        for id, mean in mod_species.items():
-            self.model.species.get_one(id=id).distribution_init_concentration.mean = mean
+        dependencies.tracker.add('species', mod_species)
+        perturbation.change_species_mean_init_concentrations(self.model, mod_species, undo_log=self.undo_log)
 
     def change_reaction_k_cat_parameter_values(self, mod_reactions):
-        for id, k_cat_value in mod_reactions.items():
-            reaction = self.model.reactions.get_one(id=id)
-            reaction.rate_laws[0].expression.parameters.get_one(type=onto['WC:k_cat']).value = k_cat_value
+        dependencies.tracker.add('reactions', mod_reactions)
+        perturbation.change_reaction_k_cat_parameter_values(self.model, mod_reactions, undo_log=self.undo_log)
+
+
+class ModelStructureTestCase(ModelTestCase):
+    """ Built-in structural tests of WC models
+
+    Subclasses which define :obj:`MODEL` check that every reaction is element, charge,
+    and mass balanced, that every species participates in reactions which can produce and
+    consume it, that every reaction can fire, and that every submodel has an active rate
+    law. The tests are skipped if :obj:`MODEL` is not defined.
+    """
+
+    def setUp(self):
+        if self.MODEL is None:
+            self.skipTest('MODEL is not defined')
+        super(ModelStructureTestCase, self).setUp()
+
+    def test_reactions_balanced(self):
+        self.assert_reactions_balanced()
+
+    def test_mass_balanced(self):
+        imbalances = self.get_mass_imbalances()
+        if imbalances:
+            self.fail('The following reactions are not mass balanced:\n  {}'.format(
+                '\n  '.join('{}: {:+g} g mol^-1'.format(id, delta) for id, delta in imbalances.items())))
+
+    def test_no_orphan_species(self):
+        orphans = self.get_orphan_species()
+        if orphans:
+            self.fail('The following species do not participate in any reaction:\n  {}'.format('\n  '.join(orphans)))
+
+    def test_no_dead_end_species(self):
+        dead_ends = self.get_dead_end_species()
+        if dead_ends:
+            self.fail('The following species can only be produced or only be consumed:\n  {}'.format(
+                '\n  '.join(dead_ends)))
+
+    def test_no_blocked_reactions(self):
+        blocked = self.get_blocked_reactions()
+        if blocked:
+            self.fail('The following reactions can never fire:\n  {}'.format('\n  '.join(blocked)))
+
+    def test_submodels_active(self):
+        inactive = self.get_inactive_submodels()
+        if inactive:
+            self.fail('The following submodels have no active rate laws:\n  {}'.format('\n  '.join(inactive)))
 
 
 class SimulationTestCase(ModelTestCase):
     """ Class to test simulations of models
+
+    Class attributes:
+        N_WORKERS (:obj:`int`): default number of worker processes to use to run
+            replicate simulations
+        SIMULATION_CACHE_DIR (:obj:`str`): path to a directory in which to cache the results
+            of seeded simulations between sessions
+        SIMULATION_CACHE_MAX_SIZE (:obj:`int`): maximum size of the cache of simulation
+            results (bytes)
+        RESULTS_BACKEND (:obj:`str`): where the results of simulations are saved
+            (see :obj:`parallel.RESULTS_BACKENDS`)
+
+            * :obj:`disk`: the default temporary directory
+            * :obj:`tmpfs`: a RAM-backed directory
+            * :obj:`memory`: a RAM-backed directory, from which the components listed in
+              :obj:`MEMORY_RESULTS_COMPONENTS` are loaded into memory, after which the
+              directory is deleted
+
+        MEMORY_RESULTS_COMPONENTS (:obj:`list` of :obj:`str`): components of the results
+            which are loaded into memory by the :obj:`memory` backend
     """
 
+    N_WORKERS = 1
+    SIMULATION_CACHE_DIR = None
+    SIMULATION_CACHE_MAX_SIZE = 10 * 2 ** 30
+    RESULTS_BACKEND = 'disk'
+    MEMORY_RESULTS_COMPONENTS = ('populations',)
+
+    def setUp(self):
+        super(SimulationTestCase, self).setUp()
+        self._simulator = None
+        self._simulator_values = None
+        self._simulation_pools = []
+        self._simulation_pool_values = None
+        self._model_broadcasts = []
+        self._model_broadcast_values = None
+
+    def tearDown(self):
+        for pool in self._simulation_pools:
+            pool.shutdown()
+        self._simulation_pools = []
+        for shared_model in self._model_broadcasts:
+            shared_model.close()
+        self._model_broadcasts = []
+        super(SimulationTestCase, self).tearDown()
+
+    def get_results_root(self):
+        """ Get the directory in which to create :obj:`results_dir` for :obj:`RESULTS_BACKEND`
+
+        Returns:
+            :obj:`str`: path to the directory, or :obj:`None` for the default temporary directory
+        """
+        return parallel.get_results_root(self.RESULTS_BACKEND)
+
     """ Auxiliary methods """
 
-    def simulate(self, end_time, checkpoint_period=None, n_sims=1):
-        results = []
+    def get_simulator(self):
+        """ Get a simulator of the model which is reused for each serial simulation and
+        scan point
+
+        If :obj:`SHARE_MODEL`, a copy of the model is simulated, because setting up a
+        simulation may change its model outside of :obj:`undo_log`. The copy is replaced
+        when the perturbable values of the model change.
+
+        Returns:
+            :obj:`parallel.Simulator`: simulator
+        """
+        values = perturbation.get_perturbable_values(self.model) if self.SHARE_MODEL else None
+        if self._simulator is None or self._simulator.source is not self.model \
+                or values != self._simulator_values:
+            if self.SHARE_MODEL:
+                with profiling.profiler.phase('copy'):
+                    model = self.model.copy()
+                self._simulator = parallel.Simulator(model, source=self.model)
+            else:
+                self._simulator = parallel.Simulator(self.model)
+            self._simulator_values = values
+        return self._simulator
+
+    def get_shared_model(self):
+        """ Get a copy of the model which is pickled once and shared by all of the worker
+        processes of the ensembles, scans, and pools of the test
 
-        simulation = Simulation(self.model)
-        for i_sim in range(n_sims):
-            temp_dir = tempfile.mkdtemp(dir=self.results_dir)
-            results_dir = simulation.run(time_max=end_time,
-                                         results_dir=temp_dir,
-                                         checkpoint_period=checkpoint_period).results_dir
+        The copy is replaced when the model or its perturbable values change. The previous
+        copies are kept until :obj:`tearDown`, because workers which are still starting may
+        need them.
 
-            run_results = RunResults(results_dir)
-            results.append(run_results)
-        return results
+        Returns:
+            :obj:`parallel.SharedModel`: shared model, or :obj:`None` if the worker processes
+                inherit the model (see :obj:`parallel.workers_inherit_model`)
+        """
+        if parallel.workers_inherit_model():
+            return None
+        values = perturbation.get_perturbable_values(self.model)
+        shared_model = self._model_broadcasts[-1] if self._model_broadcasts else None
+        if (shared_model is None or self._model_broadcast_values[0] is not self.model
+                or self._model_broadcast_values[1] != values):
+            shared_model = parallel.SharedModel(self.model)
+            self._model_broadcasts.append(shared_model)
+            self._model_broadcast_values = (self.model, values)
+        return shared_model
+
+    def simulate(self, end_time, checkpoint_period=None, n_sims=1, seed=None, n_workers=None,
+                 use_cache=True):
+        """ Simulate the model one or more times
+
+        Replicate :obj:`i_sim` is seeded with :obj:`seed + i_sim` so that the results are
+        the same whether the replicates are run serially or in parallel.
+
+        Args:
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`, optional): checkpoint period
+            n_sims (:obj:`int`, optional): number of replicate simulations
+            seed (:obj:`int`, optional): seed of the first replicate; if :obj:`None`, a
+                random seed is chosen
+            n_workers (:obj:`int`, optional): number of worker processes; defaults to
+                :obj:`N_WORKERS`
+            use_cache (:obj:`bool`, optional): if :obj:`False`, bypass the cache of
+                simulation results
+
+        Returns:
+            :obj:`list` of :obj:`RunResults`: results of each replicate
+        """
+        seeds = parallel.get_seeds(n_sims, seed=seed)
+        results_dirs = self.run_simulations(end_time, checkpoint_period, seeds, n_workers=n_workers,
+                                            use_cache=use_cache and seed is not None)
+        return [parallel.load_run_results(results_dir) for results_dir in results_dirs]
+
+    def run_simulations(self, end_time, checkpoint_period, seeds, perturbations=None, n_workers=None,
+                        use_cache=True):
+        """ Simulate the model several times, getting the results of previous simulations of the
+        same model with the same arguments from :obj:`SIMULATION_CACHE_DIR`
+
+        Args:
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`): checkpoint period
+            seeds (:obj:`list` of :obj:`int`): seed for each simulation
+            perturbations (:obj:`list` of :obj:`dict`, optional): perturbation of each simulation
+            n_workers (:obj:`int`, optional): number of worker processes; defaults to
+                :obj:`N_WORKERS`
+            use_cache (:obj:`bool`, optional): if :obj:`False`, bypass the cache of
+                simulation results
+
+        Returns:
+            :obj:`list` of :obj:`str` or :obj:`parallel.MemoryRunResults`: path to the results of
+                each simulation, or its in-memory results (see :obj:`parallel.load_run_results`)
+        """
+        if n_workers is None:
+            n_workers = self.N_WORKERS
+        if perturbations is None:
+            perturbations = [None] * len(seeds)
+
+        model_hash = self._record_simulations(end_time, checkpoint_period, seeds, perturbations)
+
+        results_dirs = [None] * len(seeds)
+        keys = [None] * len(seeds)
+        if use_cache and self.SIMULATION_CACHE_DIR:
+            results_cache = cache.SimulationResultsCache(self.SIMULATION_CACHE_DIR,
+                                                         max_size=self.SIMULATION_CACHE_MAX_SIZE)
+            if model_hash is None:
+                model_hash = cache.get_model_hash(self.model)
+            for i_sim, (seed, sim_perturbation) in enumerate(zip(seeds, perturbations)):
+                keys[i_sim] = results_cache.get_key(model_hash, end_time, checkpoint_period, seed,
+                                                    perturbation=sim_perturbation)
+                results_dirs[i_sim] = results_cache.get(keys[i_sim])
+
+        i_sims = [i_sim for i_sim, results_dir in enumerate(results_dirs) if results_dir is None]
+        temp_dirs = [tempfile.mkdtemp(dir=self.results_dir) for i_sim in i_sims]
+        new_results_dirs = parallel.run_simulations(self.model, end_time, checkpoint_period,
+                                                    [seeds[i_sim] for i_sim in i_sims], temp_dirs,
+                                                    perturbations=[perturbations[i_sim] for i_sim in i_sims],
+                                                    n_workers=n_workers,
+                                                    simulator=self.get_simulator() if n_workers <= 1 and i_sims else None,
+                                                    in_memory=self.get_in_memory_components(),
+                                                    shared_model=self.get_shared_model() if n_workers > 1 and i_sims else None)
+        for i_sim, results_dir in zip(i_sims, new_results_dirs):
+            if keys[i_sim] and isinstance(results_dir, str):
+                results_cache.set(keys[i_sim], results_dir)
+            results_dirs[i_sim] = results_dir
+
+        return results_dirs
+
+    def _record_simulations(self, end_time, checkpoint_period, seeds, perturbations):
+        """ Record the components which simulations depend on (see :obj:`dependencies`) and the
+        arguments of the simulations (see :obj:`scheduling`)
+
+        Args:
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`): checkpoint period
+            seeds (:obj:`list` of :obj:`int`): seed for each simulation
+            perturbations (:obj:`list` of :obj:`dict`): perturbation of each simulation
+
+        Returns:
+            :obj:`str`: hash of the model, or :obj:`None` if it wasn't needed
+        """
+        self.track_model()
+        for sim_perturbation in perturbations:
+            dependencies.tracker.add_perturbation(sim_perturbation)
+
+        model_hash = None
+        if scheduling.recorder.enabled:
+            model_hash = cache.get_model_hash(self.model)
+            scheduling.recorder.add_simulations(model_hash, end_time, checkpoint_period, len(seeds))
+        return model_hash
+
+    def get_in_memory_components(self):
+        """ Get the components of the results of simulations to load into memory
+
+        Returns:
+            :obj:`list` of :obj:`str`: components, or :obj:`None` if results are kept on disk
+        """
+        if self.RESULTS_BACKEND == 'memory':
+            return self.MEMORY_RESULTS_COMPONENTS
+        return None
+
+    def simulate_from_final_populations(self, warm_up_time, perturbations, end_time, checkpoint_period=None,
+                                        seed=None, n_workers=None, use_cache=True):
+        """ Simulate a common warm up of the model once, and then simulate each perturbation of
+        the model re-initialized from the final populations of the warm up
+
+        The perturbed simulations don't continue the warm up from a checkpoint, because
+        :obj:`wc_sim` doesn't support resuming simulations from checkpoints. Instead, each perturbed
+        simulation is a new simulation whose initial populations are the populations of the
+        final checkpoint of the warm up. Its time restarts at 0, and the other components of
+        the state of the warm up, such as the state of its random number generator and of its
+        submodels, are not carried over.
+
+        Args:
+            warm_up_time (:obj:`float`): duration of the warm up
+            perturbations (:obj:`list` of :obj:`dict`): perturbation of each simulation (see
+                :obj:`perturbation.apply_perturbation`)
+            end_time (:obj:`float`): end time of each perturbed simulation, measured from 0
+            checkpoint_period (:obj:`float`, optional): checkpoint period
+            seed (:obj:`int`, optional): seed of the warm up; perturbed simulation :obj:`i` is
+                seeded with :obj:`seed + 1 + i`
+            n_workers (:obj:`int`, optional): number of worker processes; defaults to
+                :obj:`N_WORKERS`
+            use_cache (:obj:`bool`, optional): if :obj:`False`, bypass the cache of
+                simulation results
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`RunResults`: results of the warm up
+                * :obj:`list` of :obj:`RunResults`: results of each perturbed simulation
+        """
+        seeds = parallel.get_seeds(1 + len(perturbations), seed=seed)
+        use_cache = use_cache and seed is not None
+
+        warm_up_results_dir = self.run_simulations(warm_up_time, checkpoint_period or warm_up_time, seeds[0:1],
+                                                   n_workers=1, use_cache=use_cache)[0]
+        warm_up_results = parallel.load_run_results(warm_up_results_dir)
+        warm_up_trajectory = trajectory.get_trajectory(warm_up_results)
+        init_populations = dict(zip(warm_up_trajectory.species_ids, warm_up_trajectory.final().tolist()))
+
+        reinitialized_perturbations = []
+        for reinitialized_perturbation in perturbations:
+            reinitialized_perturbation = dict(reinitialized_perturbation)
+            reinitialized_perturbation['init_populations'] = init_populations
+            reinitialized_perturbations.append(reinitialized_perturbation)
+
+        results_dirs = self.run_simulations(end_time, checkpoint_period, seeds[1:],
+                                            perturbations=reinitialized_perturbations,
+                                            n_workers=n_workers, use_cache=use_cache)
+        return (warm_up_results, [parallel.load_run_results(results_dir) for results_dir in results_dirs])
+
+    def estimate_statistic(self, statistic, end_time, checkpoint_period=None, half_width=None,
+                           expected=None, margin=None, confidence=0.95, batch_size=None,
+                           min_sims=10, max_sims=100, seed=None, n_workers=None):
+        """ Simulate replicates in parallel batches until the confidence interval of the mean of
+        a statistic is narrow enough, or until it lies within or outside a margin of an expected
+        value, or until :obj:`max_sims` replicates have been simulated
+
+        Replicate :obj:`i_sim` is seeded with :obj:`seed + i_sim`, as in :obj:`simulate`.
+
+        Because the interval is checked after each batch, each check uses a Bonferroni-corrected
+        confidence level (see :obj:`sequential.get_look_confidence`), and the returned estimate
+        has this level. Identical replicates, which are common for integer populations of short
+        simulations, have a zero-width interval, so :obj:`min_sims` should be large enough
+        that all of the replicates are unlikely to be identical unless the statistic is
+        deterministic.
+
+        Args:
+            statistic (:obj:`callable`): function which maps the :obj:`RunResults` of a replicate
+                to a :obj:`float`
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`, optional): checkpoint period
+            half_width (:obj:`float`, optional): stop once the half width of the confidence
+                interval is at most this value
+            expected (:obj:`float`, optional): stop once the confidence interval lies within
+                or outside :obj:`margin` of this value
+            margin (:obj:`float`, optional): margin around :obj:`expected`
+            confidence (:obj:`float`, optional): overall confidence level of all of the checks
+            batch_size (:obj:`int`, optional): number of replicates simulated between checks;
+                defaults to the number of workers
+            min_sims (:obj:`int`, optional): minimum number of replicates; at least 2
+            max_sims (:obj:`int`, optional): maximum number of replicates; at least :obj:`min_sims`
+            seed (:obj:`int`, optional): seed of the first replicate; if :obj:`None`, a random
+                seed is chosen
+            n_workers (:obj:`int`, optional): number of worker processes; defaults to
+                :obj:`N_WORKERS`
+
+        Returns:
+            :obj:`sequential.SequentialEstimate`: estimate, including the number of replicates used
+
+        Raises:
+            :obj:`ValueError`: if no stopping criterion is defined, or if :obj:`min_sims` is
+                less than 2 or greater than :obj:`max_sims`
+        """
+        if half_width is None and (expected is None or margin is None):
+            raise ValueError('Either `half_width` or `expected` and `margin` must be defined')
+        if not 2 <= min_sims <= max_sims:
+            raise ValueError('`min_sims` must be at least 2 and at most `max_sims`')
+        if n_workers is None:
+            n_workers = self.N_WORKERS
+        batch_size = batch_size or max(n_workers, 1)
+        look_confidence = sequential.get_look_confidence(
+            confidence, sequential.get_n_looks(min_sims, max_sims, batch_size))
+
+        seeds = parallel.get_seeds(max_sims, seed=seed)
+        values = []
+        while len(values) < max_sims:
+            n_batch = max(batch_size, min_sims - len(values))
+            batch_seeds = seeds[len(values):len(values) + n_batch]
+            for results_dir in self.run_simulations(end_time, checkpoint_period, batch_seeds,
+                                                    n_workers=n_workers, use_cache=seed is not None):
+                run_results = parallel.load_run_results(results_dir)
+                with profiling.profiler.phase('analysis'):
+                    values.append(statistic(run_results))
+
+            estimate = sequential.SequentialEstimate(values, confidence=look_confidence)
+            if len(values) >= min_sims and estimate.is_decided(half_width=half_width, expected=expected, margin=margin):
+                estimate.converged = True
+                break
+
+        return estimate
+
+    def assert_statistic(self, statistic, expected, margin, end_time, checkpoint_period=None, **kwargs):
+        """ Check that the mean of a statistic across replicates is within a margin of an expected
+        value, simulating only as many replicates as needed to decide
+
+        Args:
+            statistic (:obj:`callable`): function which maps the :obj:`RunResults` of a replicate
+                to a :obj:`float`
+            expected (:obj:`float`): expected value
+            margin (:obj:`float`): margin around the expected value
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`, optional): checkpoint period
+            **kwargs: additional arguments to :obj:`estimate_statistic`
+
+        Returns:
+            :obj:`sequential.SequentialEstimate`: estimate, including the number of replicates used
+
+        Raises:
+            :obj:`AssertionError`: if the confidence interval of the statistic is not within the
+                margin of the expected value
+        """
+        estimate = self.estimate_statistic(statistic, end_time, checkpoint_period=checkpoint_period,
+                                           expected=expected, margin=margin, **kwargs)
+        if not estimate.is_within(expected, margin):
+            self.fail('Statistic {} is not within {:g} of {:g}'.format(str(estimate), margin, expected))
+        return estimate
 
     """ Methods to obtain numbers to compare to exp data """
 
     def delta_conc(self, species, run_results):
+        """ Get the changes in the populations of species over a simulation
 
-        delta_conc = {}
-        for specie_id in species:
-            specie = self.get_species(specie_id)
-            concentration = run_results.get('populations')[specie.id].values
-            delta_conc[specie_id] = concentration[len(concentration)-1]-concentration[0]
+        Args:
+            species (:obj:`list` of :obj:`str`): ids of species
+            run_results (:obj:`RunResults`): results of a simulation
 
-        return delta_conc
+        Returns:
+            :obj:`dict`: dictionary which maps the id of each species to the change in its population
+        """
+        run_trajectory = trajectory.get_trajectory(run_results)
+        with profiling.profiler.phase('analysis'):
+            delta = run_trajectory.delta(species)
+            return dict(zip(species, delta.tolist()))
 
     def avg_conc_time(self, target_specie_ids, end_time, checkpoint_period):
-        # TODO: Test
-        avg_conc = {}
+        """ Simulate the model and get the mean populations of species over time
+
+        Args:
+            target_specie_ids (:obj:`list` of :obj:`str`): ids of species
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`): checkpoint period
+
+        Returns:
+            :obj:`dict`: dictionary which maps the id of each species to its mean population
+        """
+        run_results = self.simulate(end_time=end_time, checkpoint_period=checkpoint_period)[0]
+        run_trajectory = trajectory.get_trajectory(run_results)
+        with profiling.profiler.phase('analysis'):
+            avg_conc = run_trajectory.mean(target_specie_ids)
+            return dict(zip(target_specie_ids, avg_conc.tolist()))
+
+    def reduce_runs(self, n, end_time, checkpoint_period, species_ids=None, keep_results=False,
+                    reservoir_size=0, seed=None, n_workers=None):
+        """ Simulate the model several times and fold the populations of each replicate into
+        running statistics as soon as it finishes
+
+        Args:
+            n (:obj:`int`): number of replicates
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`): checkpoint period
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults to all
+                species
+            keep_results (:obj:`bool`, optional): if :obj:`False`, delete the results of each
+                replicate once it has been reduced
+            reservoir_size (:obj:`int`, optional): number of replicates sampled to estimate
+                quantiles
+            seed (:obj:`int`, optional): seed of the first replicate; if :obj:`None`, a random
+                seed is chosen
+            n_workers (:obj:`int`, optional): number of worker processes; defaults to
+                :obj:`N_WORKERS`
+
+        Returns:
+            :obj:`ensemble.EnsembleStatistics`: statistics of the populations of the species
+        """
+        if n_workers is None:
+            n_workers = self.N_WORKERS
+
+        seeds = parallel.get_seeds(n, seed=seed)
+        temp_dirs = [tempfile.mkdtemp(dir=self.results_dir) for i_sim in range(n)]
+        stats = ensemble.EnsembleStatistics(species_ids=species_ids, reservoir_size=reservoir_size, seed=seeds[0])
+        for results_dir in parallel.iter_simulations(self.model, end_time, checkpoint_period,
+                                                     seeds, temp_dirs, n_workers=n_workers,
+                                                     simulator=self.get_simulator() if n_workers <= 1 else None,
+                                                     in_memory=self.get_in_memory_components(),
+                                                     shared_model=self.get_shared_model() if n_workers > 1 else None):
+            run_trajectory = trajectory.Trajectory.from_run_results(parallel.load_run_results(results_dir))
+            with profiling.profiler.phase('analysis'):
+                stats.add(run_trajectory)
+            if not keep_results and isinstance(results_dir, str):
+                shutil.rmtree(results_dir)
+        return stats
+
+    def avg_conc_runs(self, n, target_specie_ids, end_time, checkpoint_period=None, **kwargs):
+        """ Simulate the model several times and get the mean populations of species at each
+        time point across the replicates
 
-        # Run model
-        run_results = self.simulate(end_time=end_time, checkpoint_period=checkpoint_period)
+        Args:
+            n (:obj:`int`): number of replicates
+            target_specie_ids (:obj:`list` of :obj:`str`): ids of species
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`, optional): checkpoint period; defaults to
+                :obj:`end_time`
+            **kwargs: additional arguments to :obj:`reduce_runs`
 
-        # Calculate avg concentration of target species
-        for target_specie_id in target_specie_ids:
-            target_specie = self.get_species(target_specie_id)
-            concentration = run_results.get('populations')[target_specie.id][:].values  # convert panda.series to np.ndarray
-            avg_conc[target_specie_id] = concentration.mean()
+        Returns:
+            :obj:`dict`: dictionary which maps the id of each species to its mean population
+                at each time point
+        """
+        stats = self.reduce_runs(n, end_time, checkpoint_period or end_time, species_ids=target_specie_ids, **kwargs)
+        return stats.to_dict(stats.populations.mean)
 
-        return avg_conc
+    def get_growth_rate(self, end_time, checkpoint_period=None, n_sims=1, **kwargs):
+        """ Simulate the model and fit the exponential growth rate of the total mass of the
+        species across all of the replicates
 
-    def avg_conc_runs(self, n, target_specie_ids, end_time):
-        # TODO: implement
-        pass
+        Args:
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`, optional): checkpoint period; defaults to a tenth
+                of :obj:`end_time`
+            n_sims (:obj:`int`, optional): number of replicates
+            **kwargs: additional arguments to :obj:`simulate`
 
-    def get_growth_rate(self, end_time):
-        # TODO: implement
-        pass
+        Returns:
+            :obj:`float`: growth rate (s^-1)
+        """
+        results = self.simulate(end_time, checkpoint_period=checkpoint_period or end_time / 10.,
+                                n_sims=n_sims, **kwargs)
+        trajectories = [trajectory.get_trajectory(run_results) for run_results in results]
 
-    def sim_scan_parameters(self, mod_parameters, end_time, checkpoint_period):
+        with profiling.profiler.phase('analysis'):
+            weights = model_index.get_index(self.model).get_molecular_weights(trajectories[0].species_ids)
+            masses = numpy.array([weights.dot(traj.populations) for traj in trajectories]) / trajectory.AVOGADRO
 
-        # Check if all dictionary values have same length
-        lengths = []
-        for parameter_id in mod_parameters:
-            lengths.append(len(mod_parameters[parameter_id]))
+            rates, _ = trajectory.fit_exponential_growth(trajectories[0].times, masses)
+            return rates.mean()
 
-        if lengths.count(lengths[0]) != len(lengths):
-            raise SyntaxError('All values of mod_parameters should be a list with equal length')
+    def sim_scan(self, points, end_time, checkpoint_period=None, seed=None, n_workers=None,
+                 use_cache=True):
+        """ Simulate each point of a scan
 
-        # Step over the defined parameter values and
-        scan_results = []
-        for value in mod_parameters[parameter_id]:  # step over each paramater value
-            for parameter_id in mod_parameters:  # step over each parameters
-                self.model.parameters.get_one(id=parameter_id).value = value
+        Each point is simulated with its own perturbation of the model. All of the points
+        are simulated with the same seed so that differences between their results are
+        only due to their perturbations.
 
-            run_result = self.simulate(end_time=end_time, checkpoint_period=checkpoint_period)[0]
-            scan_results.append(run_result)
+        Args:
+            points (:obj:`list` of :obj:`dict`): scan points (see :obj:`scan.get_scan_points`)
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`, optional): checkpoint period
+            seed (:obj:`int`, optional): seed; if :obj:`None`, a random seed is chosen
+            n_workers (:obj:`int`, optional): number of worker processes; defaults to
+                :obj:`N_WORKERS`
+            use_cache (:obj:`bool`, optional): if :obj:`False`, bypass the cache of
+                simulation results
 
-        return scan_results
+        Returns:
+            :obj:`list` of :obj:`RunResults`: results of each point
+        """
+        seeds = parallel.get_seeds(1, seed=seed) * len(points)
+        results_dirs = self.run_simulations(end_time, checkpoint_period, seeds, perturbations=points,
+                                            n_workers=n_workers, use_cache=use_cache and seed is not None)
+        return [parallel.load_run_results(results_dir) for results_dir in results_dirs]
 
-    def sim_scan_species(self, mod_species, end_time, checkpoint_period):
+    def sim_scan_to_store(self, filename, points, end_time, checkpoint_period=None, n_sims=1,
+                          seed=None, n_workers=None, compression='gzip'):
+        """ Simulate each point of a scan one or more times, and save the populations of all
+        of the points and replicates to a single file
 
-        # Check if all dictionary values have same length
-        lengths = []
-        for species_id in mod_species:
-            lengths.append(len(mod_species[species_id]))
+        The populations of each replicate are saved as soon as it finishes, and its results
+        directory is then deleted. The i-th replicates of all of the points are simulated
+        with the same seed.
 
-        if lengths.count(lengths[0]) != len(lengths):
-            raise SyntaxError('All values of mod_species should be a list with equal length')
+        Args:
+            filename (:obj:`str`): path to save the populations
+            points (:obj:`list` of :obj:`dict`): scan points (see :obj:`scan.get_scan_points`)
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`, optional): checkpoint period; defaults to
+                :obj:`end_time`
+            n_sims (:obj:`int`, optional): number of replicates of each point
+            seed (:obj:`int`, optional): seed of the first replicate; if :obj:`None`, a random
+                seed is chosen
+            n_workers (:obj:`int`, optional): number of worker processes; defaults to
+                :obj:`N_WORKERS`
+            compression (:obj:`str`, optional): compression filter (see :obj:`store.ResultsStore.create`)
 
-        # Step over the defined parameter values and
-        scan_results = []
-        for value_index in range(0, lengths[0]):  # step over each paramater value
-            for specie_id in mod_species:  # step over each parameters
-                self.get_species(specie_id).distribution_init_concentration.mean = mod_species[specie_id][value_index]
+        Returns:
+            :obj:`store.ResultsStore`: store, opened for reading
+        """
+        if n_workers is None:
+            n_workers = self.N_WORKERS
+
+        seeds = parallel.get_seeds(n_sims, seed=seed)
+        all_seeds = seeds * len(points)
+        perturbations = [point for point in points for i_sim in range(n_sims)]
+        temp_dirs = [tempfile.mkdtemp(dir=self.results_dir) for i_sim in range(len(all_seeds))]
+
+        results_store = None
+        try:
+            for i_result, results_dir in enumerate(parallel.iter_simulations(
+                    self.model, end_time, checkpoint_period or end_time, all_seeds, temp_dirs,
+                    perturbations=perturbations, n_workers=n_workers,
+                    simulator=self.get_simulator() if n_workers <= 1 else None,
+                    in_memory=self.get_in_memory_components(),
+                    shared_model=self.get_shared_model() if n_workers > 1 else None)):
+                result_trajectory = trajectory.Trajectory.from_run_results(parallel.load_run_results(results_dir))
+                if results_store is None:
+                    results_store = store.ResultsStore.create(filename, result_trajectory.species_ids,
+                                                              result_trajectory.times, len(points),
+                                                              n_replicates=n_sims, points=points,
+                                                              compression=compression)
+                i_point, i_sim = divmod(i_result, n_sims)
+                results_store.write(i_point, i_sim, result_trajectory)
+                if isinstance(results_dir, str):
+                    shutil.rmtree(results_dir)
+        finally:
+            if results_store is not None:
+                results_store.close()
+
+        return store.ResultsStore(filename)
+
+    def simulate_to_store(self, filename, end_time, checkpoint_period=None, n_sims=1, **kwargs):
+        """ Simulate the model one or more times, and save the populations of all of the
+        replicates to a single file
+
+        Args:
+            filename (:obj:`str`): path to save the populations
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`, optional): checkpoint period; defaults to
+                :obj:`end_time`
+            n_sims (:obj:`int`, optional): number of replicates
+            **kwargs: additional arguments to :obj:`sim_scan_to_store`
+
+        Returns:
+            :obj:`store.ResultsStore`: store with a single point, opened for reading
+        """
+        return self.sim_scan_to_store(filename, [{}], end_time, checkpoint_period=checkpoint_period,
+                                      n_sims=n_sims, **kwargs)
+
+    def sim_scan_parameters(self, mod_parameters, end_time, checkpoint_period, **kwargs):
+        points = scan.get_scan_points(mod_parameters=mod_parameters)
+        return self.sim_scan(points, end_time, checkpoint_period, **kwargs)
+
+    def sim_scan_species(self, mod_species, end_time, checkpoint_period, **kwargs):
+        points = scan.get_scan_points(mod_species=mod_species)
+        return self.sim_scan(points, end_time, checkpoint_period, **kwargs)
+
+    def sim_scan_reactions(self, mod_reactions, end_time, checkpoint_period, **kwargs):
+        points = scan.get_scan_points(mod_reactions=mod_reactions)
+        return self.sim_scan(points, end_time, checkpoint_period, **kwargs)
+
+    def run_screen(self, table, filename, end_time, checkpoint_period=None, species_ids=None,
+                   statistics=('final',), summarize=None, seed=None, n_workers=None, max_pending=None,
+                   retry_failed=True):
+        """ Simulate each perturbation of a screen, such as a knockout screen, and reduce the
+        results of each perturbation to a row of summary metrics
+
+        At most :obj:`max_pending` simulations are submitted to the workers at a time. The
+        results of each simulation are summarized as soon as it finishes, its summary is
+        appended to :obj:`filename`, and its results directory is deleted. Perturbations which
+        already succeeded in :obj:`filename` are not simulated again, so that an interrupted
+        screen can be resumed by running it again. Perturbations whose simulations fail are saved
+        with their errors, rather than stopping the screen, and they are simulated again when
+        the screen is resumed, unless :obj:`retry_failed` is :obj:`False`.
+
+        Args:
+            table (:obj:`pandas.DataFrame`, :obj:`str`, or :obj:`list` of :obj:`dict`): screen,
+                path to a CSV file of a screen, or rows of a screen (see :obj:`screen.read_screen`)
+            filename (:obj:`str`): path to save the summary metrics (see :obj:`screen.ScreenResults`)
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`, optional): checkpoint period; defaults to
+                :obj:`end_time`
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of the species to summarize;
+                defaults to all species
+            statistics (:obj:`list` of :obj:`str`, optional): statistics of the populations of
+                the species (see :obj:`trajectory.STATISTICS`)
+            summarize (:obj:`callable`, optional): function which reduces a
+                :obj:`trajectory.Trajectory` to a dictionary of metrics; defaults to
+                :obj:`screen.summarize` of :obj:`species_ids` and :obj:`statistics`
+            seed (:obj:`int`, optional): seed of all of the simulations; if :obj:`None`, a random
+                seed is chosen. The seed of each perturbation is saved with its metrics.
+            n_workers (:obj:`int`, optional): number of worker processes; defaults to
+                :obj:`N_WORKERS`
+            max_pending (:obj:`int`, optional): maximum number of simulations which have been
+                submitted but not summarized; defaults to twice the number of workers
+            retry_failed (:obj:`bool`, optional): if :obj:`True`, simulate the perturbations which
+                failed in previous runs of the screen again
+
+        Returns:
+            :obj:`pandas.DataFrame`: summary metrics (columns) of each perturbation (rows), in
+                the order of the screen
+        """
+        if n_workers is None:
+            n_workers = self.N_WORKERS
+        if max_pending is None:
+            max_pending = 2 * max(1, n_workers)
+        if summarize is None:
+            summarize = functools.partial(screen.summarize, species_ids=species_ids, statistics=statistics)
+        checkpoint_period = checkpoint_period or end_time
+        seed = parallel.get_seeds(1, seed=seed)[0]
+        in_memory = self.get_in_memory_components()
+
+        perturbations = screen.read_screen(table)
+        with screen.ScreenResults(filename) as results:
+            pending = [(id, point_perturbation) for id, point_perturbation in perturbations
+                       if id not in results.completed and (retry_failed or id not in results.failed)]
+            self._record_simulations(end_time, checkpoint_period, [seed] * len(pending),
+                                     [point_perturbation for id, point_perturbation in pending])
+
+            def save(id, get_results):
+                try:
+                    results_dir = get_results()
+                except concurrent.futures.BrokenExecutor:
+                    raise
+                except Exception as error:
+                    results.add(id, seed, error='{}: {}'.format(error.__class__.__name__, str(error)))
+                    return
+                result_trajectory = trajectory.Trajectory.from_run_results(parallel.load_run_results(results_dir))
+                with profiling.profiler.phase('analysis'):
+                    metrics = summarize(result_trajectory)
+                if isinstance(results_dir, str):
+                    shutil.rmtree(results_dir)
+                results.add(id, seed, metrics=metrics)
+
+            if n_workers <= 1:
+                simulator = self.get_simulator()
+                for id, point_perturbation in pending:
+                    save(id, functools.partial(simulator.run, end_time, checkpoint_period, seed,
+                                               tempfile.mkdtemp(dir=self.results_dir),
+                                               perturbation=point_perturbation, in_memory=in_memory))
+
+            else:
+                with parallel.SimulationPool(self.model, n_workers=n_workers,
+                                             shared_model=self.get_shared_model()) as pool:
+                    futures = {}
+                    for id, point_perturbation in pending:
+                        if len(futures) >= max_pending:
+                            done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                            for future in done:
+                                save(futures.pop(future), future.result)
+                        future = pool.submit(end_time, checkpoint_period, seed, tempfile.mkdtemp(dir=self.results_dir),
+                                             perturbation=point_perturbation, in_memory=in_memory)
+                        futures[future] = id
+                    for future in concurrent.futures.as_completed(futures):
+                        save(futures[future], future.result)
+
+        return screen.read_results(filename, ids=[id for id, point_perturbation in perturbations])
+
+    """ Asynchronous simulation """
+
+    def get_simulation_pool(self):
+        """ Get the pool of :obj:`N_WORKERS` worker processes which simulate the model in the
+        background
+
+        The pool is created when it is first needed, and it is replaced when the model or
+        its perturbable values change, after which the simulations already submitted to the
+        previous pool finish with the previous values.
+
+        Returns:
+            :obj:`parallel.SimulationPool`: pool
+        """
+        values = perturbation.get_perturbable_values(self.model)
+        pool = self._simulation_pools[-1] if self._simulation_pools else None
+        if pool is None or pool.model is not self.model or values != self._simulation_pool_values:
+            if pool is not None:
+                pool.shutdown(wait=False)
+            pool = parallel.SimulationPool(self.model, n_workers=max(1, self.N_WORKERS),
+                                           shared_model=self.get_shared_model())
+            self._simulation_pools.append(pool)
+            self._simulation_pool_values = values
+        return pool
+
+    async def run_simulation_async(self, end_time, checkpoint_period, seed, perturbation=None):
+        """ Simulate the model once in the background
+
+        The simulation runs in :obj:`get_simulation_pool`, and its results are loaded in a
+        thread so that the event loop is free to submit and consolidate other simulations.
+        Unlike :obj:`run_simulations`, the results aren't cached.
+
+        Args:
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`): checkpoint period
+            seed (:obj:`int`): seed
+            perturbation (:obj:`dict`, optional): perturbation of the simulation (see
+                :obj:`perturbation.apply_perturbation`)
+
+        Returns:
+            :obj:`RunResults` or :obj:`parallel.MemoryRunResults`: results
+        """
+        self._record_simulations(end_time, checkpoint_period, [seed], [perturbation])
+        future = self.get_simulation_pool().submit(end_time, checkpoint_period, seed,
+                                                   tempfile.mkdtemp(dir=self.results_dir),
+                                                   perturbation=perturbation,
+                                                   in_memory=self.get_in_memory_components())
+        results_dir = await asyncio.wrap_future(future)
+        return await self.run_in_thread(parallel.load_run_results, results_dir)
+
+    async def simulate_async(self, end_time, checkpoint_period=None, n_sims=1, seed=None, perturbation=None):
+        """ Simulate the model one or more times in the background ::
+
+            async def simulate():
+                return await asyncio.gather(
+                    self.simulate_async(end_time=100., n_sims=4, seed=1),
+                    self.simulate_async(end_time=100., n_sims=4, seed=1,
+                                        perturbation={'submodels': {'transcription': False}}))
+
+            wild_type_results, knockout_results = asyncio.run(simulate())
+
+        Args:
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`, optional): checkpoint period
+            n_sims (:obj:`int`, optional): number of replicate simulations
+            seed (:obj:`int`, optional): seed of the first replicate; if :obj:`None`, a
+                random seed is chosen
+            perturbation (:obj:`dict`, optional): perturbation of each replicate (see
+                :obj:`perturbation.apply_perturbation`)
+
+        Returns:
+            :obj:`list` of :obj:`RunResults`: results of each replicate
+        """
+        seeds = parallel.get_seeds(n_sims, seed=seed)
+        return list(await asyncio.gather(*[
+            self.run_simulation_async(end_time, checkpoint_period, seed, perturbation=perturbation)
+            for seed in seeds]))
+
+    async def sim_scan_async(self, points, end_time, checkpoint_period=None, seed=None):
+        """ Simulate each point of a scan in the background, with the same seed
+
+        Args:
+            points (:obj:`list` of :obj:`dict`): scan points (see :obj:`scan.get_scan_points`)
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`, optional): checkpoint period
+            seed (:obj:`int`, optional): seed; if :obj:`None`, a random seed is chosen
+
+        Returns:
+            :obj:`list` of :obj:`RunResults`: results of each point
+        """
+        seed = parallel.get_seeds(1, seed=seed)[0]
+        return list(await asyncio.gather(*[
+            self.run_simulation_async(end_time, checkpoint_period, seed, perturbation=point)
+            for point in points]))
+
+    async def run_in_thread(self, func, *args, **kwargs):
+        """ Run a function, such as a reduction of the results of simulations, in a thread
+        so that it doesn't block the event loop
+
+        Args:
+            func (:obj:`callable`): function
+            *args: positional arguments to :obj:`func`
+            **kwargs: keyword arguments to :obj:`func`
+
+        Returns:
+            :obj:`object`: value returned by :obj:`func`
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+class SubmodelSimulationTestCase(SimulationTestCase):
+    """ Methods for testing simulations of submodels of WC models
+
+    Each test simulates a reduced model which contains only the submodels in
+    :obj:`SUBMODELS` and the species and parameters that they reach. The reduced model is
+    extracted once per test case class.
+
+    Attributes:
+        boundary_species_ids (:obj:`list` of :obj:`str`): ids of the species which also
+            participate in the other submodels
+
+    Class attributes:
+        SUBMODELS (:obj:`list` of :obj:`str`): ids of the submodels to simulate; if
+            :obj:`None`, simulate all submodels
+        BOUNDARY (:obj:`str`): treatment of the boundary species (see
+            :obj:`submodels.BOUNDARY_MODES`)
+    """
 
-            run_result = self.simulate(end_time=end_time, checkpoint_period=checkpoint_period)[0]
-            scan_results.append(run_result)
+    SUBMODELS = None
+    BOUNDARY = 'fixed'
 
-        return scan_results
+    def load_model(self):
+        """ Get the reduced model of a test
 
-    def sim_scan_reactions(self, mod_reactions, end_time, checkpoint_period):
-        # Check if all dictionary values have same length
-        lengths = []
-        for reactions_id in mod_reactions:
-            lengths.append(len(mod_reactions[reactions_id]))
+        Returns:
+            :obj:`wc_lang.Model`: copy of the reduced model, or the reduced model itself if
+                :obj:`SHARE_MODEL`
+        """
+        if self.SUBMODELS is None:
+            self.boundary_species_ids = []
+            return super(SubmodelSimulationTestCase, self).load_model()
 
-        if lengths.count(lengths[0]) != len(lengths):
-            raise SyntaxError('All values of mod_reactions should be a list with equal length')
+        cls = self.__class__
+        model = get_model(self.MODEL, cache_dir=self.CACHE_DIR, copy=False)
+        key = (model, tuple(sorted(self.SUBMODELS)), self.BOUNDARY)
+        extraction = cls.__dict__.get('_extraction', None)
+        if extraction is None or extraction[0][0] is not model or extraction[0][1:] != key[1:]:
+            extraction = (key, submodels.extract_submodels(model, self.SUBMODELS, boundary=self.BOUNDARY))
+            cls._extraction = extraction
 
-        # Step over the defined parameter values and
-        scan_results = []
-        for value_index in range(0, lengths[0]):  # step over each paramater value
-            for reaction_id in mod_reactions:  # step over each parameters
-                reaction = self.get_reaction(reaction_id)
-                reaction.rate_laws[0].expression.parameters.get_one(
-                    type=onto['WC:k_cat']).value = mod_reactions[reaction_id][value_index]
+        reduced_model, self.boundary_species_ids = extraction[1]
+        if self.SHARE_MODEL:
+            return reduced_model
+        with profiling.profiler.phase('copy'):
+            return reduced_model.copy()
 
-            run_result = self.simulate(end_time=end_time, checkpoint_period=checkpoint_period)[0]
-            scan_results.append(run_result)
+    def get_model_components(self):
+        """ Get the components of :obj:`get_source_model` which the reduced model contains
 
-        return scan_results
+        Returns:
+            :obj:`dict`: dictionary which maps each type of component to the ids of the
+                components of the type, or :obj:`None` if all submodels are simulated
+        """
+        if self.SUBMODELS is None:
+            return None
+        return dependencies.get_component_ids(self.model)
@@ -0,0 +1,369 @@
+""" Tracking of the model components which each test depends on, and selection of the
+tests affected by changes to models
+
+When the environment variable :obj:`WC_TEST_DEPENDENCIES` is set to the path of a history
+file, :obj:`wc_test.core.ModelTestCase` records the components (species, reactions,
+parameters, submodels, etc.) of its model which each test reads or changes, together with
+a hash of the content of each component, of the module which defines the test, and
+whether the test passed. Tests which simulate their model or check its structure depend
+on all of the components of the model (or, for
+:obj:`wc_test.core.SubmodelSimulationTestCase`, on all of the components of the reduced
+model). Tests which don't read or change any components through the methods of
+:obj:`wc_test.core.ModelTestCase`, e.g., because they read the model directly, are
+assumed to depend on all of the components of the model.
+
+On the next run, only the tests which are affected by a change can be selected: tests
+which aren't in the history, which didn't pass, whose module changed, or which depend on
+a component whose hash changed::
+
+    def load_tests(loader, tests, pattern):
+        return dependencies.get_affected_tests(tests)
+
+or with pytest (see :obj:`wc_test.pytest_plugin`)::
+
+    pytest -p wc_test.pytest_plugin --wc-test-affected tests
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import cache
+from wc_test import scheduling
+import atexit
+import hashlib
+import inspect
+import os
+import unittest
+
+# types of components whose hashes are tracked
+COMPONENT_TYPES = ('compartments', 'species', 'reactions', 'parameters', 'submodels', 'observables', 'functions')
+
+# key of the dependency on all of the components of a model
+ALL_COMPONENTS = '*'
+
+# keys of the perturbations (see :obj:`wc_test.perturbation.apply_perturbation`) and the types
+# of the components that they change
+PERTURBATION_COMPONENT_TYPES = {
+    'submodels': 'submodels',
+    'parameters': 'parameters',
+    'init_populations': 'species',
+    'species': 'species',
+    'reactions': 'reactions',
+}
+
+
+def get_component_key(component_type, id):
+    """ Get the key of a component
+
+    Args:
+        component_type (:obj:`str`): type of the component (e.g., :obj:`species`)
+        id (:obj:`str`): id of the component
+
+    Returns:
+        :obj:`str`: key
+    """
+    return '{}:{}'.format(component_type, id)
+
+
+def get_component_objects(component):
+    """ Get the objects which define a component, such as the rate laws of a reaction and
+    the parameters of their expressions
+
+    Args:
+        component (:obj:`obj_tables.Model`): component
+
+    Returns:
+        :obj:`list` of :obj:`obj_tables.Model`: objects
+    """
+    objs = [component]
+    expressions = []
+    for attr in ('species_type', 'distribution_init_concentration', 'init_volume', 'expression'):
+        obj = getattr(component, attr, None)
+        if obj is not None:
+            objs.append(obj)
+            if attr == 'species_type' and getattr(obj, 'structure', None) is not None:
+                objs.append(obj.structure)
+            if attr == 'expression':
+                expressions.append(obj)
+    for rate_law in getattr(component, 'rate_laws', []):
+        objs.append(rate_law)
+        if rate_law.expression is not None:
+            objs.append(rate_law.expression)
+            expressions.append(rate_law.expression)
+
+    # the values of the parameters of expressions, such as k_cat's, are part of the component
+    for expression in expressions:
+        objs.extend(getattr(expression, 'parameters', []))
+    return objs
+
+
+def get_component_ids(model):
+    """ Get the ids of the components of a model
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+
+    Returns:
+        :obj:`dict`: dictionary which maps each type of component to the ids of the
+            components of the type
+    """
+    return {component_type: [component.id for component in getattr(model, component_type, [])]
+            for component_type in COMPONENT_TYPES}
+
+
+def get_component_hashes(model):
+    """ Get the hash of the content of each component of a model
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+
+    Returns:
+        :obj:`dict`: dictionary which maps the key of each component (see
+            :obj:`get_component_key`), and :obj:`ALL_COMPONENTS`, to its hash
+    """
+    hashes = {ALL_COMPONENTS: cache.get_model_hash(model)}
+    for component_type in COMPONENT_TYPES:
+        for component in getattr(model, component_type, []):
+            hashes[get_component_key(component_type, component.id)] = cache.get_objects_hash(
+                get_component_objects(component))
+    return hashes
+
+
+def get_source_hash(cls):
+    """ Get the hash of the module which defines a class of tests
+
+    Args:
+        cls (:obj:`type`): class of tests
+
+    Returns:
+        :obj:`str`: hash, or :obj:`None` if the source of the module isn't available
+    """
+    try:
+        filename = inspect.getsourcefile(cls)
+    except TypeError:
+        return None
+    if not filename or not os.path.isfile(filename):
+        return None
+    with open(filename, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+class OutcomeResult(object):
+    """ Proxy for a test result which records whether a test passed
+
+    Attributes:
+        result (:obj:`unittest.TestResult`): result
+        passed (:obj:`bool`): :obj:`False` if the test failed, raised an error, or was skipped
+    """
+
+    # methods which report that a test didn't pass
+    FAILURES = ('addError', 'addFailure', 'addSkip', 'addUnexpectedSuccess')
+
+    def __init__(self, result):
+        """
+        Args:
+            result (:obj:`unittest.TestResult`): result
+        """
+        self.result = result
+        self.passed = True
+
+    def __getattr__(self, name):
+        attr = getattr(self.result, name)
+        if name in self.FAILURES:
+            def add(*args, **kwargs):
+                self.passed = False
+                return attr(*args, **kwargs)
+            return add
+        if name == 'addSubTest':
+            def add_sub_test(test, subtest, err):
+                if err is not None:
+                    self.passed = False
+                return attr(test, subtest, err)
+            return add_sub_test
+        return attr
+
+
+class DependencyHistory(scheduling.History):
+    """ History of the model components which tests depend on
+
+    Attributes:
+        filename (:obj:`str`): path to the history
+        records (:obj:`dict`): dictionary which maps the id of each test to whether it passed,
+            the hash of its module, and the hash of each component that it depends on
+    """
+
+    def get_affected(self, test_ids, test_classes):
+        """ Get the tests which are affected by changes to their models or modules since they
+        were recorded
+
+        The models of the tests are obtained with their :obj:`get_source_model` method (see
+        :obj:`wc_test.core.ModelTestCase`). Tests of other classes are always affected.
+
+        Args:
+            test_ids (:obj:`list` of :obj:`str`): ids of the tests
+            test_classes (:obj:`list` of :obj:`type`): class of each test
+
+        Returns:
+            :obj:`list` of :obj:`int`: indices of the affected tests
+        """
+        model_hashes = {}
+        source_hashes = {}
+        affected = []
+        for i_test, (test_id, cls) in enumerate(zip(test_ids, test_classes)):
+            record = self.records.get(test_id, None)
+            if record is None or not record['passed'] or not hasattr(cls, 'get_source_model'):
+                affected.append(i_test)
+                continue
+
+            if cls not in source_hashes:
+                source_hashes[cls] = get_source_hash(cls)
+            if source_hashes[cls] is None or source_hashes[cls] != record['source_hash']:
+                affected.append(i_test)
+                continue
+
+            model = cls.get_source_model()
+            hashes = model_hashes.get(id(model), (None, None))[1]
+            if hashes is None:
+                hashes = get_component_hashes(model)
+                model_hashes[id(model)] = (model, hashes)
+            if any(hashes.get(key, None) != hash for key, hash in record['components'].items()):
+                affected.append(i_test)
+        return affected
+
+
+class DependencyTracker(object):
+    """ Recorder of the model components which each test reads or changes
+
+    Attributes:
+        filename (:obj:`str`): path to the history which the records are merged into
+        records (:obj:`dict`): dictionary which maps the id of each recorded test to whether
+            it passed, the hash of its module, and the hash of each component that it depends on
+        _test_id (:obj:`str`): id of the current test
+        _keys (:obj:`set` of :obj:`str`): keys of the components which the current test
+            depends on
+        _model_hashes (:obj:`dict`): dictionary which maps the ids of models to the models and
+            the hashes of their components
+    """
+
+    def __init__(self, filename=None):
+        """
+        Args:
+            filename (:obj:`str`, optional): path to the history; if :obj:`None`,
+                dependencies aren't recorded
+        """
+        self.filename = filename
+        self.records = {}
+        self._test_id = None
+        self._keys = set()
+        self._model_hashes = {}
+
+    @property
+    def enabled(self):
+        """ Get whether dependencies are recorded
+
+        Returns:
+            :obj:`bool`: :obj:`True` if dependencies are recorded
+        """
+        return bool(self.filename)
+
+    def start(self, test_id):
+        """ Start recording a test
+
+        Args:
+            test_id (:obj:`str`): id of the test
+        """
+        self._test_id = test_id
+        self._keys = set()
+
+    def add(self, component_type, ids):
+        """ Record that the current test depends on components
+
+        Args:
+            component_type (:obj:`str`): type of the components (e.g., :obj:`species`)
+            ids (:obj:`list` of :obj:`str`): ids of the components
+        """
+        if self._test_id is not None:
+            self._keys.update(get_component_key(component_type, id) for id in ids)
+
+    def add_perturbation(self, perturbation):
+        """ Record that the current test depends on the components changed by a perturbation
+
+        Args:
+            perturbation (:obj:`dict`): perturbation (see
+                :obj:`wc_test.perturbation.apply_perturbation`)
+        """
+        for key, component_type in PERTURBATION_COMPONENT_TYPES.items():
+            self.add(component_type, (perturbation or {}).get(key, {}))
+
+    def add_model(self):
+        """ Record that the current test depends on all of the components of its model """
+        if self._test_id is not None:
+            self._keys.add(ALL_COMPONENTS)
+
+    def stop(self, model, source_hash, passed):
+        """ Stop recording the current test
+
+        If no components were recorded, the test may have read the model directly, so it is
+        recorded as depending on all of the components of the model.
+
+        Args:
+            model (:obj:`wc_lang.Model`): unperturbed model of the test
+            source_hash (:obj:`str`): hash of the module which defines the test (see
+                :obj:`get_source_hash`)
+            passed (:obj:`bool`): whether the test passed
+        """
+        if self._test_id is None:
+            return
+        hashes = self._model_hashes.get(id(model), (None, None))[1]
+        if hashes is None:
+            hashes = get_component_hashes(model)
+            self._model_hashes[id(model)] = (model, hashes)
+
+        keys = [ALL_COMPONENTS] if not self._keys or ALL_COMPONENTS in self._keys else sorted(self._keys)
+        self.records[self._test_id] = {
+            'passed': passed,
+            'source_hash': source_hash,
+            'components': {key: hashes.get(key, None) for key in keys},
+        }
+        self._test_id = None
+        self._keys = set()
+
+    def save(self):
+        """ Merge the records into the history """
+        history = DependencyHistory()
+        history.filename = self.filename
+        history.records = dict(self.records)
+        history.save()
+
+
+# tracker shared by all test cases
+tracker = DependencyTracker(os.getenv('WC_TEST_DEPENDENCIES') or None)
+
+
+def save():
+    """ Merge the dependencies recorded in this process into the history named by :obj:`WC_TEST_DEPENDENCIES` """
+    if tracker.enabled and tracker.records:
+        tracker.save()
+
+
+atexit.register(save)
+
+
+def get_affected_tests(suite, history=None):
+    """ Get the tests of a suite which are affected by changes to their models or modules
+
+    Args:
+        suite (:obj:`unittest.TestSuite`): suite
+        history (:obj:`DependencyHistory`, optional): history; defaults to the history named
+            by :obj:`WC_TEST_DEPENDENCIES`
+
+    Returns:
+        :obj:`unittest.TestSuite`: affected tests
+    """
+    if history is None:
+        history = DependencyHistory(tracker.filename)
+    tests = scheduling.get_tests(suite)
+    affected = history.get_affected([test.id() for test in tests], [test.__class__ for test in tests])
+    return unittest.TestSuite([tests[i_test] for i_test in affected])
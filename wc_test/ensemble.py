@@ -0,0 +1,183 @@
+""" Streaming, bounded-memory reduction of ensembles of simulations
+
+Each replicate is folded into running statistics as soon as it finishes so that the
+memory required to reduce an ensemble is independent of the number of replicates.
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+import numpy
+
+
+class RunningStatistics(object):
+    """ Running mean, variance, minimum, and maximum of a stream of arrays, calculated with
+    Welford's algorithm, and optionally, approximate quantiles calculated from a fixed-size
+    reservoir sample of the stream
+
+    Attributes:
+        n (:obj:`int`): number of arrays
+        mean (:obj:`numpy.ndarray`): mean
+        min (:obj:`numpy.ndarray`): minimum
+        max (:obj:`numpy.ndarray`): maximum
+        reservoir_size (:obj:`int`): number of arrays sampled to estimate quantiles; if 0,
+            quantiles are not estimated
+        _m2 (:obj:`numpy.ndarray`): sum of the squared differences from the mean
+        _reservoir (:obj:`numpy.ndarray`): sample of the arrays
+        _random_state (:obj:`numpy.random.RandomState`): random number generator for the
+            reservoir sample
+    """
+
+    def __init__(self, reservoir_size=0, seed=None):
+        """
+        Args:
+            reservoir_size (:obj:`int`, optional): number of arrays sampled to estimate quantiles
+            seed (:obj:`int`, optional): seed for the reservoir sample
+        """
+        self.n = 0
+        self.mean = None
+        self.min = None
+        self.max = None
+        self.reservoir_size = reservoir_size
+        self._m2 = None
+        self._reservoir = None
+        self._random_state = numpy.random.RandomState(seed)
+
+    def add(self, values):
+        """ Fold an array into the statistics
+
+        Args:
+            values (:obj:`numpy.ndarray`): array
+        """
+        values = numpy.asarray(values, dtype=numpy.float64)
+        self.n += 1
+
+        if self.n == 1:
+            self.mean = values.copy()
+            self._m2 = numpy.zeros_like(values)
+            self.min = values.copy()
+            self.max = values.copy()
+            if self.reservoir_size:
+                self._reservoir = numpy.empty((self.reservoir_size,) + values.shape)
+        else:
+            delta = values - self.mean
+            self.mean += delta / self.n
+            self._m2 += delta * (values - self.mean)
+            numpy.minimum(self.min, values, out=self.min)
+            numpy.maximum(self.max, values, out=self.max)
+
+        if self.reservoir_size:
+            if self.n <= self.reservoir_size:
+                self._reservoir[self.n - 1] = values
+            else:
+                i_sample = self._random_state.randint(self.n)
+                if i_sample < self.reservoir_size:
+                    self._reservoir[i_sample] = values
+
+    @property
+    def var(self):
+        """ Get the sample variance
+
+        Returns:
+            :obj:`numpy.ndarray`: sample variance
+        """
+        if self.n < 2:
+            return numpy.full_like(self.mean, numpy.nan)
+        return self._m2 / (self.n - 1)
+
+    @property
+    def std(self):
+        """ Get the sample standard deviation
+
+        Returns:
+            :obj:`numpy.ndarray`: sample standard deviation
+        """
+        return numpy.sqrt(self.var)
+
+    @property
+    def sem(self):
+        """ Get the standard error of the mean
+
+        Returns:
+            :obj:`numpy.ndarray`: standard error of the mean
+        """
+        return self.std / numpy.sqrt(self.n)
+
+    def quantile(self, q):
+        """ Estimate quantiles from the reservoir sample
+
+        Args:
+            q (:obj:`float` or :obj:`list` of :obj:`float`): quantile(s) in [0, 1]
+
+        Returns:
+            :obj:`numpy.ndarray`: quantile(s)
+
+        Raises:
+            :obj:`ValueError`: if quantiles are not being estimated
+        """
+        if not self.reservoir_size:
+            raise ValueError('Quantiles can only be estimated if `reservoir_size` is positive')
+        return numpy.quantile(self._reservoir[:min(self.n, self.reservoir_size)], q, axis=0)
+
+
+class EnsembleStatistics(object):
+    """ Statistics of the populations of species over time across an ensemble of simulations
+
+    Attributes:
+        species_ids (:obj:`list` of :obj:`str`): ids of the species; if :obj:`None`,
+            all species
+        times (:obj:`numpy.ndarray`): times
+        populations (:obj:`RunningStatistics`): statistics of the species x time populations
+    """
+
+    def __init__(self, species_ids=None, reservoir_size=0, seed=None):
+        """
+        Args:
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of the species; defaults to
+                all species
+            reservoir_size (:obj:`int`, optional): number of replicates sampled to estimate quantiles
+            seed (:obj:`int`, optional): seed for the reservoir sample
+        """
+        self.species_ids = species_ids
+        self.times = None
+        self.populations = RunningStatistics(reservoir_size=reservoir_size, seed=seed)
+
+    @property
+    def n(self):
+        """ Get the number of replicates
+
+        Returns:
+            :obj:`int`: number of replicates
+        """
+        return self.populations.n
+
+    def add(self, trajectory):
+        """ Fold the trajectory of a replicate into the statistics
+
+        Args:
+            trajectory (:obj:`wc_test.trajectory.Trajectory`): trajectory
+
+        Raises:
+            :obj:`ValueError`: if the times of the trajectory are different from those of the
+                previous trajectories
+        """
+        if self.times is None:
+            self.times = trajectory.times
+            if self.species_ids is None:
+                self.species_ids = trajectory.species_ids
+        elif not numpy.array_equal(self.times, trajectory.times):
+            raise ValueError('The replicates of an ensemble must be sampled at the same times')
+        self.populations.add(trajectory.get_populations(self.species_ids))
+
+    def to_dict(self, values):
+        """ Get a dictionary which maps the id of each species to its values
+
+        Args:
+            values (:obj:`numpy.ndarray`): species x time values
+
+        Returns:
+            :obj:`dict`: dictionary which maps the id of each species to its values
+        """
+        return dict(zip(self.species_ids, values))
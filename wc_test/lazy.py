@@ -0,0 +1,79 @@
+""" Lazy imports of heavy dependencies
+
+Importing the knowledge base, modeling, ontology, and simulation packages takes several
+seconds. To keep the import of :obj:`wc_test` fast, these packages are bound to proxy
+modules which import the packages when one of their attributes is first used. ::
+
+    wc_lang = lazy.import_module('wc_lang')
+
+    def get_model(model):
+        if not isinstance(model, wc_lang.Model):  # imports wc_lang
+            ...
+
+Submodules of packages imported lazily are also imported on first use (e.g.,
+:obj:`wc_lang.io`).
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+import importlib
+import types
+
+# heavy dependencies which should only be imported when they are first used
+HEAVY_MODULES = ('h5py', 'pandas', 'scipy.sparse', 'scipy.stats', 'wc_kb', 'wc_lang', 'wc_onto', 'wc_sim', 'wc_utils.util.units')
+
+
+class LazyModule(types.ModuleType):
+    """ Proxy for a module which is imported when one of its attributes is first used """
+
+    def __init__(self, name):
+        """
+        Args:
+            name (:obj:`str`): fully qualified name of the module
+        """
+        super(LazyModule, self).__init__(name)
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        """ Import the module
+
+        Returns:
+            :obj:`types.ModuleType`: module
+        """
+        module = self.__dict__['_module']
+        if module is None:
+            module = self.__dict__['_module'] = importlib.import_module(self.__name__)
+        return module
+
+    def __getattr__(self, attr):
+        module = self._load()
+        try:
+            return getattr(module, attr)
+        except AttributeError:
+            # import submodules, such as `wc_lang.io`, which the package doesn't import itself
+            name = self.__name__ + '.' + attr
+            try:
+                return importlib.import_module(name)
+            except ModuleNotFoundError as error:
+                if error.name != name:
+                    raise
+                raise AttributeError("module '{}' has no attribute '{}'".format(self.__name__, attr))
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def import_module(name):
+    """ Get a proxy for a module which defers its import until one of its attributes is
+    first used
+
+    Args:
+        name (:obj:`str`): fully qualified name of the module
+
+    Returns:
+        :obj:`LazyModule`: proxy for the module
+    """
+    return LazyModule(name)
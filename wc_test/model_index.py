@@ -0,0 +1,255 @@
+""" Indices of the components of models by their ids
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import lazy
+import numpy
+import weakref
+
+wc_onto = lazy.import_module('wc_onto')
+
+# dictionary which maps the Python ids of models to their indices
+_indices = {}
+
+
+class ModelIndex(object):
+    """ Dictionaries which map the ids of the species, reactions, parameters, and submodels of a
+    model to the components
+
+    The k_cat parameters of reactions and submodels, and the molecular weights of species, are
+    read from the current rate laws and structures of the indexed components on each lookup,
+    so that changes to them are reflected without rebuilding the dictionaries.
+
+    The dictionaries are rebuilt when the number of components of the model changes,
+    or when a looked up component has been renamed. Components which are missing are cached
+    as missing until the number of components changes, so that repeated lookups of
+    missing components don't rebuild the dictionaries. A component which is renamed to an
+    id which isn't indexed is found after the index is rebuilt, e.g., after its previous
+    id is looked up.
+
+    Attributes:
+        species (:obj:`dict`): dictionary which maps ids to species
+        reactions (:obj:`dict`): dictionary which maps ids to reactions
+        parameters (:obj:`dict`): dictionary which maps ids to parameters
+        submodels (:obj:`dict`): dictionary which maps ids to submodels
+        _model (:obj:`weakref.ref`): weak reference to the model
+        _signature (:obj:`tuple`): numbers of components of the model when the index was built
+    """
+
+    def __init__(self, model):
+        """
+        Args:
+            model (:obj:`wc_lang.Model`): model
+        """
+        self._model = weakref.ref(model)
+        self.update()
+
+    @property
+    def model(self):
+        """ Get the model
+
+        Returns:
+            :obj:`wc_lang.Model`: model
+        """
+        return self._model()
+
+    def get_signature(self):
+        """ Get the numbers of components of the model
+
+        Returns:
+            :obj:`tuple` of :obj:`int`: numbers of species, reactions, parameters, and submodels
+        """
+        return (len(self.model.species), len(self.model.reactions),
+                len(self.model.parameters), len(self.model.submodels))
+
+    def is_current(self):
+        """ Determine whether the number of components of the model is unchanged
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the number of components of the model is unchanged
+        """
+        return self._signature == self.get_signature()
+
+    def update(self):
+        """ Build the dictionaries """
+        model = self.model
+
+        self.species = {species.id: species for species in model.species}
+        self.reactions = {reaction.id: reaction for reaction in model.reactions}
+        self.parameters = {parameter.id: parameter for parameter in model.parameters}
+        self.submodels = {submodel.id: submodel for submodel in model.submodels}
+
+        self._signature = self.get_signature()
+
+    def _get(self, attr, id):
+        """ Get a component of the model, rebuilding the index if it is stale
+
+        Args:
+            attr (:obj:`str`): name of the dictionary of the type of component
+            id (:obj:`str`): id of the component
+
+        Returns:
+            :obj:`object`: component, or :obj:`None` if the model has no such component
+        """
+        obj = getattr(self, attr).get(id, None)
+        if (obj is None and not self.is_current()) or (obj is not None and obj.id != id):
+            self.update()
+            obj = getattr(self, attr).get(id, None)
+        return obj
+
+    def get_species(self, id):
+        """ Get a species
+
+        Args:
+            id (:obj:`str`): id
+
+        Returns:
+            :obj:`wc_lang.Species`: species
+        """
+        return self._get('species', id)
+
+    def get_reaction(self, id):
+        """ Get a reaction
+
+        Args:
+            id (:obj:`str`): id
+
+        Returns:
+            :obj:`wc_lang.Reaction`: reaction
+        """
+        return self._get('reactions', id)
+
+    def get_parameter(self, id):
+        """ Get a parameter
+
+        Args:
+            id (:obj:`str`): id
+
+        Returns:
+            :obj:`wc_lang.Parameter`: parameter
+        """
+        return self._get('parameters', id)
+
+    def get_submodel(self, id):
+        """ Get a submodel
+
+        Args:
+            id (:obj:`str`): id
+
+        Returns:
+            :obj:`wc_lang.Submodel`: submodel
+        """
+        return self._get('submodels', id)
+
+    def get_reaction_k_cat(self, id):
+        """ Get the k_cat parameter of the first rate law of a reaction
+
+        Args:
+            id (:obj:`str`): id of the reaction
+
+        Returns:
+            :obj:`wc_lang.Parameter`: k_cat parameter, or :obj:`None` if the model has no such
+                reaction or the reaction has no rate law
+        """
+        reaction = self.get_reaction(id)
+        if reaction is None or not reaction.rate_laws:
+            return None
+        return get_k_cat(reaction.rate_laws[0])
+
+    def get_reaction_k_cats(self, id):
+        """ Get the k_cat parameters of all of the rate laws of a reaction, e.g., of both
+        directions of a reversible reaction
+
+        Args:
+            id (:obj:`str`): id of the reaction
+
+        Returns:
+            :obj:`list` of :obj:`wc_lang.Parameter`: k_cat parameters, or :obj:`None` if the
+                model has no such reaction
+        """
+        reaction = self.get_reaction(id)
+        if reaction is None:
+            return None
+        k_cats = []
+        for rate_law in reaction.rate_laws:
+            k_cat = get_k_cat(rate_law)
+            if k_cat is not None:
+                k_cats.append(k_cat)
+        return k_cats
+
+    def get_submodel_k_cats(self, id):
+        """ Get the k_cat parameters of the rate laws of the reactions of a submodel
+
+        Args:
+            id (:obj:`str`): id of the submodel
+
+        Returns:
+            :obj:`list` of :obj:`wc_lang.Parameter`: k_cat parameters, or :obj:`None` if the model
+                has no such submodel
+        """
+        submodel = self.get_submodel(id)
+        if submodel is None:
+            return None
+        k_cats = []
+        for reaction in submodel.reactions:
+            k_cats.extend(self.get_reaction_k_cats(reaction.id))
+        return k_cats
+
+    def get_molecular_weights(self, species_ids):
+        """ Get the molecular weights of species; the molecular weights of species whose
+        structures are undefined are 0
+
+        The weights are read from the current structures of the species on each call, so
+        that changes to the structures are reflected.
+
+        Args:
+            species_ids (:obj:`list` of :obj:`str`): ids of the species
+
+        Returns:
+            :obj:`numpy.ndarray`: molecular weight of each species (g mol^-1)
+        """
+        weights = numpy.zeros((len(species_ids),))
+        for i_species, id in enumerate(species_ids):
+            structure = self.get_species(id).species_type.structure
+            if structure and structure.molecular_weight:
+                weights[i_species] = structure.molecular_weight
+        return weights
+
+def get_k_cat(rate_law):
+    """ Get the k_cat parameter of a rate law
+
+    Args:
+        rate_law (:obj:`wc_lang.RateLaw`): rate law
+
+    Returns:
+        :obj:`wc_lang.Parameter`: k_cat parameter, or :obj:`None` if the rate law has no
+            expression or k_cat parameter
+    """
+    if not rate_law.expression:
+        return None
+    return rate_law.expression.parameters.get_one(type=wc_onto.onto['WC:k_cat'])
+
+
+def get_index(model):
+    """ Get the index of a model, building it if the model hasn't been indexed or if
+    the number of components of the model has changed
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+
+    Returns:
+        :obj:`ModelIndex`: index
+    """
+    index = _indices.get(id(model), None)
+    if index is None or index.model is not model:
+        for key, other_index in list(_indices.items()):
+            if other_index.model is None:
+                _indices.pop(key)
+        index = _indices[id(model)] = ModelIndex(model)
+    elif not index.is_current():
+        index.update()
+    return index
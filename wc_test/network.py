@@ -0,0 +1,225 @@
+""" Vectorized structural checks of the reaction networks of models
+
+The checks operate on the sparse stoichiometry matrix of a model (see
+:obj:`wc_test.stoichiometry.get_stoichiometry`) so that they scale to whole-cell models.
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import lazy
+import numpy
+
+wc_lang = lazy.import_module('wc_lang')
+wc_onto = lazy.import_module('wc_onto')
+
+
+class RateLawActivities(object):
+    """ Whether each reaction of a model has an active forward and backward rate law
+
+    A rate law is active if its k_cat is undefined or non-zero.
+
+    Attributes:
+        forward (:obj:`numpy.ndarray`): :obj:`True` for each reaction with an active
+            forward rate law
+        backward (:obj:`numpy.ndarray`): :obj:`True` for each reaction with an active
+            backward rate law
+    """
+
+    def __init__(self, forward, backward):
+        """
+        Args:
+            forward (:obj:`numpy.ndarray`): :obj:`True` for each reaction with an active
+                forward rate law
+            backward (:obj:`numpy.ndarray`): :obj:`True` for each reaction with an active
+                backward rate law
+        """
+        self.forward = forward
+        self.backward = backward
+
+    @property
+    def active(self):
+        """ Get whether each reaction has an active rate law in either direction
+
+        Returns:
+            :obj:`numpy.ndarray`: :obj:`True` for each reaction with an active rate law
+        """
+        return self.forward | self.backward
+
+
+def get_rate_law_activities(model):
+    """ Get whether each reaction of a model has an active forward and backward rate law,
+    in the same order as :obj:`wc_test.stoichiometry.get_stoichiometry`
+
+    Activities aren't cached because they change when k_cat's are perturbed.
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+
+    Returns:
+        :obj:`RateLawActivities`: activities
+    """
+    k_cat_type = wc_onto.onto['WC:k_cat']
+    forward = numpy.zeros((len(model.reactions),), dtype=bool)
+    backward = numpy.zeros((len(model.reactions),), dtype=bool)
+    for i_reaction, reaction in enumerate(model.reactions):
+        for rate_law in reaction.rate_laws:
+            if not rate_law.expression:
+                continue
+            k_cat = rate_law.expression.parameters.get_one(type=k_cat_type)
+            if k_cat is not None and not k_cat.value:
+                continue
+            if rate_law.direction == wc_lang.RateLawDirection.backward:
+                backward[i_reaction] = True
+            else:
+                forward[i_reaction] = True
+    return RateLawActivities(forward, backward)
+
+
+def get_init_populations(model):
+    """ Get the mean initial population of each species of a model, in the same order as
+    :obj:`wc_test.stoichiometry.get_stoichiometry`
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+
+    Returns:
+        :obj:`numpy.ndarray`: mean initial population of each species; 0 if undefined
+    """
+    populations = numpy.zeros((len(model.species),))
+    for i_species, species in enumerate(model.species):
+        conc = species.distribution_init_concentration
+        if conc is not None and conc.mean:
+            populations[i_species] = conc.mean
+    return populations
+
+
+def get_producers_and_consumers(stoichiometry):
+    """ Get the number of reactions which can produce and consume each species, accounting
+    for the reversibility of each reaction
+
+    Args:
+        stoichiometry (:obj:`wc_test.stoichiometry.Stoichiometry`): stoichiometry of the model
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`numpy.ndarray`: number of reactions which can produce each species
+            * :obj:`numpy.ndarray`: number of reactions which can consume each species
+    """
+    matrix = stoichiometry.matrix
+    reversible = stoichiometry.reversible.astype(numpy.float64)
+    produced = (matrix > 0).astype(numpy.float64).T
+    consumed = (matrix < 0).astype(numpy.float64).T
+    n_producers = produced.dot(numpy.ones(matrix.shape[0])) + consumed.dot(reversible)
+    n_consumers = consumed.dot(numpy.ones(matrix.shape[0])) + produced.dot(reversible)
+    return n_producers, n_consumers
+
+
+def get_orphan_species(stoichiometry):
+    """ Get the species which don't participate in any reaction
+
+    Args:
+        stoichiometry (:obj:`wc_test.stoichiometry.Stoichiometry`): stoichiometry of the model
+
+    Returns:
+        :obj:`list` of :obj:`str`: ids of the orphan species
+    """
+    n_reactions = numpy.diff(stoichiometry.matrix.tocsc().indptr)
+    return [stoichiometry.species_ids[i_species] for i_species in numpy.flatnonzero(n_reactions == 0)]
+
+
+def get_dead_end_species(stoichiometry):
+    """ Get the species which participate in reactions, but which can only be produced or
+    only be consumed
+
+    Args:
+        stoichiometry (:obj:`wc_test.stoichiometry.Stoichiometry`): stoichiometry of the model
+
+    Returns:
+        :obj:`list` of :obj:`str`: ids of the dead-end species
+    """
+    n_producers, n_consumers = get_producers_and_consumers(stoichiometry)
+    dead_end = (n_producers > 0) != (n_consumers > 0)
+    return [stoichiometry.species_ids[i_species] for i_species in numpy.flatnonzero(dead_end)]
+
+
+def get_blocked_reactions(stoichiometry, activities, init_populations):
+    """ Get the reactions which can never fire because they have no active rate law, or
+    because one of their reactants is initially absent and can never be produced
+
+    The species which can be present are found by iteratively adding the products of the
+    reactions whose reactants can all be present, starting from the species whose initial
+    populations are positive.
+
+    Args:
+        stoichiometry (:obj:`wc_test.stoichiometry.Stoichiometry`): stoichiometry of the model
+        activities (:obj:`RateLawActivities`): activities of the rate laws of the reactions
+        init_populations (:obj:`numpy.ndarray`): initial population of each species
+
+    Returns:
+        :obj:`list` of :obj:`str`: ids of the blocked reactions
+    """
+    matrix = stoichiometry.matrix
+    consumed = (matrix < 0).astype(numpy.float64)
+    produced = (matrix > 0).astype(numpy.float64)
+    backward_active = activities.backward & stoichiometry.reversible
+
+    present = init_populations > 0
+    while True:
+        absent = (~present).astype(numpy.float64)
+        forward = activities.forward & (consumed.dot(absent) == 0)
+        backward = backward_active & (produced.dot(absent) == 0)
+        new_present = (present
+                       | (produced.T.dot(forward.astype(numpy.float64)) > 0)
+                       | (consumed.T.dot(backward.astype(numpy.float64)) > 0))
+        if numpy.array_equal(new_present, present):
+            break
+        present = new_present
+
+    blocked = ~(forward | backward)
+    return [stoichiometry.reaction_ids[i_reaction] for i_reaction in numpy.flatnonzero(blocked)]
+
+
+def get_quantity_imbalances(stoichiometry, quantities, atol=1e-8):
+    """ Get the reactions which don't balance a quantity of their species, such as mass
+
+    Reactions which involve species whose quantities are undefined (:obj:`numpy.nan`)
+    are not checked.
+
+    Args:
+        stoichiometry (:obj:`wc_test.stoichiometry.Stoichiometry`): stoichiometry of the model
+        quantities (:obj:`numpy.ndarray`): quantity of each species (e.g., molecular weight)
+        atol (:obj:`float`, optional): absolute tolerance
+
+    Returns:
+        :obj:`dict`: dictionary which maps the id of each imbalanced reaction to the net
+            amount of the quantity that it produces
+    """
+    quantities = numpy.asarray(quantities, dtype=numpy.float64)
+    undefined = numpy.isnan(quantities)
+    deltas = stoichiometry.matrix.dot(numpy.where(undefined, 0., quantities))
+    checked = abs(stoichiometry.matrix).dot(undefined.astype(numpy.float64)) == 0
+    imbalanced = (numpy.abs(deltas) > atol) & checked
+    return {stoichiometry.reaction_ids[i_reaction]: deltas[i_reaction].item()
+            for i_reaction in numpy.flatnonzero(imbalanced)}
+
+
+def get_inactive_submodels(model, activities):
+    """ Get the submodels which have no reactions with active rate laws
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+        activities (:obj:`RateLawActivities`): activities of the rate laws of the reactions
+
+    Returns:
+        :obj:`list` of :obj:`str`: ids of the inactive submodels
+    """
+    active = activities.active
+    active_submodels = set()
+    for reaction, is_active in zip(model.reactions, active.tolist()):
+        if is_active and reaction.submodel is not None:
+            active_submodels.add(reaction.submodel.id)
+    return [submodel.id for submodel in model.submodels if submodel.id not in active_submodels]
@@ -0,0 +1,460 @@
+""" Utilities for running simulations of models, optionally in parallel
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import lazy
+from wc_test.model_index import get_index
+from wc_test.perturbation import UndoLog, apply_perturbation
+from wc_test.profiling import profiler
+import concurrent.futures
+import mmap
+import multiprocessing
+import os
+import pickle
+import random
+import shutil
+import tempfile
+
+wc_sim = lazy.import_module('wc_sim')
+
+# simulator of the model simulated by the tasks executed by each worker process
+_worker_simulator = None
+
+MAX_SEED = 2 ** 31 - 1
+
+# backends for the results of simulations
+#
+# * disk: results are saved to the default temporary directory
+# * tmpfs: results are saved to a RAM-backed directory
+# * memory: results are saved to a RAM-backed directory, loaded into memory, and deleted
+RESULTS_BACKENDS = ('disk', 'tmpfs', 'memory')
+
+# RAM-backed directory
+TMPFS_DIR = '/dev/shm'
+
+
+class MemoryRunResults(object):
+    """ Components of the results of a simulation which are held in memory
+
+    Attributes:
+        results_dir (:obj:`str`): path to the directory where the results were saved
+        _components (:obj:`dict`): dictionary which maps the names of components of the
+            results (e.g., :obj:`populations`) to their values
+    """
+
+    def __init__(self, results_dir, components):
+        """
+        Args:
+            results_dir (:obj:`str`): path to the directory where the results were saved
+            components (:obj:`dict`): dictionary which maps the names of components of the
+                results to their values
+        """
+        self.results_dir = results_dir
+        self._components = components
+
+    def get(self, component):
+        """ Get a component of the results
+
+        Args:
+            component (:obj:`str`): name of the component (e.g., :obj:`populations`)
+
+        Returns:
+            :obj:`pandas.DataFrame`: component
+
+        Raises:
+            :obj:`KeyError`: if the component wasn't loaded into memory
+        """
+        if component not in self._components:
+            raise KeyError('Component {} was not loaded into memory'.format(component))
+        return self._components[component]
+
+
+def get_results_root(backend):
+    """ Get the directory in which to save the results of simulations
+
+    Args:
+        backend (:obj:`str`): backend (see :obj:`RESULTS_BACKENDS`)
+
+    Returns:
+        :obj:`str`: path to the directory, or :obj:`None` for the default temporary directory
+
+    Raises:
+        :obj:`ValueError`: if the backend is not supported
+    """
+    if backend not in RESULTS_BACKENDS:
+        raise ValueError('Results backend must be one of {}'.format(', '.join(RESULTS_BACKENDS)))
+    if backend != 'disk' and os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK):
+        return TMPFS_DIR
+    return None
+
+
+def load_run_results(results):
+    """ Load the results of a simulation
+
+    Args:
+        results (:obj:`str` or :obj:`MemoryRunResults`): path to the results of a simulation
+            or in-memory results
+
+    Returns:
+        :obj:`RunResults` or :obj:`MemoryRunResults`: results
+    """
+    if isinstance(results, MemoryRunResults):
+        return results
+    with profiler.phase('load_results'):
+        return wc_sim.run_results.RunResults(results)
+
+
+class SharedModel(object):
+    """ Model which is pickled once to a file in a RAM-backed directory, from which each
+    worker process loads it
+
+    A shared model is itself pickled as only the path to its file, so that it can be sent
+    to many worker processes, or with many tasks, at negligible cost, and the model is
+    pickled only once, rather than once per worker. Each worker memory-maps the file and
+    unpickles its own private copy of the model, so only the pickled bytes are shared;
+    each worker still holds a full copy of the model in memory.
+
+    Attributes:
+        filename (:obj:`str`): path to the pickled model
+    """
+
+    def __init__(self, model, dirname=None):
+        """
+        Args:
+            model (:obj:`wc_lang.Model`): model
+            dirname (:obj:`str`, optional): directory in which to save the model; defaults to
+                :obj:`TMPFS_DIR`, if it is available, or otherwise the default temporary directory
+        """
+        if dirname is None:
+            dirname = get_results_root('tmpfs')
+        file, self.filename = tempfile.mkstemp(suffix='.pkl', dir=dirname)
+        with os.fdopen(file, 'wb') as file:
+            pickle.dump(model, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load(self):
+        """ Load the model
+
+        Returns:
+            :obj:`wc_lang.Model`: model
+        """
+        with open(self.filename, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return pickle.loads(buffer)
+
+    def close(self):
+        """ Remove the file of the model """
+        if self.filename and os.path.isfile(self.filename):
+            os.remove(self.filename)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+def workers_inherit_model():
+    """ Get whether worker processes are forked, in which case they inherit the model from
+    the parent process, without it being pickled, and sharing it is unnecessary
+
+    Returns:
+        :obj:`bool`: :obj:`True` if worker processes are forked
+    """
+    return multiprocessing.get_start_method() == 'fork'
+
+
+class Simulator(object):
+    """ Simulator which runs a model for many perturbations without copying the model
+
+    The :obj:`wc_sim.simulation.Simulation` of the model and the index of the model are
+    built once. Each run applies only the values changed by its perturbation to the model,
+    and reverts them afterwards, rather than copying the model. Each run is still set up
+    from the model by :obj:`wc_sim.simulation.Simulation.run`, which validates and
+    preprocesses the model, compiles its dynamic expressions, and builds its initial state.
+
+    Attributes:
+        model (:obj:`wc_lang.Model`): model
+        source (:obj:`wc_lang.Model`): model which :obj:`model` is a copy of, or :obj:`model`
+        simulation (:obj:`Simulation`): simulation of the model
+    """
+
+    def __init__(self, model, source=None):
+        """
+        Args:
+            model (:obj:`wc_lang.Model`): model
+            source (:obj:`wc_lang.Model`, optional): model which :obj:`model` is a copy of
+        """
+        self.model = model
+        self.source = source if source is not None else model
+        self.simulation = wc_sim.simulation.Simulation(model)
+        get_index(model)
+
+    def run(self, end_time, checkpoint_period, seed, results_dir, perturbation=None, in_memory=None):
+        """ Simulate the model once with a perturbation and consolidate its results
+
+        Args:
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`): checkpoint period
+            seed (:obj:`int`): random number generator seed
+            results_dir (:obj:`str`): path to directory where the results should be saved
+            perturbation (:obj:`dict`, optional): perturbation to apply to the model while it is
+                simulated (see :obj:`wc_test.perturbation.apply_perturbation`)
+            in_memory (:obj:`list` of :obj:`str`, optional): if defined, load these components of
+                the results into memory and delete the results directory
+
+        Returns:
+            :obj:`str` or :obj:`MemoryRunResults`: path to the directory where the results were
+                saved, or in-memory results
+        """
+        undo_log = UndoLog()
+        try:
+            if perturbation:
+                apply_perturbation(self.model, perturbation, undo_log=undo_log)
+            with profiler.phase('simulate'):
+                results_dir = self.simulation.run(time_max=end_time,
+                                                  results_dir=results_dir,
+                                                  checkpoint_period=checkpoint_period,
+                                                  seed=seed).results_dir
+        finally:
+            undo_log.undo()
+
+        # consolidate the checkpoints into HDF5 in the worker rather than in the parent process
+        with profiler.phase('consolidate_results'):
+            run_results = wc_sim.run_results.RunResults(results_dir)
+
+            if in_memory:
+                components = {component: run_results.get(component) for component in in_memory}
+                shutil.rmtree(results_dir)
+                return MemoryRunResults(results_dir, components)
+        return results_dir
+
+
+def get_seeds(n_sims, seed=None):
+    """ Get a seed for each replicate simulation
+
+    Args:
+        n_sims (:obj:`int`): number of simulations
+        seed (:obj:`int`, optional): seed of the first simulation; if :obj:`None`, a
+            random seed is chosen
+
+    Returns:
+        :obj:`list` of :obj:`int`: seed for each simulation
+    """
+    if seed is None:
+        seed = random.randint(0, MAX_SEED - n_sims)
+    return [seed + i_sim for i_sim in range(n_sims)]
+
+
+def init_worker(model):
+    """ Initialize a worker process with the model that its tasks will simulate
+
+    Args:
+        model (:obj:`wc_lang.Model` or :obj:`SharedModel`): model
+    """
+    global _worker_simulator
+    if isinstance(model, SharedModel):
+        model = model.load()
+    _worker_simulator = Simulator(model)
+
+
+def run_simulation(end_time, checkpoint_period, seed, results_dir, perturbation=None,
+                   in_memory=None, simulator=None):
+    """ Simulate a model once and consolidate its results
+
+    Args:
+        end_time (:obj:`float`): end time
+        checkpoint_period (:obj:`float`): checkpoint period
+        seed (:obj:`int`): random number generator seed
+        results_dir (:obj:`str`): path to directory where the results should be saved
+        perturbation (:obj:`dict`, optional): perturbation to apply to the model while it is
+            simulated (see :obj:`wc_test.perturbation.apply_perturbation`)
+        in_memory (:obj:`list` of :obj:`str`, optional): if defined, load these components of
+            the results into memory and delete the results directory
+        simulator (:obj:`Simulator`, optional): simulator; defaults to the
+            simulator of the worker process
+
+    Returns:
+        :obj:`str` or :obj:`MemoryRunResults`: path to the directory where the results were
+            saved, or in-memory results
+    """
+    return (simulator or _worker_simulator).run(end_time, checkpoint_period, seed, results_dir,
+                                                 perturbation=perturbation, in_memory=in_memory)
+
+
+class SimulationPool(object):
+    """ Pool of worker processes which simulate a model in the background
+
+    The model is sent to each worker once, when the pool is created; later changes to the
+    model aren't seen by the workers. Simulations can be submitted as they are needed, and
+    their futures can be awaited with :obj:`asyncio.wrap_future`.
+
+    Attributes:
+        model (:obj:`wc_lang.Model`): model
+        n_workers (:obj:`int`): number of worker processes
+        executor (:obj:`concurrent.futures.ProcessPoolExecutor`): pool of worker processes
+        _own_shared_model (:obj:`SharedModel`): shared model created, and removed, by the pool
+    """
+
+    def __init__(self, model, n_workers=1, shared_model=None):
+        """
+        Args:
+            model (:obj:`wc_lang.Model`): model
+            n_workers (:obj:`int`, optional): number of worker processes
+            shared_model (:obj:`SharedModel`, optional): shared copy of the model; if
+                :obj:`None` and the workers don't inherit the model (see
+                :obj:`workers_inherit_model`), the pool shares the model itself
+        """
+        self.model = model
+        self.n_workers = n_workers
+        self._own_shared_model = None
+        if shared_model is None and not workers_inherit_model():
+            shared_model = self._own_shared_model = SharedModel(model)
+        self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=n_workers,
+                                                               initializer=init_worker,
+                                                               initargs=(shared_model or model,))
+
+    def submit(self, end_time, checkpoint_period, seed, results_dir, perturbation=None, in_memory=None):
+        """ Submit a simulation of the model
+
+        Args:
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`): checkpoint period
+            seed (:obj:`int`): random number generator seed
+            results_dir (:obj:`str`): path to directory where the results should be saved
+            perturbation (:obj:`dict`, optional): perturbation to apply to the model while it is
+                simulated (see :obj:`wc_test.perturbation.apply_perturbation`)
+            in_memory (:obj:`list` of :obj:`str`, optional): if defined, load these components of
+                the results into memory and delete the results directory
+
+        Returns:
+            :obj:`concurrent.futures.Future`: future of the path to the directory where the
+                results were saved, or of the in-memory results
+        """
+        return self.executor.submit(run_simulation, end_time, checkpoint_period, seed, results_dir,
+                                    perturbation, in_memory)
+
+    def shutdown(self, wait=True):
+        """ Shut down the worker processes
+
+        Args:
+            wait (:obj:`bool`, optional): if :obj:`True`, cancel the simulations which haven't
+                started, and wait for the running simulations to finish; otherwise, let the
+                submitted simulations finish in the background
+        """
+        self.executor.shutdown(wait=wait, cancel_futures=wait)
+        if wait and self._own_shared_model is not None:
+            self._own_shared_model.close()
+            self._own_shared_model = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.shutdown()
+
+
+def run_simulations(model, end_time, checkpoint_period, seeds, results_dirs, perturbations=None,
+                    n_workers=1, simulator=None, in_memory=None, shared_model=None):
+    """ Simulate a model several times, optionally in parallel with a pool of processes
+
+    Each simulation is independently seeded and its perturbation is reverted once it has
+    been simulated, so that the results are the same regardless of the number of workers.
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+        end_time (:obj:`float`): end time
+        checkpoint_period (:obj:`float`): checkpoint period
+        seeds (:obj:`list` of :obj:`int`): seed for each simulation
+        results_dirs (:obj:`list` of :obj:`str`): path to directory where the results of each
+            simulation should be saved
+        perturbations (:obj:`list` of :obj:`dict`, optional): perturbation of each simulation
+        n_workers (:obj:`int`, optional): number of worker processes
+        simulator (:obj:`Simulator`, optional): simulator of the model to use when the
+            simulations are run serially
+        in_memory (:obj:`list` of :obj:`str`, optional): if defined, load these components of
+            the results into memory and delete the results directories
+        shared_model (:obj:`SharedModel`, optional): shared copy of the model to send to the
+            worker processes
+
+    Returns:
+        :obj:`list` of :obj:`str` or :obj:`MemoryRunResults`: path to the results of each
+            simulation, or its in-memory results, in the same order as :obj:`seeds`
+    """
+    return list(iter_simulations(model, end_time, checkpoint_period, seeds, results_dirs,
+                                 perturbations=perturbations, n_workers=n_workers,
+                                 simulator=simulator, in_memory=in_memory,
+                                 shared_model=shared_model))
+
+
+def iter_simulations(model, end_time, checkpoint_period, seeds, results_dirs, perturbations=None,
+                     n_workers=1, simulator=None, in_memory=None, shared_model=None):
+    """ Generate the results of several simulations of a model as they finish, in the same
+    order as their seeds
+
+    The model is sent to each worker process once, and each task carries only its seed and
+    perturbation. Unless the workers are forked (see :obj:`workers_inherit_model`), the model
+    is pickled once, to a :obj:`SharedModel` which the workers load.
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+        end_time (:obj:`float`): end time
+        checkpoint_period (:obj:`float`): checkpoint period
+        seeds (:obj:`list` of :obj:`int`): seed for each simulation
+        results_dirs (:obj:`list` of :obj:`str`): path to directory where the results of each
+            simulation should be saved
+        perturbations (:obj:`list` of :obj:`dict`, optional): perturbation of each simulation
+        n_workers (:obj:`int`, optional): number of worker processes
+        simulator (:obj:`Simulator`, optional): simulator of the model to use when the
+            simulations are run serially
+        in_memory (:obj:`list` of :obj:`str`, optional): if defined, load these components of
+            the results into memory and delete the results directories
+        shared_model (:obj:`SharedModel`, optional): shared copy of the model to send to the
+            worker processes; if :obj:`None`, a shared copy is created for these simulations
+            when the workers don't inherit the model
+
+    Yields:
+        :obj:`str` or :obj:`MemoryRunResults`: path to the results of each simulation, or its
+            in-memory results
+    """
+    n_sims = len(seeds)
+    if not n_sims:
+        return
+    n_workers = min(n_workers or 1, n_sims)
+    if perturbations is None:
+        perturbations = [None] * n_sims
+
+    if n_workers <= 1:
+        if simulator is None or simulator.source is not model:
+            simulator = Simulator(model)
+        for seed, results_dir, perturbation in zip(seeds, results_dirs, perturbations):
+            yield simulator.run(end_time, checkpoint_period, seed, results_dir, perturbation=perturbation,
+                                in_memory=in_memory)
+        return
+
+    own_shared_model = None
+    if shared_model is None and not workers_inherit_model():
+        shared_model = own_shared_model = SharedModel(model)
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers,
+                                                    initializer=init_worker,
+                                                    initargs=(shared_model or model,)) as executor:
+            results = executor.map(run_simulation,
+                                   [end_time] * n_sims,
+                                   [checkpoint_period] * n_sims,
+                                   seeds,
+                                   results_dirs,
+                                   perturbations,
+                                   [in_memory] * n_sims,
+                                   chunksize=max(1, n_sims // (4 * n_workers)))
+            for i_sim in range(n_sims):
+                # record the time that the parent process waits for each simulation
+                with profiler.phase('simulate_parallel'):
+                    results_dir = next(results)
+                yield results_dir
+    finally:
+        if own_shared_model is not None:
+            own_shared_model.close()
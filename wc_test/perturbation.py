@@ -0,0 +1,261 @@
+""" Methods for perturbing models
+
+Perturbations can be recorded in an :obj:`UndoLog` so that they can be reverted,
+which allows a model to be shared among tests rather than copied for each test.
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import lazy
+from wc_test.model_index import get_index
+
+wc_utils_units = lazy.import_module('wc_utils.util.units')
+
+# dictionary which maps the types of objects to the attributes which perturbations can change:
+# the values of parameters, and the mean, standard deviation, and units of the initial
+# concentrations of species
+PERTURBABLE_ATTRIBUTES = {
+    'parameter': ('value',),
+    'species': ('mean', 'std', 'units'),
+}
+
+
+class UndoLog(object):
+    """ Log of changes to the attributes of objects which can be reverted
+
+    Attributes:
+        _entries (:obj:`list`): object, name, and original value of each changed attribute,
+            or function which reverts a change, in the order in which they were changed
+    """
+
+    def __init__(self):
+        self._entries = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def set_value(self, obj, attr, value):
+        """ Change the value of an attribute of an object and record its original value
+
+        Args:
+            obj (:obj:`object`): object
+            attr (:obj:`str`): name of the attribute
+            value (:obj:`object`): new value
+        """
+        self._entries.append((obj, attr, getattr(obj, attr)))
+        setattr(obj, attr, value)
+
+    def add(self, undo):
+        """ Record a function which reverts a change
+
+        Args:
+            undo (:obj:`callable`): function which reverts the change
+        """
+        self._entries.append(undo)
+
+    def undo(self):
+        """ Revert all of the logged changes, in reverse order """
+        while self._entries:
+            entry = self._entries.pop()
+            if callable(entry):
+                entry()
+            else:
+                obj, attr, value = entry
+                setattr(obj, attr, value)
+
+
+def set_value(obj, attr, value, undo_log=None):
+    """ Change the value of an attribute of an object, optionally logging the change
+
+    Args:
+        obj (:obj:`object`): object
+        attr (:obj:`str`): name of the attribute
+        value (:obj:`object`): new value
+        undo_log (:obj:`UndoLog`, optional): log to record the change in
+    """
+    if undo_log is None:
+        setattr(obj, attr, value)
+    else:
+        undo_log.set_value(obj, attr, value)
+
+
+def get_perturbable_values(model):
+    """ Get the values of the attributes of a model which perturbations can change (see
+    :obj:`PERTURBABLE_ATTRIBUTES`)
+
+    The values include the attributes of the initial concentrations which perturbations create
+    (see :obj:`set_init_populations`), so that two snapshots differ if an initial concentration
+    was created or removed.
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+
+    Returns:
+        :obj:`dict`: dictionary which maps the type and id of each parameter and species, and the
+            name of each of its perturbable attributes, to the value of the attribute, and which maps
+            the key :obj:`('model', model.id, 'distribution_init_concentrations')` to the number of
+            initial concentrations of the model
+    """
+    values = {}
+    for parameter in model.parameters:
+        for attr in PERTURBABLE_ATTRIBUTES['parameter']:
+            values[('parameter', parameter.id, attr)] = getattr(parameter, attr)
+    for species in model.species:
+        conc = species.distribution_init_concentration
+        if conc is not None:
+            for attr in PERTURBABLE_ATTRIBUTES['species']:
+                values[('species', species.id, attr)] = getattr(conc, attr)
+    values[('model', model.id, 'distribution_init_concentrations')] = len(model.distribution_init_concentrations)
+    return values
+
+
+def get_changed_values(values, other_values):
+    """ Get the keys of the perturbable values which differ between two snapshots of a model
+
+    Args:
+        values (:obj:`dict`): perturbable values (see :obj:`get_perturbable_values`)
+        other_values (:obj:`dict`): other perturbable values
+
+    Returns:
+        :obj:`list` of :obj:`tuple`: sorted keys of the values which differ, or which are
+            only in one snapshot
+    """
+    changed = []
+    for key in set(values).union(other_values):
+        if key not in values or key not in other_values:
+            changed.append(key)
+        elif values[key] is not other_values[key] and values[key] != other_values[key]:
+            changed.append(key)
+    return sorted(changed, key=lambda key: tuple(str(part) for part in key))
+
+
+def select_submodels(model, mod_submodels, undo_log=None):
+    """ Turn off the submodels whose status is :obj:`False` by setting their k_cat's to 0
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+        mod_submodels (:obj:`dict`): dictionary which maps the ids of submodels to their status
+        undo_log (:obj:`UndoLog`, optional): log to record the changes in
+    """
+    index = get_index(model)
+    for id, status in mod_submodels.items():
+        if not status:
+            for k_cat in index.get_submodel_k_cats(id):
+                set_value(k_cat, 'value', 0, undo_log=undo_log)
+
+
+def change_parameter_values(model, mod_parameters, undo_log=None):
+    """ Change the values of parameters
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+        mod_parameters (:obj:`dict`): dictionary which maps the ids of parameters to their new values
+        undo_log (:obj:`UndoLog`, optional): log to record the changes in
+    """
+    index = get_index(model)
+    for id, value in mod_parameters.items():
+        set_value(index.get_parameter(id), 'value', value, undo_log=undo_log)
+
+
+def change_species_mean_init_concentrations(model, mod_species, undo_log=None):
+    """ Change the mean initial concentrations of species
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+        mod_species (:obj:`dict`): dictionary which maps the ids of species to their new mean
+            initial concentrations
+        undo_log (:obj:`UndoLog`, optional): log to record the changes in
+    """
+    index = get_index(model)
+    for id, mean in mod_species.items():
+        set_value(index.get_species(id).distribution_init_concentration, 'mean', mean, undo_log=undo_log)
+
+
+def change_reaction_k_cat_parameter_values(model, mod_reactions, undo_log=None):
+    """ Change the values of the k_cat parameters of reactions
+
+    A new value is applied to the k_cat of the first rate law of each reaction. A value of 0
+    knocks the reaction out by setting the k_cats of all of its rate laws, including the
+    backward rate laws of reversible reactions, to 0.
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+        mod_reactions (:obj:`dict`): dictionary which maps the ids of reactions to the new values
+            of their k_cat parameters
+        undo_log (:obj:`UndoLog`, optional): log to record the changes in
+    """
+    index = get_index(model)
+    for id, k_cat_value in mod_reactions.items():
+        if k_cat_value:
+            k_cats = [index.get_reaction_k_cat(id)]
+        else:
+            k_cats = index.get_reaction_k_cats(id)
+        for k_cat in k_cats:
+            set_value(k_cat, 'value', k_cat_value, undo_log=undo_log)
+
+
+def set_init_populations(model, populations, undo_log=None):
+    """ Set the initial populations of species (e.g., to the final state of a previous simulation)
+    by setting their initial concentrations to distributions with means equal to the populations,
+    standard deviations of 0, and units of molecules
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+        populations (:obj:`dict`): dictionary which maps the ids of species to their populations
+        undo_log (:obj:`UndoLog`, optional): log to record the changes in
+    """
+    index = get_index(model)
+    units = wc_utils_units.unit_registry.parse_units('molecule')
+    for id, population in populations.items():
+        species = index.get_species(id)
+        conc = species.distribution_init_concentration
+        if conc is None:
+            if not population:
+                continue
+            conc = model.distribution_init_concentrations.create(species=species, mean=population, std=0., units=units)
+            conc.id = conc.gen_id()
+            if undo_log is not None:
+                undo_log.add(_get_remove_init_concentration(conc))
+        else:
+            set_value(conc, 'mean', population, undo_log=undo_log)
+            set_value(conc, 'std', 0., undo_log=undo_log)
+            if conc.units != units:
+                set_value(conc, 'units', units, undo_log=undo_log)
+
+
+def _get_remove_init_concentration(conc):
+    """ Get a function which removes an initial concentration from its model
+
+    Args:
+        conc (:obj:`wc_lang.DistributionInitConcentration`): initial concentration
+
+    Returns:
+        :obj:`callable`: function which removes the initial concentration
+    """
+    def remove():
+        conc.species = None
+        conc.model = None
+    return remove
+
+
+def apply_perturbation(model, perturbation, undo_log=None):
+    """ Apply a perturbation to a model
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+        perturbation (:obj:`dict`): dictionary with the optional keys :obj:`submodels`,
+            :obj:`parameters`, :obj:`init_populations`, :obj:`species`, and :obj:`reactions`
+            whose values are the arguments to :obj:`select_submodels`,
+            :obj:`change_parameter_values`, :obj:`set_init_populations`,
+            :obj:`change_species_mean_init_concentrations`, and
+            :obj:`change_reaction_k_cat_parameter_values`
+        undo_log (:obj:`UndoLog`, optional): log to record the changes in
+    """
+    select_submodels(model, perturbation.get('submodels', {}), undo_log=undo_log)
+    change_parameter_values(model, perturbation.get('parameters', {}), undo_log=undo_log)
+    set_init_populations(model, perturbation.get('init_populations', {}), undo_log=undo_log)
+    change_species_mean_init_concentrations(model, perturbation.get('species', {}), undo_log=undo_log)
+    change_reaction_k_cat_parameter_values(model, perturbation.get('reactions', {}), undo_log=undo_log)
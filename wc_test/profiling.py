@@ -0,0 +1,206 @@
+""" Instrumentation of the wall time, CPU time, and peak memory of the phases of tests
+
+Profiling is enabled by setting the environment variable :obj:`WC_TEST_PROFILE` to the path
+of a report (:obj:`.json` or :obj:`.csv`). When it is enabled, the phases of each test
+(reading, copying, simulating, consolidating and loading results, and analysis) are
+recorded, the report is saved at the end of the session, and a summary of each phase is
+printed to standard error. When it is disabled, each instrumented phase costs one
+attribute lookup.
+
+Phases which run in worker processes are not recorded; simulations run in parallel are
+recorded as a single :obj:`simulate_parallel` phase of the parent process.
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+import atexit
+import csv
+import json
+import os
+import sys
+import time
+try:
+    import resource
+except ImportError:  # pragma: no cover # resource is unavailable on Windows
+    resource = None
+
+# phases which are instrumented
+PHASES = ('read', 'copy', 'simulate', 'simulate_parallel', 'consolidate_results', 'load_results', 'analysis')
+
+# fields of each record of a report
+FIELDS = ('test', 'phase', 'wall_time', 'cpu_time', 'peak_rss', 'peak_rss_increase')
+
+
+def get_peak_rss():
+    """ Get the peak resident set size of the process
+
+    Returns:
+        :obj:`int`: peak resident set size (bytes), or 0 if it can't be measured
+    """
+    if resource is None:
+        return 0
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak_rss
+    return peak_rss * 1024
+
+
+class NullPhase(object):
+    """ Phase which isn't recorded """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        pass
+
+
+# phase returned by disabled profilers
+_null_phase = NullPhase()
+
+
+class Phase(object):
+    """ Phase whose wall time, CPU time, and peak memory are recorded
+
+    Attributes:
+        profiler (:obj:`Profiler`): profiler
+        name (:obj:`str`): name of the phase
+        _start (:obj:`tuple`): wall time, CPU time, and peak resident set size at the start
+            of the phase
+    """
+
+    def __init__(self, profiler, name):
+        """
+        Args:
+            profiler (:obj:`Profiler`): profiler
+            name (:obj:`str`): name of the phase
+        """
+        self.profiler = profiler
+        self.name = name
+        self._start = None
+
+    def __enter__(self):
+        self._start = (time.perf_counter(), time.process_time(), get_peak_rss())
+        return self
+
+    def __exit__(self, type, value, traceback):
+        wall_time = time.perf_counter() - self._start[0]
+        cpu_time = time.process_time() - self._start[1]
+        peak_rss = get_peak_rss()
+        self.profiler.records.append({
+            'test': self.profiler.test_id,
+            'phase': self.name,
+            'wall_time': wall_time,
+            'cpu_time': cpu_time,
+            'peak_rss': peak_rss,
+            'peak_rss_increase': peak_rss - self._start[2],
+        })
+
+
+class Profiler(object):
+    """ Recorder of the wall time, CPU time, and peak memory of the phases of tests
+
+    Because the peak resident set size of a process never decreases, each record contains
+    both the peak at the end of the phase and the amount by which the phase raised it.
+
+    Attributes:
+        enabled (:obj:`bool`): if :obj:`True`, record phases
+        test_id (:obj:`str`): id of the current test
+        records (:obj:`list` of :obj:`dict`): wall time, CPU time, and peak memory of each
+            recorded phase (see :obj:`FIELDS`)
+    """
+
+    def __init__(self, enabled=False):
+        """
+        Args:
+            enabled (:obj:`bool`, optional): if :obj:`True`, record phases
+        """
+        self.enabled = enabled
+        self.test_id = None
+        self.records = []
+
+    def phase(self, name):
+        """ Get a context manager which records a phase
+
+        Args:
+            name (:obj:`str`): name of the phase (e.g., :obj:`simulate`)
+
+        Returns:
+            :obj:`Phase` or :obj:`NullPhase`: context manager
+        """
+        if self.enabled:
+            return Phase(self, name)
+        return _null_phase
+
+    def clear(self):
+        """ Remove all records """
+        self.records = []
+
+    def get_summary(self):
+        """ Get the number of times each phase was recorded, and its total wall time,
+        total CPU time, and peak memory
+
+        Returns:
+            :obj:`list` of :obj:`dict`: summary of each phase, in the order the phases were
+                first recorded
+        """
+        summaries = {}
+        for record in self.records:
+            summary = summaries.get(record['phase'], None)
+            if summary is None:
+                summary = summaries[record['phase']] = {
+                    'phase': record['phase'], 'count': 0, 'wall_time': 0., 'cpu_time': 0., 'peak_rss': 0,
+                }
+            summary['count'] += 1
+            summary['wall_time'] += record['wall_time']
+            summary['cpu_time'] += record['cpu_time']
+            summary['peak_rss'] = max(summary['peak_rss'], record['peak_rss'])
+        return list(summaries.values())
+
+    def format_summary(self):
+        """ Format the summary of each phase as a table
+
+        Returns:
+            :obj:`str`: table
+        """
+        lines = ['{:<20} {:>8} {:>12} {:>12} {:>14}'.format(
+            'Phase', 'Count', 'Wall (s)', 'CPU (s)', 'Peak RSS (MiB)')]
+        for summary in self.get_summary():
+            lines.append('{:<20} {:>8d} {:>12.3f} {:>12.3f} {:>14.1f}'.format(
+                summary['phase'], summary['count'], summary['wall_time'], summary['cpu_time'],
+                summary['peak_rss'] / 2. ** 20))
+        return '\n'.join(lines)
+
+    def write(self, filename):
+        """ Save the records to a JSON or CSV file
+
+        Args:
+            filename (:obj:`str`): path to the report; the format is determined by its
+                extension (:obj:`.csv` or otherwise JSON)
+        """
+        with open(filename, 'w', newline='') as file:
+            if os.path.splitext(filename)[1].lower() == '.csv':
+                writer = csv.DictWriter(file, fieldnames=FIELDS)
+                writer.writeheader()
+                writer.writerows(self.records)
+            else:
+                json.dump({'records': self.records, 'summary': self.get_summary()}, file, indent=2)
+
+
+# profiler shared by all test cases
+profiler = Profiler(enabled=bool(os.getenv('WC_TEST_PROFILE')))
+
+
+def report():
+    """ Save the report named by :obj:`WC_TEST_PROFILE` and print the summary of each phase """
+    filename = os.getenv('WC_TEST_PROFILE')
+    if not profiler.enabled or not filename or not profiler.records:
+        return
+    profiler.write(filename)
+    sys.stderr.write('\n' + profiler.format_summary() + '\n')
+
+
+atexit.register(report)
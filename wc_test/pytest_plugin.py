@@ -0,0 +1,141 @@
+""" pytest plugin which orders tests longest-first and distributes them among workers
+(see :obj:`wc_test.scheduling`), and which selects the tests affected by changes to their
+models (see :obj:`wc_test.dependencies`) ::
+
+    pytest -p wc_test.pytest_plugin tests
+    pytest -p wc_test.pytest_plugin --wc-test-shard 2/4 tests
+    pytest -p wc_test.pytest_plugin --wc-test-queue /shared/queue tests
+    pytest -p wc_test.pytest_plugin --wc-test-affected tests
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import dependencies
+from wc_test import scheduling
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('wc_test', 'cost-aware scheduling of wc_test tests')
+    group.addoption('--wc-test-durations', default=scheduling.recorder.filename,
+                    help='path to the history of the durations of tests, which is used to order the tests and '
+                         'which the durations of the tests are recorded to (default: $WC_TEST_DURATIONS)')
+    group.addoption('--wc-test-shard', default=None,
+                    help='run only shard I of N balanced shards, given as I/N, starting from 1')
+    group.addoption('--wc-test-queue', default=None,
+                    help='claim tests from a queue in a directory shared by several workers')
+    group.addoption('--wc-test-dependencies', default=dependencies.tracker.filename,
+                    help='path to the history of the model components which tests depend on '
+                         '(default: $WC_TEST_DEPENDENCIES)')
+    group.addoption('--wc-test-affected', action='store_true', default=False,
+                    help='run only the tests affected by changes to their models or modules since '
+                         'they last passed')
+
+
+def pytest_configure(config):
+    if config.getoption('wc_test_durations'):
+        scheduling.recorder.filename = config.getoption('wc_test_durations')
+    if config.getoption('wc_test_dependencies'):
+        dependencies.tracker.filename = config.getoption('wc_test_dependencies')
+
+
+def get_test_id(item):
+    """ Get the id under which the duration of a test is recorded
+
+    The ids of :obj:`unittest.TestCase` tests are the same as their :obj:`unittest.TestCase.id`
+    so that the same history can be used with unittest and pytest.
+
+    Args:
+        item (:obj:`pytest.Item`): test
+
+    Returns:
+        :obj:`str`: id
+    """
+    cls = getattr(item, 'cls', None)
+    if cls is not None:
+        return '{}.{}.{}'.format(cls.__module__, cls.__qualname__, item.name)
+    return item.nodeid
+
+
+def parse_shard(value):
+    """ Parse the value of :obj:`--wc-test-shard`
+
+    Args:
+        value (:obj:`str`): I/N, where I is the index of the shard, starting from 1
+
+    Returns:
+        :obj:`tuple` of :obj:`int`: index of the shard, starting from 0, and number of shards
+
+    Raises:
+        :obj:`pytest.UsageError`: if the value is invalid
+    """
+    try:
+        i_shard, n_shards = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise pytest.UsageError('--wc-test-shard must be I/N, e.g., 1/4')
+    if not 1 <= i_shard <= n_shards:
+        raise pytest.UsageError('--wc-test-shard must be between 1/N and N/N')
+    return i_shard - 1, n_shards
+
+
+def pytest_collection_modifyitems(session, config, items):
+    if config.getoption('wc_test_affected'):
+        history = dependencies.DependencyHistory(config.getoption('wc_test_dependencies'))
+        affected = set(history.get_affected([get_test_id(item) for item in items],
+                                            [getattr(item, 'cls', None) for item in items]))
+        unaffected = [item for i_item, item in enumerate(items) if i_item not in affected]
+        if unaffected:
+            config.hook.pytest_deselected(items=unaffected)
+        items[:] = [item for i_item, item in enumerate(items) if i_item in affected]
+
+    history = scheduling.DurationHistory(config.getoption('wc_test_durations'))
+    test_ids = [get_test_id(item) for item in items]
+
+    shard = config.getoption('wc_test_shard')
+    if shard:
+        i_shard, n_shards = parse_shard(shard)
+        selected = scheduling.get_shards(test_ids, history, n_shards)[i_shard]
+    else:
+        selected = scheduling.order_longest_first(test_ids, history)
+
+    selected_set = set(selected)
+    deselected = [item for i_item, item in enumerate(items) if i_item not in selected_set]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = [items[i_item] for i_item in selected]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session):
+    dirname = session.config.getoption('wc_test_queue')
+    if not dirname or session.config.option.collectonly:
+        return None
+
+    items = {get_test_id(item): item for item in session.items}
+    queue = scheduling.WorkQueue(dirname)
+    queue.fill(list(items.keys()))
+
+    # claim each test before running the previous test, so that pytest only tears down the
+    # fixtures which the next test doesn't share
+    released = set()
+    claim = queue.claim_known(items, released)
+    while claim is not None:
+        name, test_id = claim
+        next_claim = queue.claim_known(items, released)
+        item = items[test_id]
+        try:
+            item.config.hook.pytest_runtest_protocol(item=item, nextitem=items[next_claim[1]] if next_claim else None)
+        except BaseException:
+            if next_claim is not None:
+                queue.release(next_claim[0])
+            raise
+        queue.complete(name)
+        if session.shouldfail or session.shouldstop:
+            if next_claim is not None:
+                queue.release(next_claim[0])
+            break
+        claim = next_claim
+    return True
@@ -0,0 +1,95 @@
+""" Methods for generating the points of parameter scans
+
+A scan point is a perturbation in the format accepted by
+:obj:`wc_test.perturbation.apply_perturbation`, e.g. ::
+
+    {
+        'parameters': {'mean_doubling_time': 5},
+        'species': {'RNA_1[c]': 444},
+        'reactions': {'transcription_RNA_1': 0.05},
+    }
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+import itertools
+import random
+
+# types of model components which can be scanned, in the order they are applied
+AXIS_TYPES = ('parameters', 'species', 'reactions')
+
+SCAN_MODES = ('zip', 'grid', 'latin_hypercube')
+
+
+def get_scan_points(mod_parameters=None, mod_species=None, mod_reactions=None,
+                    mode='zip', n_samples=None, seed=None):
+    """ Get the points of a scan over parameter values, mean initial species
+    concentrations, and reaction k_cat's
+
+    * :obj:`zip`: the i-th point contains the i-th value of each axis; all axes must
+      have the same number of values
+    * :obj:`grid`: the points are the Cartesian product of the values of the axes
+    * :obj:`latin_hypercube`: the value of each axis is a :obj:`tuple` of its lower and upper
+      bounds, and :obj:`n_samples` points are sampled with a Latin hypercube design
+
+    Args:
+        mod_parameters (:obj:`dict`, optional): dictionary which maps the ids of parameters
+            to lists of values (or bounds)
+        mod_species (:obj:`dict`, optional): dictionary which maps the ids of species to lists
+            of mean initial concentrations (or bounds)
+        mod_reactions (:obj:`dict`, optional): dictionary which maps the ids of reactions to
+            lists of k_cat values (or bounds)
+        mode (:obj:`str`, optional): :obj:`zip`, :obj:`grid`, or :obj:`latin_hypercube`
+        n_samples (:obj:`int`, optional): number of points sampled in :obj:`latin_hypercube` mode
+        seed (:obj:`int`, optional): seed for :obj:`latin_hypercube` sampling
+
+    Returns:
+        :obj:`list` of :obj:`dict`: scan points
+
+    Raises:
+        :obj:`SyntaxError`: if the axes of a :obj:`zip` scan have different lengths
+        :obj:`ValueError`: if the mode is not supported or :obj:`n_samples` is not defined
+            for a :obj:`latin_hypercube` scan
+    """
+    axes = []
+    for axis_type, mod_values in zip(AXIS_TYPES, (mod_parameters, mod_species, mod_reactions)):
+        for id, values in (mod_values or {}).items():
+            axes.append(((axis_type, id), values))
+
+    if not axes:
+        return []
+
+    if mode == 'zip':
+        lengths = [len(values) for _, values in axes]
+        if lengths.count(lengths[0]) != len(lengths):
+            raise SyntaxError('All scanned values should be lists with equal length')
+        coordinates = list(zip(*[values for _, values in axes]))
+
+    elif mode == 'grid':
+        coordinates = list(itertools.product(*[values for _, values in axes]))
+
+    elif mode == 'latin_hypercube':
+        if not n_samples:
+            raise ValueError('`n_samples` must be defined for Latin hypercube scans')
+        rand = random.Random(seed)
+        columns = []
+        for _, (lower, upper) in axes:
+            strata = list(range(n_samples))
+            rand.shuffle(strata)
+            columns.append([lower + (upper - lower) * (stratum + rand.random()) / n_samples
+                            for stratum in strata])
+        coordinates = list(zip(*columns))
+
+    else:
+        raise ValueError('Scan mode must be one of {}'.format(', '.join(SCAN_MODES)))
+
+    points = []
+    for coordinate in coordinates:
+        point = {}
+        for ((axis_type, id), _), value in zip(axes, coordinate):
+            point.setdefault(axis_type, {})[id] = value
+        points.append(point)
+    return points
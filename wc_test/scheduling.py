@@ -0,0 +1,484 @@
+""" Cost-aware ordering and sharding of tests
+
+The duration of each test, together with the hash of each model that it simulates and the
+simulation arguments, is recorded to a history file when the environment variable
+:obj:`WC_TEST_DURATIONS` is set to its path. The history is used to
+
+* order tests longest-first, so that the most expensive tests don't start last,
+* split tests into shards of similar total duration for several workers or CI nodes
+  (:obj:`get_shards`), and
+* distribute tests to workers through a :obj:`WorkQueue` of files in a shared directory,
+  which requires no service other than a file system.
+
+Tests which aren't in the history are assumed to take the median duration of the tests
+which are. A suite can be sharded from a :obj:`load_tests` function::
+
+    def load_tests(loader, tests, pattern):
+        return scheduling.get_shard(tests, int(os.getenv('SHARD')), int(os.getenv('N_SHARDS')))
+
+or with pytest (see :obj:`wc_test.pytest_plugin`)::
+
+    pytest -p wc_test.pytest_plugin --wc-test-shard 1/4 tests
+    pytest -p wc_test.pytest_plugin --wc-test-queue /shared/queue tests
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+import atexit
+import heapq
+import json
+import os
+import tempfile
+import time
+import unittest
+try:
+    import fcntl
+except ImportError:  # pragma: no cover # fcntl is unavailable on Windows
+    fcntl = None
+
+
+class History(object):
+    """ JSON file of a record of each test, which is shared by several processes
+
+    Attributes:
+        filename (:obj:`str`): path to the history
+        records (:obj:`dict`): dictionary which maps the id of each test to its record
+    """
+
+    def __init__(self, filename=None):
+        """
+        Args:
+            filename (:obj:`str`, optional): path to the history; if the file exists, its
+                records are loaded
+        """
+        self.filename = filename
+        self.records = {}
+        if filename and os.path.isfile(filename):
+            self.load()
+
+    def load(self):
+        """ Load the records from :obj:`filename` """
+        with open(self.filename, 'r') as file:
+            self.records = json.load(file)['tests']
+
+    def save(self):
+        """ Merge the records into :obj:`filename`
+
+        The file is re-read before it is replaced, so that processes which share a history
+        file only overwrite the records of the tests that they ran. The file is re-read and
+        replaced while holding an exclusive lock of :obj:`filename`.lock, so that processes
+        which save at the same time don't lose each other's records. The lock requires
+        :obj:`fcntl` (i.e., a POSIX system) and a file system which supports :obj:`flock`;
+        otherwise, each process should use its own history file.
+        """
+        dirname = os.path.dirname(os.path.abspath(self.filename))
+        os.makedirs(dirname, exist_ok=True)
+
+        with open(self.filename + '.lock', 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+
+            records = {}
+            if os.path.isfile(self.filename):
+                with open(self.filename, 'r') as file:
+                    records = json.load(file)['tests']
+            records.update(self.records)
+            self.records = records
+
+            file, temp_filename = tempfile.mkstemp(dir=dirname)
+            try:
+                with os.fdopen(file, 'w') as file:
+                    json.dump({'tests': records}, file, indent=2, sort_keys=True)
+                os.replace(temp_filename, self.filename)
+            except Exception:
+                os.remove(temp_filename)
+                raise
+
+
+class DurationHistory(History):
+    """ History of the durations of tests
+
+    Attributes:
+        filename (:obj:`str`): path to the history
+        records (:obj:`dict`): dictionary which maps the id of each test to its duration (s),
+            the time it was recorded, and the simulations that it ran
+    """
+
+    def get_default_duration(self):
+        """ Get the duration assumed for tests which aren't in the history
+
+        Returns:
+            :obj:`float`: median duration of the recorded tests (s), or 0 if no tests are recorded
+        """
+        durations = sorted(record['duration'] for record in self.records.values())
+        if not durations:
+            return 0.
+        mid = len(durations) // 2
+        if len(durations) % 2:
+            return durations[mid]
+        return (durations[mid - 1] + durations[mid]) / 2.
+
+    def get_durations(self, test_ids):
+        """ Get the expected duration of each of several tests
+
+        Args:
+            test_ids (:obj:`list` of :obj:`str`): ids of the tests
+
+        Returns:
+            :obj:`list` of :obj:`float`: expected duration of each test (s)
+        """
+        default = self.get_default_duration()
+        return [self.records[id]['duration'] if id in self.records else default for id in test_ids]
+
+
+class DurationRecorder(object):
+    """ Recorder of the duration of each test, and of the simulations that it runs
+
+    Attributes:
+        filename (:obj:`str`): path to the history which the records are merged into
+        records (:obj:`dict`): dictionary which maps the id of each recorded test to its
+            duration, the time it was recorded, and the simulations that it ran
+        _test_id (:obj:`str`): id of the current test
+        _start (:obj:`float`): time that the current test started
+        _simulations (:obj:`list` of :obj:`dict`): simulations run by the current test
+    """
+
+    def __init__(self, filename=None):
+        """
+        Args:
+            filename (:obj:`str`, optional): path to the history; if :obj:`None`, durations
+                aren't recorded
+        """
+        self.filename = filename
+        self.records = {}
+        self._test_id = None
+        self._start = None
+        self._simulations = []
+
+    @property
+    def enabled(self):
+        """ Get whether durations are recorded
+
+        Returns:
+            :obj:`bool`: :obj:`True` if durations are recorded
+        """
+        return bool(self.filename)
+
+    def start(self, test_id):
+        """ Start recording a test
+
+        Args:
+            test_id (:obj:`str`): id of the test
+        """
+        self._test_id = test_id
+        self._start = time.perf_counter()
+        self._simulations = []
+
+    def add_simulations(self, model_hash, end_time, checkpoint_period, n_sims):
+        """ Record simulations run by the current test
+
+        Args:
+            model_hash (:obj:`str`): hash of the simulated model (see :obj:`cache.get_model_hash`)
+            end_time (:obj:`float`): end time
+            checkpoint_period (:obj:`float`): checkpoint period
+            n_sims (:obj:`int`): number of simulations
+        """
+        if self._test_id is not None:
+            self._simulations.append({
+                'model_hash': model_hash,
+                'end_time': end_time,
+                'checkpoint_period': checkpoint_period,
+                'n_sims': n_sims,
+            })
+
+    def stop(self):
+        """ Stop recording the current test """
+        if self._test_id is None:
+            return
+        self.records[self._test_id] = {
+            'duration': time.perf_counter() - self._start,
+            'date': time.time(),
+            'simulations': self._simulations,
+        }
+        self._test_id = None
+        self._start = None
+        self._simulations = []
+
+    def save(self):
+        """ Merge the records into the history """
+        history = DurationHistory()
+        history.filename = self.filename
+        history.records = dict(self.records)
+        history.save()
+
+
+# recorder shared by all test cases
+recorder = DurationRecorder(os.getenv('WC_TEST_DURATIONS') or None)
+
+
+def save():
+    """ Merge the durations recorded in this process into the history named by :obj:`WC_TEST_DURATIONS` """
+    if recorder.enabled and recorder.records:
+        recorder.save()
+
+
+atexit.register(save)
+
+
+def get_tests(suite):
+    """ Get the tests of a suite
+
+    Args:
+        suite (:obj:`unittest.TestSuite`): suite
+
+    Returns:
+        :obj:`list` of :obj:`unittest.TestCase`: tests
+    """
+    tests = []
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            tests.extend(get_tests(test))
+        else:
+            tests.append(test)
+    return tests
+
+
+def order_longest_first(test_ids, history):
+    """ Order tests by their expected durations, longest first
+
+    Args:
+        test_ids (:obj:`list` of :obj:`str`): ids of the tests
+        history (:obj:`DurationHistory`): history
+
+    Returns:
+        :obj:`list` of :obj:`int`: indices of the tests in order
+    """
+    durations = history.get_durations(test_ids)
+    return sorted(range(len(test_ids)), key=lambda i_test: (-durations[i_test], test_ids[i_test]))
+
+
+def get_shards(test_ids, history, n_shards):
+    """ Split tests into shards with similar expected total durations
+
+    Tests are assigned longest-first to the shard with the shortest expected total
+    duration, or, if several shards are equally long, the fewest tests. Within each shard, tests are ordered longest-first.
+
+    Args:
+        test_ids (:obj:`list` of :obj:`str`): ids of the tests
+        history (:obj:`DurationHistory`): history
+        n_shards (:obj:`int`): number of shards
+
+    Returns:
+        :obj:`list` of :obj:`list` of :obj:`int`: indices of the tests of each shard
+
+    Raises:
+        :obj:`ValueError`: if the number of shards isn't positive
+    """
+    if n_shards < 1:
+        raise ValueError('The number of shards must be positive')
+    durations = history.get_durations(test_ids)
+    shards = [[] for i_shard in range(n_shards)]
+
+    # ties, such as tests which aren't in the history, are broken by the number of tests of each shard
+    heap = [(0., 0, i_shard) for i_shard in range(n_shards)]
+    for i_test in order_longest_first(test_ids, history):
+        total, n_tests, i_shard = heapq.heappop(heap)
+        shards[i_shard].append(i_test)
+        heapq.heappush(heap, (total + durations[i_test], n_tests + 1, i_shard))
+    return shards
+
+
+def get_shard(suite, i_shard, n_shards, history=None):
+    """ Get one of the balanced shards of a suite
+
+    Args:
+        suite (:obj:`unittest.TestSuite`): suite
+        i_shard (:obj:`int`): index of the shard, starting from 0
+        n_shards (:obj:`int`): number of shards
+        history (:obj:`DurationHistory`, optional): history; defaults to the history named
+            by :obj:`WC_TEST_DURATIONS`
+
+    Returns:
+        :obj:`unittest.TestSuite`: tests of the shard, ordered longest-first
+
+    Raises:
+        :obj:`ValueError`: if the index of the shard is out of range
+    """
+    if not 0 <= i_shard < n_shards:
+        raise ValueError('Shard must be between 0 and {}'.format(n_shards - 1))
+    if history is None:
+        history = DurationHistory(recorder.filename)
+    tests = get_tests(suite)
+    shards = get_shards([test.id() for test in tests], history, n_shards)
+    return unittest.TestSuite([tests[i_test] for i_test in shards[i_shard]])
+
+
+class WorkQueue(object):
+    """ Queue of tests shared by workers through files in a directory
+
+    The queue is filled once, by the first worker to create the file :obj:`filled`, by
+    atomically renaming a directory of one file per test into :obj:`pending`. Each worker claims a test by atomically renaming
+    its file into :obj:`claimed`, and moves it into :obj:`done` when the test has run.
+    Tests are claimed in the order in which they were added.
+
+    Attributes:
+        dirname (:obj:`str`): path to the directory
+    """
+
+    def __init__(self, dirname):
+        """
+        Args:
+            dirname (:obj:`str`): path to the directory, which should be shared by the workers
+        """
+        self.dirname = dirname
+        for subdir in ('claimed', 'done'):
+            os.makedirs(os.path.join(dirname, subdir), exist_ok=True)
+
+    def _get_path(self, *names):
+        return os.path.join(self.dirname, *names)
+
+    def fill(self, test_ids, timeout=60.):
+        """ Add tests to the queue, unless another worker already has
+
+        Args:
+            test_ids (:obj:`list` of :obj:`str`): ids of the tests, in the order in which
+                they should be run
+            timeout (:obj:`float`, optional): maximum time to wait for another worker to
+                finish filling the queue (s)
+
+        Returns:
+            :obj:`bool`: :obj:`True` if this worker filled the queue
+
+        Raises:
+            :obj:`TimeoutError`: if another worker doesn't finish filling the queue in time
+        """
+        try:
+            os.close(os.open(self._get_path('filled'), os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            # another worker is filling the queue
+            start = time.time()
+            while not os.path.isdir(self._get_path('pending')):
+                if time.time() - start > timeout:
+                    raise TimeoutError('Queue {} was not filled'.format(self.dirname))
+                time.sleep(0.1)
+            return False
+
+        temp_dirname = tempfile.mkdtemp(dir=self.dirname)
+        for i_test, test_id in enumerate(test_ids):
+            with open(os.path.join(temp_dirname, '{:08d}'.format(i_test)), 'w') as file:
+                file.write(test_id)
+        os.rename(temp_dirname, self._get_path('pending'))
+        return True
+
+    def claim(self, exclude=()):
+        """ Claim the next test
+
+        Args:
+            exclude (:obj:`set` of :obj:`str`, optional): names of items not to claim
+
+        Returns:
+            :obj:`tuple`: name of the claimed item and id of its test, or :obj:`None` if the
+                queue is empty
+        """
+        pending_dirname = self._get_path('pending')
+        if not os.path.isdir(pending_dirname):
+            return None
+        for name in sorted(os.listdir(pending_dirname)):
+            if name in exclude:
+                continue
+            try:
+                os.rename(os.path.join(pending_dirname, name), self._get_path('claimed', name))
+            except FileNotFoundError:
+                # another worker claimed the test first
+                continue
+            with open(self._get_path('claimed', name), 'r') as file:
+                return name, file.read()
+        return None
+
+    def claim_known(self, test_ids, released):
+        """ Claim the next test which the caller can run, releasing the claimed tests which it
+        can't run back to the queue so that other workers, which may have collected other tests
+        (e.g., with :obj:`pytest -k`), can run them
+
+        Args:
+            test_ids (:obj:`set` of :obj:`str`): ids of the tests which the caller can run
+            released (:obj:`set` of :obj:`str`): names of the items which the caller has
+                released, which aren't claimed again; the names of newly released items are added
+
+        Returns:
+            :obj:`tuple`: name of the claimed item and id of its test, or :obj:`None` if the
+                queue has no more tests which the caller can run
+        """
+        while True:
+            claim = self.claim(exclude=released)
+            if claim is None or claim[1] in test_ids:
+                return claim
+            self.release(claim[0])
+            released.add(claim[0])
+
+    def release(self, name):
+        """ Return a claimed test to the queue
+
+        Args:
+            name (:obj:`str`): name of the claimed item
+        """
+        os.rename(self._get_path('claimed', name), self._get_path('pending', name))
+
+    def complete(self, name):
+        """ Mark a claimed test as done
+
+        Args:
+            name (:obj:`str`): name of the claimed item
+        """
+        os.rename(self._get_path('claimed', name), self._get_path('done', name))
+
+    def __iter__(self):
+        """ Claim tests until the queue is empty, marking each test as done after the
+        caller has run it
+
+        Yields:
+            :obj:`str`: id of the claimed test
+        """
+        while True:
+            claim = self.claim()
+            if claim is None:
+                return
+            name, test_id = claim
+            yield test_id
+            self.complete(name)
+
+
+def run_from_queue(suite, dirname, result, history=None):
+    """ Run the tests of a suite which are claimed from a :obj:`WorkQueue`
+
+    Each worker should call this function with the same suite and directory. The queue is
+    filled longest-first. Tests which aren't in the suite of a worker are returned to the
+    queue for the other workers.
+
+    Args:
+        suite (:obj:`unittest.TestSuite`): suite
+        dirname (:obj:`str`): path to the directory of the queue
+        result (:obj:`unittest.TestResult`): result
+        history (:obj:`DurationHistory`, optional): history; defaults to the history named
+            by :obj:`WC_TEST_DURATIONS`
+
+    Returns:
+        :obj:`unittest.TestResult`: result
+    """
+    if history is None:
+        history = DurationHistory(recorder.filename)
+    tests = {test.id(): test for test in get_tests(suite)}
+    test_ids = list(tests.keys())
+    queue = WorkQueue(dirname)
+    queue.fill([test_ids[i_test] for i_test in order_longest_first(test_ids, history)])
+    released = set()
+    claim = queue.claim_known(tests, released)
+    while claim is not None:
+        name, test_id = claim
+        tests[test_id](result)
+        queue.complete(name)
+        claim = queue.claim_known(tests, released)
+    return result
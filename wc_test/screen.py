@@ -0,0 +1,321 @@
+""" Screens of many perturbations of a model, such as genome-wide knockout screens
+
+A screen is a table (a :obj:`pandas.DataFrame`, a CSV file, or a list of dictionaries)
+with one row per perturbation and the columns ::
+
+    id      unique id of the perturbation (optional; defaults to the number of the row)
+    type    type of the perturbed components: reaction, parameter, submodel, or species
+    target  id of the perturbed component; components separated by ';' are perturbed together
+    value   new k_cat, parameter value, submodel status, or mean initial concentration
+            (optional; defaults to 0, i.e., a knockout, or to off for submodels; a k_cat of 0
+            knocks out all of the rate laws of a reaction, including its backward rate law)
+
+For example ::
+
+    id,type,target,value
+    ko_trn_1,reaction,transcription_RNA_1,
+    ko_trn_1_deg_1,reaction,transcription_RNA_1;degradation_RNA_1,
+    no_trn,submodel,transcription,
+    slow_growth,parameter,mean_doubling_time,57600
+
+The result of each perturbation is reduced to a row of summary metrics as soon as its
+simulation finishes, and the row is appended to a CSV file. Perturbations which already
+succeeded are skipped, so that an interrupted screen can be resumed. Perturbations which
+failed, e.g., because a worker ran out of memory, can be retried, in which case their new
+rows supersede their previous rows.
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import lazy
+import csv
+import math
+import os
+import tempfile
+
+pandas = lazy.import_module('pandas')
+
+# dictionary which maps the types of perturbations to the keys of the perturbations (see
+# :obj:`wc_test.perturbation.apply_perturbation`) which they set
+PERTURBATION_TYPES = {
+    'reaction': 'reactions',
+    'parameter': 'parameters',
+    'submodel': 'submodels',
+    'species': 'species',
+}
+
+# separator of the targets of a row which are perturbed together
+TARGET_SEPARATOR = ';'
+
+# columns of the results of a screen which precede the summary metrics
+RESULT_COLUMNS = ('id', 'seed', 'error')
+
+
+def get_perturbation(type, target, value=None):
+    """ Get the perturbation of a row of a screen
+
+    Args:
+        type (:obj:`str`): type of the perturbed components (see :obj:`PERTURBATION_TYPES`)
+        target (:obj:`str`): ids of the perturbed components, separated by :obj:`TARGET_SEPARATOR`
+        value (:obj:`object`, optional): new value of the components; defaults to 0, or to
+            off for submodels
+
+    Returns:
+        :obj:`dict`: perturbation (see :obj:`wc_test.perturbation.apply_perturbation`)
+
+    Raises:
+        :obj:`ValueError`: if the type is not supported, the row has no targets, or the
+            value is invalid
+    """
+    if type not in PERTURBATION_TYPES:
+        raise ValueError('Perturbation type must be one of {}'.format(', '.join(PERTURBATION_TYPES)))
+
+    ids = [id.strip() for id in str(target).split(TARGET_SEPARATOR) if id.strip()]
+    if not ids:
+        raise ValueError('Perturbations must have at least one target')
+
+    if value is None or (isinstance(value, str) and not value.strip()) \
+            or (isinstance(value, float) and math.isnan(value)):
+        value = 0
+    if type == 'submodel':
+        value = parse_status(value)
+    else:
+        value = float(value)
+
+    return {PERTURBATION_TYPES[type]: {id: value for id in ids}}
+
+
+def parse_status(value):
+    """ Parse the status of a submodel
+
+    Args:
+        value (:obj:`object`): status (e.g., :obj:`False`, :obj:`0`, or :obj:`'off'`)
+
+    Returns:
+        :obj:`bool`: status
+
+    Raises:
+        :obj:`ValueError`: if the status can't be parsed
+    """
+    if isinstance(value, str):
+        status = value.strip().lower()
+        if status in ('1', 'true', 'on'):
+            return True
+        if status in ('0', 'false', 'off'):
+            return False
+        raise ValueError('Invalid submodel status {}'.format(value))
+    return bool(value)
+
+
+def read_screen(table):
+    """ Read the perturbations of a screen
+
+    Args:
+        table (:obj:`pandas.DataFrame`, :obj:`str`, or :obj:`list` of :obj:`dict`): screen,
+            path to a CSV file of a screen, or rows of a screen
+
+    Returns:
+        :obj:`list` of :obj:`tuple`: id and perturbation (see
+            :obj:`wc_test.perturbation.apply_perturbation`) of each row
+
+    Raises:
+        :obj:`ValueError`: if a row is invalid or the ids of the rows aren't unique
+    """
+    if isinstance(table, str):
+        with open(table, 'r', newline='') as file:
+            rows = list(csv.DictReader(file))
+    elif hasattr(table, 'to_dict'):
+        rows = table.to_dict('records')
+    else:
+        rows = table
+
+    perturbations = []
+    ids = set()
+    for i_row, row in enumerate(rows):
+        id = row.get('id', None)
+        if id is None or (isinstance(id, float) and math.isnan(id)) or not str(id).strip():
+            id = i_row
+        id = str(id).strip()
+        if id in ids:
+            raise ValueError('Perturbation {} is defined multiple times'.format(id))
+        ids.add(id)
+
+        try:
+            perturbation = get_perturbation(row.get('type', None), row.get('target', ''), row.get('value', None))
+        except ValueError as error:
+            raise ValueError('Perturbation {} is invalid: {}'.format(id, str(error)))
+        perturbations.append((id, perturbation))
+    return perturbations
+
+
+def summarize(trajectory, species_ids=None, statistics=('final',)):
+    """ Reduce the trajectory of a simulation to summary metrics
+
+    Args:
+        trajectory (:obj:`wc_test.trajectory.Trajectory`): trajectory
+        species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults to all
+            species
+        statistics (:obj:`list` of :obj:`str`, optional): names of the statistics (see
+            :obj:`wc_test.trajectory.STATISTICS`)
+
+    Returns:
+        :obj:`dict`: dictionary which maps the name of each metric (e.g., :obj:`RNA_1[c] final`)
+            to its value
+    """
+    if species_ids is None:
+        species_ids = trajectory.species_ids
+    metrics = {}
+    for statistic, values in trajectory.summarize(species_ids, statistics=statistics).items():
+        for species_id, value in zip(species_ids, values.tolist()):
+            metrics['{} {}'.format(species_id, statistic)] = value
+    return metrics
+
+
+class ScreenResults(object):
+    """ CSV file of the summary metrics of the perturbations of a screen, to which each
+    perturbation is appended as soon as it finishes
+
+    The columns of the metrics are determined by the first perturbation which succeeds. If
+    only failed perturbations have been saved, the columns of the metrics are added to the
+    file when the first perturbation succeeds.
+
+    Attributes:
+        filename (:obj:`str`): path to the file
+        columns (:obj:`list` of :obj:`str`): columns of the file, or :obj:`None` if no
+            perturbations have been saved
+        completed (:obj:`set` of :obj:`str`): ids of the perturbations which succeeded
+        failed (:obj:`set` of :obj:`str`): ids of the perturbations whose most recent
+            simulations failed
+        _file (:obj:`io.TextIOWrapper`): file, opened for appending
+        _writer (:obj:`csv.DictWriter`): writer
+    """
+
+    def __init__(self, filename):
+        """
+        Args:
+            filename (:obj:`str`): path to the file; if the file exists, its perturbations
+                are kept and new perturbations are appended
+        """
+        self.filename = filename
+        self.columns = None
+        self.completed = set()
+        self.failed = set()
+        self._writer = None
+
+        if os.path.isfile(filename):
+            # discard the last row if it was only partially written when the screen was interrupted
+            with open(filename, 'rb+') as file:
+                content = file.read()
+                if content and not content.endswith(b'\n'):
+                    file.truncate(content.rfind(b'\n') + 1)
+
+            with open(filename, 'r', newline='') as file:
+                reader = csv.DictReader(file)
+                self.columns = reader.fieldnames
+                for row in reader:
+                    self._record(row['id'], row['error'])
+
+        self._file = open(filename, 'a', newline='')
+        if self.columns:
+            self._writer = csv.DictWriter(self._file, fieldnames=self.columns)
+
+    def add(self, id, seed, metrics=None, error=None):
+        """ Save the summary metrics of a perturbation
+
+        Args:
+            id (:obj:`str`): id of the perturbation
+            seed (:obj:`int`): seed of its simulation
+            metrics (:obj:`dict`, optional): dictionary which maps the name of each metric to
+                its value; :obj:`None` if the simulation failed
+            error (:obj:`str`, optional): error raised by the simulation
+
+        Raises:
+            :obj:`ValueError`: if the metrics are different from those of the previous
+                perturbations
+        """
+        metrics = metrics or {}
+        if self._writer is None:
+            self.columns = list(RESULT_COLUMNS) + list(metrics)
+            self._writer = csv.DictWriter(self._file, fieldnames=self.columns)
+            self._writer.writeheader()
+        elif metrics and len(self.columns) == len(RESULT_COLUMNS):
+            self._add_columns(list(metrics))
+        elif set(metrics).difference(self.columns[len(RESULT_COLUMNS):]):
+            raise ValueError('The metrics of perturbation {} are different from those of the screen'.format(id))
+
+        row = dict(metrics, id=id, seed=seed, error=error or '')
+        self._writer.writerow(row)
+        self._file.flush()
+        self._record(id, error)
+
+    def _record(self, id, error):
+        """ Record whether a perturbation succeeded
+
+        Args:
+            id (:obj:`str`): id of the perturbation
+            error (:obj:`str`): error raised by its simulation, if any
+        """
+        if error:
+            self.completed.discard(id)
+            self.failed.add(id)
+        else:
+            self.failed.discard(id)
+            self.completed.add(id)
+
+    def _add_columns(self, columns):
+        """ Add columns to the file, leaving the values of the saved perturbations empty
+
+        Args:
+            columns (:obj:`list` of :obj:`str`): names of the columns
+        """
+        self._file.close()
+        with open(self.filename, 'r', newline='') as file:
+            rows = list(csv.DictReader(file))
+        self.columns = self.columns + columns
+
+        file, temp_filename = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.filename)))
+        try:
+            with os.fdopen(file, 'w', newline='') as file:
+                writer = csv.DictWriter(file, fieldnames=self.columns)
+                writer.writeheader()
+                writer.writerows(rows)
+            os.replace(temp_filename, self.filename)
+        except Exception:
+            os.remove(temp_filename)
+            raise
+
+        self._file = open(self.filename, 'a', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.columns)
+
+    def close(self):
+        """ Close the file """
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+def read_results(filename, ids=None):
+    """ Read the summary metrics of a screen; if a perturbation was saved several times,
+    e.g., because it was retried, its most recent row is returned
+
+    Args:
+        filename (:obj:`str`): path to the results of the screen (see :obj:`ScreenResults`)
+        ids (:obj:`list` of :obj:`str`, optional): ids of the perturbations, in the order
+            in which they should be returned; defaults to the order in which they finished
+
+    Returns:
+        :obj:`pandas.DataFrame`: summary metrics (columns) of each perturbation (rows)
+    """
+    results = pandas.read_csv(filename, dtype={'id': str, 'error': str}).set_index('id')
+    results = results[~results.index.duplicated(keep='last')]
+    results['error'] = results['error'].fillna('')
+    if ids is not None:
+        results = results.reindex([str(id) for id in ids])
+    return results
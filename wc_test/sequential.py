@@ -0,0 +1,166 @@
+""" Sequential estimation of statistics of stochastic simulations
+
+Replicates are simulated in batches until the confidence interval of a statistic is
+narrow enough, or until the interval decides whether the statistic is within a margin of
+an expected value, or until a maximum number of replicates is reached.
+
+Because the interval is checked after each batch, each check uses a Bonferroni-corrected
+confidence level (see :obj:`get_look_confidence`), so that the probability that any of
+the checks is wrong is at most one minus the overall confidence level.
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import lazy
+import numpy
+
+scipy = lazy.import_module('scipy')
+
+
+class SequentialEstimate(object):
+    """ Estimate of the mean of a statistic across replicate simulations
+
+    Attributes:
+        values (:obj:`numpy.ndarray`): value of the statistic for each replicate
+        confidence (:obj:`float`): confidence level of the interval
+        mean (:obj:`float`): mean of the statistic
+        half_width (:obj:`float`): half width of the confidence interval of the mean
+        converged (:obj:`bool`): :obj:`True` if the estimate satisfied its stopping criterion
+            before the maximum number of replicates was reached
+    """
+
+    def __init__(self, values, confidence=0.95, converged=False):
+        """
+        Args:
+            values (:obj:`list` of :obj:`float`): value of the statistic for each replicate
+            confidence (:obj:`float`, optional): confidence level of the interval
+            converged (:obj:`bool`, optional): whether the estimate satisfied its stopping criterion
+        """
+        self.values = numpy.asarray(values, dtype=numpy.float64)
+        self.confidence = confidence
+        self.mean = self.values.mean()
+        self.half_width = get_confidence_interval_half_width(self.values, confidence=confidence)
+        self.converged = converged
+
+    @property
+    def n_sims(self):
+        """ Get the number of replicates
+
+        Returns:
+            :obj:`int`: number of replicates
+        """
+        return self.values.size
+
+    @property
+    def lower(self):
+        """ Get the lower bound of the confidence interval
+
+        Returns:
+            :obj:`float`: lower bound
+        """
+        return self.mean - self.half_width
+
+    @property
+    def upper(self):
+        """ Get the upper bound of the confidence interval
+
+        Returns:
+            :obj:`float`: upper bound
+        """
+        return self.mean + self.half_width
+
+    def is_within(self, expected, margin):
+        """ Determine whether the confidence interval lies within a margin of an expected value
+
+        Args:
+            expected (:obj:`float`): expected value
+            margin (:obj:`float`): margin
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the interval lies within the margin
+        """
+        return expected - margin <= self.lower and self.upper <= expected + margin
+
+    def is_outside(self, expected, margin):
+        """ Determine whether the confidence interval lies outside a margin of an expected value
+
+        Args:
+            expected (:obj:`float`): expected value
+            margin (:obj:`float`): margin
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the interval doesn't overlap the margin
+        """
+        return self.upper < expected - margin or expected + margin < self.lower
+
+    def is_decided(self, half_width=None, expected=None, margin=None):
+        """ Determine whether the estimate satisfies a stopping criterion
+
+        Args:
+            half_width (:obj:`float`, optional): maximum half width of the confidence interval
+            expected (:obj:`float`, optional): expected value
+            margin (:obj:`float`, optional): margin around the expected value
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the estimate satisfies a stopping criterion
+        """
+        if half_width is not None and self.half_width <= half_width:
+            return True
+        if expected is not None and (self.is_within(expected, margin) or self.is_outside(expected, margin)):
+            return True
+        return False
+
+    def __str__(self):
+        return '{:g} +/- {:g} ({:g}% confidence, {} replicates)'.format(
+            self.mean, self.half_width, self.confidence * 100, self.n_sims)
+
+
+def get_n_looks(min_sims, max_sims, batch_size):
+    """ Get the maximum number of times that the confidence interval is checked by a sequential
+    estimation which simulates at least :obj:`min_sims` replicates, then batches of
+    :obj:`batch_size` replicates, up to :obj:`max_sims` replicates
+
+    Args:
+        min_sims (:obj:`int`): minimum number of replicates
+        max_sims (:obj:`int`): maximum number of replicates
+        batch_size (:obj:`int`): number of replicates simulated between checks
+
+    Returns:
+        :obj:`int`: maximum number of checks
+    """
+    n_first = min(max(batch_size, min_sims), max_sims)
+    return 1 + int(numpy.ceil((max_sims - n_first) / batch_size))
+
+
+def get_look_confidence(confidence, n_looks):
+    """ Get the Bonferroni-corrected confidence level of each of several checks of a
+    confidence interval
+
+    Args:
+        confidence (:obj:`float`): overall confidence level
+        n_looks (:obj:`int`): number of checks
+
+    Returns:
+        :obj:`float`: confidence level of each check
+    """
+    return 1. - (1. - confidence) / n_looks
+
+
+def get_confidence_interval_half_width(values, confidence=0.95):
+    """ Get the half width of the Student's t confidence interval of the mean of values
+
+    Args:
+        values (:obj:`numpy.ndarray`): values
+        confidence (:obj:`float`, optional): confidence level
+
+    Returns:
+        :obj:`float`: half width, or :obj:`numpy.inf` if there are fewer than two values
+    """
+    n = len(values)
+    if n < 2:
+        return numpy.inf
+    sem = numpy.std(values, ddof=1) / numpy.sqrt(n)
+    return scipy.stats.t.ppf((1. + confidence) / 2., n - 1) * sem
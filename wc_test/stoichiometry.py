@@ -0,0 +1,198 @@
+""" Sparse stoichiometry and composition matrices of models, and vectorized checks of the
+element and charge balance of their reactions
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import lazy
+import numpy
+
+scipy = lazy.import_module('scipy')
+
+
+class Stoichiometry(object):
+    """ Sparse reactions x species stoichiometry matrix of a model
+
+    Attributes:
+        species_ids (:obj:`list` of :obj:`str`): ids of the species (columns)
+        reaction_ids (:obj:`list` of :obj:`str`): ids of the reactions (rows)
+        matrix (:obj:`scipy.sparse.csr_matrix`): coefficient of each species (columns) in
+            each reaction (rows)
+        reversible (:obj:`numpy.ndarray`): :obj:`True` for each reversible reaction
+    """
+
+    def __init__(self, species_ids, reaction_ids, matrix, reversible):
+        """
+        Args:
+            species_ids (:obj:`list` of :obj:`str`): ids of the species (columns)
+            reaction_ids (:obj:`list` of :obj:`str`): ids of the reactions (rows)
+            matrix (:obj:`scipy.sparse.csr_matrix`): coefficient of each species (columns) in
+                each reaction (rows)
+            reversible (:obj:`numpy.ndarray`): :obj:`True` for each reversible reaction
+        """
+        self.species_ids = species_ids
+        self.reaction_ids = reaction_ids
+        self.matrix = matrix
+        self.reversible = reversible
+
+
+class Composition(object):
+    """ Sparse species x elements composition matrix, and charges, of the species of a model
+
+    Attributes:
+        elements (:obj:`list` of :obj:`str`): elements (columns)
+        matrix (:obj:`scipy.sparse.csr_matrix`): number of atoms of each element (columns)
+            in each species (rows)
+        charges (:obj:`numpy.ndarray`): charge of each species
+        defined (:obj:`numpy.ndarray`): :obj:`True` for each species whose empirical formula
+            is defined
+    """
+
+    def __init__(self, elements, matrix, charges, defined):
+        """
+        Args:
+            elements (:obj:`list` of :obj:`str`): elements (columns)
+            matrix (:obj:`scipy.sparse.csr_matrix`): number of atoms of each element (columns)
+                in each species (rows)
+            charges (:obj:`numpy.ndarray`): charge of each species
+            defined (:obj:`numpy.ndarray`): :obj:`True` for each species whose empirical
+                formula is defined
+        """
+        self.elements = elements
+        self.matrix = matrix
+        self.charges = charges
+        self.defined = defined
+
+
+class ReactionImbalance(object):
+    """ Element and charge imbalance of a reaction
+
+    Attributes:
+        reaction_id (:obj:`str`): id of the reaction
+        elements (:obj:`dict`): dictionary which maps each imbalanced element to the number of
+            atoms of the element produced by the reaction
+        charge (:obj:`float`): net charge produced by the reaction
+    """
+
+    def __init__(self, reaction_id, elements, charge):
+        """
+        Args:
+            reaction_id (:obj:`str`): id of the reaction
+            elements (:obj:`dict`): dictionary which maps each imbalanced element to the number
+                of atoms of the element produced by the reaction
+            charge (:obj:`float`): net charge produced by the reaction
+        """
+        self.reaction_id = reaction_id
+        self.elements = elements
+        self.charge = charge
+
+    def __str__(self):
+        msg = []
+        if self.elements:
+            msg.append('element imbalanced: {}'.format(', '.join(
+                '{}: {:+g}'.format(element, delta) for element, delta in sorted(self.elements.items()))))
+        if self.charge:
+            msg.append('charge imbalanced: {:+g}'.format(self.charge))
+        return 'Reaction {} is {}'.format(self.reaction_id, '; '.join(msg))
+
+
+def get_stoichiometry(model):
+    """ Get the sparse stoichiometry matrix of a model
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+
+    Returns:
+        :obj:`Stoichiometry`: stoichiometry
+    """
+    species_ids = [species.id for species in model.species]
+    species_indices = {id: i_species for i_species, id in enumerate(species_ids)}
+    reaction_ids = []
+    reversible = numpy.zeros((len(model.reactions),), dtype=bool)
+    rows = []
+    cols = []
+    coefficients = []
+    for i_reaction, reaction in enumerate(model.reactions):
+        reaction_ids.append(reaction.id)
+        reversible[i_reaction] = bool(reaction.reversible)
+        for participant in reaction.participants:
+            rows.append(i_reaction)
+            cols.append(species_indices[participant.species.id])
+            coefficients.append(participant.coefficient)
+
+    # the coefficients of species which participate more than once in a reaction are summed
+    matrix = scipy.sparse.coo_matrix((coefficients, (rows, cols)),
+                                     shape=(len(reaction_ids), len(species_ids)), dtype=numpy.float64).tocsr()
+    return Stoichiometry(species_ids, reaction_ids, matrix, reversible)
+
+
+def get_composition(model):
+    """ Get the sparse composition matrix and the charges of the species of a model, in
+    the same order as :obj:`get_stoichiometry`
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+
+    Returns:
+        :obj:`Composition`: composition
+    """
+    n_species = len(model.species)
+    element_indices = {}
+    rows = []
+    cols = []
+    counts = []
+    charges = numpy.zeros((n_species,))
+    defined = numpy.zeros((n_species,), dtype=bool)
+    for i_species, species in enumerate(model.species):
+        structure = species.species_type.structure
+        if structure is None or structure.empirical_formula is None:
+            continue
+        defined[i_species] = True
+        charges[i_species] = structure.charge or 0
+        for element, count in structure.empirical_formula.items():
+            if count:
+                rows.append(i_species)
+                cols.append(element_indices.setdefault(element, len(element_indices)))
+                counts.append(count)
+
+    elements = sorted(element_indices, key=element_indices.get)
+    matrix = scipy.sparse.coo_matrix((counts, (rows, cols)),
+                                     shape=(n_species, len(elements)), dtype=numpy.float64).tocsr()
+    return Composition(elements, matrix, charges, defined)
+
+
+def get_reaction_imbalances(stoichiometry, composition, atol=1e-8):
+    """ Get the element and charge imbalances of the reactions of a model by multiplying
+    its stoichiometry and composition matrices
+
+    Reactions which involve species whose empirical formulae are undefined are not checked.
+
+    Args:
+        stoichiometry (:obj:`Stoichiometry`): stoichiometry of the model
+        composition (:obj:`Composition`): composition of the species of the model
+        atol (:obj:`float`, optional): absolute tolerance
+
+    Returns:
+        :obj:`list` of :obj:`ReactionImbalance`: imbalance of each imbalanced reaction
+    """
+    element_deltas = stoichiometry.matrix.dot(composition.matrix).tocsr()
+    element_deltas.data[numpy.abs(element_deltas.data) <= atol] = 0.
+    element_deltas.eliminate_zeros()
+    charge_deltas = stoichiometry.matrix.dot(composition.charges)
+    charge_deltas[numpy.abs(charge_deltas) <= atol] = 0.
+
+    checked = abs(stoichiometry.matrix).dot((~composition.defined).astype(numpy.float64)) == 0
+    imbalanced = ((numpy.diff(element_deltas.indptr) > 0) | (charge_deltas != 0)) & checked
+
+    imbalances = []
+    for i_reaction in numpy.flatnonzero(imbalanced):
+        start, end = element_deltas.indptr[i_reaction], element_deltas.indptr[i_reaction + 1]
+        elements = {composition.elements[i_element]: delta
+                    for i_element, delta in zip(element_deltas.indices[start:end].tolist(),
+                                                element_deltas.data[start:end].tolist())}
+        imbalances.append(ReactionImbalance(stoichiometry.reaction_ids[i_reaction], elements,
+                                            charge_deltas[i_reaction].item()))
+    return imbalances
@@ -0,0 +1,293 @@
+""" Consolidated store of the predicted populations of scans and ensembles of simulations
+
+The populations of all of the points and replicates of a scan or ensemble are saved to
+a single HDF5 file, as a chunked, compressed point x replicate x species x time array,
+together with the times, the ids of the species, and the table of the scanned values
+of each point. ::
+
+    /populations   float64 (point, replicate, species, time)
+    /times         float64 (time,)
+    /species_ids   str (species,)
+    /parameters    float64 (point, axis), NaN if a point doesn't set an axis; the
+                   statuses of submodels are saved as 1 (on) or 0 (off)
+                   attribute `axes`: JSON list of the (type, id) of each axis
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test import lazy
+from wc_test import scan
+import json
+import numpy
+
+h5py = lazy.import_module('h5py')
+
+# types of the perturbations of scan points which are saved with the populations
+AXIS_TYPES = scan.AXIS_TYPES + ('submodels',)
+
+# maximum number of points and species per chunk of the populations
+CHUNK_POINTS = 16
+CHUNK_SPECIES = 256
+
+
+class ResultsStore(object):
+    """ HDF5 file of the populations of the points and replicates of a scan or ensemble
+
+    Attributes:
+        filename (:obj:`str`): path to the file
+        file (:obj:`h5py.File`): file
+        populations (:obj:`h5py.Dataset`): point x replicate x species x time populations
+        times (:obj:`numpy.ndarray`): times
+        species_ids (:obj:`list` of :obj:`str`): ids of the species
+        _species_indices (:obj:`dict`): dictionary which maps the ids of species to their
+            indices
+    """
+
+    def __init__(self, filename, mode='r'):
+        """
+        Args:
+            filename (:obj:`str`): path to the file
+            mode (:obj:`str`, optional): mode in which the file is opened (e.g., :obj:`r`
+                or :obj:`r+`)
+        """
+        self.filename = filename
+        self.file = h5py.File(filename, mode)
+        self.populations = self.file['populations']
+        self.times = self.file['times'][:]
+        self.species_ids = [id.decode() if isinstance(id, bytes) else id for id in self.file['species_ids'][:]]
+        self._species_indices = {id: i_species for i_species, id in enumerate(self.species_ids)}
+
+    @classmethod
+    def create(cls, filename, species_ids, times, n_points, n_replicates=1, points=None,
+               compression='gzip'):
+        """ Create a store
+
+        Args:
+            filename (:obj:`str`): path to the file
+            species_ids (:obj:`list` of :obj:`str`): ids of the species
+            times (:obj:`numpy.ndarray`): times
+            n_points (:obj:`int`): number of points
+            n_replicates (:obj:`int`, optional): number of replicates of each point
+            points (:obj:`list` of :obj:`dict`, optional): scan points (see
+                :obj:`scan.get_scan_points`)
+            compression (:obj:`str`, optional): compression filter; if :obj:`None`, the
+                populations are saved contiguously so that they can be memory-mapped (see
+                :obj:`memmap`)
+
+        Returns:
+            :obj:`ResultsStore`: store, opened for writing
+        """
+        shape = (n_points, n_replicates, len(species_ids), len(times))
+        with h5py.File(filename, 'w') as file:
+            if compression:
+                chunks = (min(n_points, CHUNK_POINTS), 1, min(len(species_ids), CHUNK_SPECIES), len(times))
+                file.create_dataset('populations', shape=shape, dtype=numpy.float64,
+                                    chunks=chunks, compression=compression, shuffle=True,
+                                    fillvalue=numpy.nan)
+            else:
+                file.create_dataset('populations', shape=shape, dtype=numpy.float64,
+                                    fillvalue=numpy.nan)
+            file.create_dataset('times', data=numpy.asarray(times, dtype=numpy.float64))
+            file.create_dataset('species_ids', data=list(species_ids), dtype=h5py.string_dtype())
+
+            axes, values = get_parameter_table(points or [{}] * n_points)
+            parameters = file.create_dataset('parameters', data=values)
+            parameters.attrs['axes'] = json.dumps(axes)
+
+        return cls(filename, mode='r+')
+
+    def close(self):
+        """ Close the file """
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @property
+    def n_points(self):
+        """ Get the number of points
+
+        Returns:
+            :obj:`int`: number of points
+        """
+        return self.populations.shape[0]
+
+    @property
+    def n_replicates(self):
+        """ Get the number of replicates of each point
+
+        Returns:
+            :obj:`int`: number of replicates
+        """
+        return self.populations.shape[1]
+
+    def write(self, i_point, i_replicate, trajectory):
+        """ Save the trajectory of a replicate of a point
+
+        Args:
+            i_point (:obj:`int`): index of the point
+            i_replicate (:obj:`int`): index of the replicate
+            trajectory (:obj:`wc_test.trajectory.Trajectory`): trajectory
+
+        Raises:
+            :obj:`ValueError`: if the times of the trajectory are different from those of
+                the store
+        """
+        if not numpy.array_equal(self.times, trajectory.times):
+            raise ValueError('The trajectory must be sampled at the times of the store')
+        self.populations[i_point, i_replicate, :, :] = trajectory.get_populations(self.species_ids)
+
+    def get_species_indices(self, species_ids):
+        """ Get the indices of species
+
+        Args:
+            species_ids (:obj:`list` of :obj:`str`): ids of species
+
+        Returns:
+            :obj:`numpy.ndarray`: indices of the species
+
+        Raises:
+            :obj:`KeyError`: if a species is not part of the store
+        """
+        try:
+            return numpy.array([self._species_indices[id] for id in species_ids], dtype=numpy.intp)
+        except KeyError as error:
+            raise KeyError('Species {} is not part of the store'.format(error.args[0]))
+
+    def get_populations(self, points=slice(None), replicates=slice(None), species_ids=None):
+        """ Read a slice of the populations
+
+        Only the chunks of the file which overlap the slice are read and decompressed.
+
+        Args:
+            points (:obj:`int` or :obj:`slice`, optional): indices of the points; defaults
+                to all points
+            replicates (:obj:`int` or :obj:`slice`, optional): indices of the replicates;
+                defaults to all replicates
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults to
+                all species
+
+        Returns:
+            :obj:`numpy.ndarray`: populations, indexed by point, replicate, species, and time
+        """
+        if species_ids is None:
+            return self.populations[points, replicates, :, :]
+
+        # HDF5 selections must be increasing; read the species in order, then restore the requested order
+        indices = self.get_species_indices(species_ids)
+        unique_indices, order = numpy.unique(indices, return_inverse=True)
+        populations = self.populations[points, replicates, unique_indices.tolist(), :]
+        return numpy.take(populations, order, axis=-2)
+
+    def get_species(self, species_id):
+        """ Read the populations of a species across all points and replicates
+
+        Args:
+            species_id (:obj:`str`): id of the species
+
+        Returns:
+            :obj:`numpy.ndarray`: populations, indexed by point, replicate, and time
+        """
+        return self.populations[:, :, self.get_species_indices([species_id])[0], :]
+
+    def get_point(self, i_point):
+        """ Read the populations of all species of a point
+
+        Args:
+            i_point (:obj:`int`): index of the point
+
+        Returns:
+            :obj:`numpy.ndarray`: populations, indexed by replicate, species, and time
+        """
+        return self.populations[i_point, :, :, :]
+
+    def get_parameter_table(self):
+        """ Get the scanned values of each point
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`list` of :obj:`tuple`: type (e.g., :obj:`parameters`) and id of each axis
+                * :obj:`numpy.ndarray`: value of each axis (columns) at each point (rows);
+                  :obj:`numpy.nan` if a point doesn't set an axis
+        """
+        parameters = self.file['parameters']
+        return ([tuple(axis) for axis in json.loads(parameters.attrs['axes'])], parameters[:])
+
+    def get_points(self):
+        """ Get the scan points
+
+        Returns:
+            :obj:`list` of :obj:`dict`: scan points (see :obj:`scan.get_scan_points`)
+        """
+        axes, values = self.get_parameter_table()
+        points = []
+        for row in values:
+            point = {}
+            for (axis_type, id), value in zip(axes, row):
+                if not numpy.isnan(value):
+                    point.setdefault(axis_type, {})[id] = bool(value) if axis_type == 'submodels' else value.item()
+            points.append(point)
+        return points
+
+    def memmap(self):
+        """ Memory-map the populations of a store created without compression
+
+        Returns:
+            :obj:`numpy.memmap`: read-only point x replicate x species x time populations
+
+        Raises:
+            :obj:`ValueError`: if the populations are chunked or haven't been written
+        """
+        offset = None
+        if self.populations.chunks is None:
+            offset = self.populations.id.get_offset()
+        if offset is None:
+            raise ValueError('Only contiguous, written populations can be memory-mapped')
+        self.file.flush()
+        return numpy.memmap(self.filename, mode='r', dtype=self.populations.dtype,
+                            offset=offset, shape=self.populations.shape)
+
+
+def get_parameter_table(points):
+    """ Get a table of the scanned values of each point
+
+    Args:
+        points (:obj:`list` of :obj:`dict`): scan points (see :obj:`scan.get_scan_points`)
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`list` of :obj:`list`: type (e.g., :obj:`parameters`) and id of each axis
+            * :obj:`numpy.ndarray`: value of each axis (columns) at each point (rows);
+              :obj:`numpy.nan` if a point doesn't set an axis
+
+    Raises:
+        :obj:`ValueError`: if a point perturbs a type of component which can't be saved
+            (see :obj:`AXIS_TYPES`)
+    """
+    axes = []
+    axis_indices = {}
+    for point in points:
+        unsupported = sorted(set(point).difference(AXIS_TYPES))
+        if unsupported:
+            raise ValueError('Scan points which set {} cannot be saved; points can only set {}'.format(
+                ', '.join(unsupported), ', '.join(AXIS_TYPES)))
+        for axis_type in AXIS_TYPES:
+            for id in point.get(axis_type, {}):
+                if (axis_type, id) not in axis_indices:
+                    axis_indices[(axis_type, id)] = len(axes)
+                    axes.append([axis_type, id])
+
+    values = numpy.full((len(points), len(axes)), numpy.nan)
+    for i_point, point in enumerate(points):
+        for axis_type in AXIS_TYPES:
+            for id, value in point.get(axis_type, {}).items():
+                values[i_point, axis_indices[(axis_type, id)]] = float(bool(value)) if axis_type == 'submodels' else value
+    return axes, values
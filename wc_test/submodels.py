@@ -0,0 +1,133 @@
+""" Extraction of reduced models which contain only selected submodels
+
+A reduced model contains only the selected submodels, their reactions and rate laws, and
+the species, observables, functions, and parameters which they reach. Species which
+participate in both the selected submodels and the other submodels are boundary species.
+Boundary species can be held fixed at their initial populations, by removing them from the
+participants of the selected reactions (while keeping them in the rate laws), or they can
+remain dynamic.
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+# treatments of boundary species
+#
+# * fixed: the populations of boundary species are held at their initial values
+# * dynamic: boundary species are only produced and consumed by the selected submodels
+BOUNDARY_MODES = ('fixed', 'dynamic')
+
+
+def extract_submodels(model, submodel_ids, boundary='fixed'):
+    """ Extract a reduced copy of a model which contains only selected submodels
+
+    Args:
+        model (:obj:`wc_lang.Model`): model
+        submodel_ids (:obj:`list` of :obj:`str`): ids of the submodels to keep
+        boundary (:obj:`str`, optional): treatment of the boundary species (see
+            :obj:`BOUNDARY_MODES`)
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`wc_lang.Model`: reduced model
+            * :obj:`list` of :obj:`str`: ids of the boundary species
+
+    Raises:
+        :obj:`ValueError`: if the boundary mode is not supported or the model doesn't contain
+            a submodel
+    """
+    if boundary not in BOUNDARY_MODES:
+        raise ValueError('Boundary mode must be one of {}'.format(', '.join(BOUNDARY_MODES)))
+    submodel_ids = set(submodel_ids)
+    missing_ids = submodel_ids.difference(submodel.id for submodel in model.submodels)
+    if missing_ids:
+        raise ValueError('Model does not contain submodels: {}'.format(', '.join(sorted(missing_ids))))
+
+    model = model.copy()
+
+    kept_reactions = []
+    removed_reactions = []
+    for reaction in model.reactions:
+        if reaction.submodel is not None and reaction.submodel.id in submodel_ids:
+            kept_reactions.append(reaction)
+        else:
+            removed_reactions.append(reaction)
+
+    kept_participants = set(part.species for reaction in kept_reactions for part in reaction.participants)
+    removed_participants = set(part.species for reaction in removed_reactions for part in reaction.participants)
+    boundary_species = [species for species in model.species
+                        if species in kept_participants and species in removed_participants]
+
+    # remove the other submodels, their reactions, and their rate laws
+    removed_parameters = set()
+    for reaction in removed_reactions:
+        for rate_law in list(reaction.rate_laws):
+            if rate_law.expression:
+                removed_parameters.update(rate_law.expression.parameters)
+            rate_law.reaction = None
+            rate_law.model = None
+        reaction.participants = []
+        reaction.submodel = None
+        reaction.model = None
+    for dfba_obj_reaction in list(getattr(model, 'dfba_obj_reactions', [])):
+        if dfba_obj_reaction.submodel is None or dfba_obj_reaction.submodel.id not in submodel_ids:
+            dfba_obj_reaction.model = None
+    for submodel in list(model.submodels):
+        if submodel.id not in submodel_ids:
+            if getattr(submodel, 'dfba_obj', None) is not None:
+                submodel.dfba_obj.model = None
+            submodel.model = None
+
+    # hold the boundary species fixed by removing them from the participants of the kept reactions
+    if boundary == 'fixed':
+        boundary_set = set(boundary_species)
+        for reaction in kept_reactions:
+            reaction.participants = [part for part in reaction.participants if part.species not in boundary_set]
+
+    # find the species, observables, functions, and parameters reached by the kept rate laws
+    kept_species = set(part.species for reaction in kept_reactions for part in reaction.participants)
+    kept_parameters = set()
+    reached = set()
+    expressions = [rate_law.expression for reaction in kept_reactions for rate_law in reaction.rate_laws
+                   if rate_law.expression]
+    while expressions:
+        expression = expressions.pop()
+        kept_species.update(getattr(expression, 'species', []))
+        kept_parameters.update(getattr(expression, 'parameters', []))
+        for obj in list(getattr(expression, 'observables', [])) + list(getattr(expression, 'functions', [])):
+            if obj not in reached:
+                reached.add(obj)
+                expressions.append(obj.expression)
+
+    # remove the observables, functions, and stop conditions which depend on removed species
+    for attr in ('observables', 'functions', 'stop_conditions'):
+        for obj in list(getattr(model, attr, [])):
+            if obj in reached:
+                continue
+            expression = obj.expression
+            if (any(species not in kept_species for species in getattr(expression, 'species', []))
+                    or any(other.model is None for other in getattr(expression, 'observables', []))
+                    or any(other.model is None for other in getattr(expression, 'functions', []))):
+                obj.model = None
+            else:
+                kept_parameters.update(getattr(expression, 'parameters', []))
+
+    # remove the species which aren't reached, and their initial concentrations and types
+    for species in list(model.species):
+        if species not in kept_species:
+            if species.distribution_init_concentration is not None:
+                species.distribution_init_concentration.model = None
+            species.model = None
+    for species_type in list(model.species_types):
+        if not any(species.model is not None for species in species_type.species):
+            species_type.model = None
+
+    # remove the parameters which were only used by the removed rate laws
+    kept_parameters.update(compartment.init_density for compartment in model.compartments)
+    for parameter in removed_parameters.difference(kept_parameters):
+        parameter.model = None
+
+    return model, [species.id for species in boundary_species]
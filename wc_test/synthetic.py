@@ -0,0 +1,127 @@
+""" Generator of synthetic models of configurable size for benchmarking
+
+Each synthetic model has one compartment, :obj:`n_species` metabolites with the same
+empirical formula and charge, and :obj:`n_reactions` irreversible, element- and
+charge-balanced isomerizations, each with a constant rate given by its own k_cat
+parameter. The reactions are distributed round-robin among :obj:`n_submodels`
+stochastic submodels.
+Models are built in memory; no files or network access are required.
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_onto import onto
+from wc_utils.util.chem import EmpiricalFormula
+from wc_utils.util.units import unit_registry
+import random
+import wc_lang
+
+# empirical formula, molecular weight (g mol^-1), and charge of each synthetic species
+FORMULA = 'C6H12O6'
+MOLECULAR_WEIGHT = 180.156
+CHARGE = 0
+
+
+def get_synthetic_model(n_species=10, n_reactions=None, n_submodels=1, n_parameters=0,
+                        init_population=1000., k_cat=1e-3, seed=None):
+    """ Generate a synthetic model
+
+    Args:
+        n_species (:obj:`int`, optional): number of species
+        n_reactions (:obj:`int`, optional): number of reactions; defaults to :obj:`n_species`
+        n_submodels (:obj:`int`, optional): number of submodels
+        n_parameters (:obj:`int`, optional): number of parameters in addition to the k_cat
+            of each reaction and the parameters required to simulate the model
+        init_population (:obj:`float`, optional): mean initial population of each species
+        k_cat (:obj:`float`, optional): k_cat of each reaction (s^-1)
+        seed (:obj:`int`, optional): seed for choosing the product of each reaction
+
+    Returns:
+        :obj:`wc_lang.Model`: model
+
+    Raises:
+        :obj:`ValueError`: if the model has fewer than two species or fewer than one submodel
+    """
+    if n_species < 2:
+        raise ValueError('Synthetic models must have at least two species')
+    if n_submodels < 1:
+        raise ValueError('Synthetic models must have at least one submodel')
+    if n_reactions is None:
+        n_reactions = n_species
+    rand = random.Random(seed)
+
+    model = wc_lang.Model(id='synthetic_model', version='0.0.1')
+    model.parameters.create(id='mean_doubling_time', value=28800., units=unit_registry.parse_units('s'))
+
+    # compartment
+    compartment = model.compartments.create(
+        id='c', name='Cytosol',
+        biological_type=onto['WC:cellular_compartment'],
+        physical_type=onto['WC:fluid_compartment'],
+        geometry=onto['WC:3D_compartment'],
+        mass_units=unit_registry.parse_units('g'),
+        init_volume=wc_lang.InitVolume(distribution=onto['WC:normal_distribution'],
+                                       mean=4.58e-17, std=0., units=unit_registry.parse_units('l')))
+    compartment.init_density = model.parameters.create(id='density_c', value=1100.,
+                                                       units=unit_registry.parse_units('g l^-1'))
+    volume = model.functions.create(id='volume_c', units=unit_registry.parse_units('l'))
+    volume.expression, error = wc_lang.FunctionExpression.deserialize('c / density_c', {
+        wc_lang.Compartment: {compartment.id: compartment},
+        wc_lang.Parameter: {compartment.init_density.id: compartment.init_density},
+    })
+    assert error is None, str(error)
+
+    # submodels
+    submodels = [model.submodels.create(id='submodel_{}'.format(i_submodel),
+                                        framework=onto['WC:stochastic_simulation_algorithm'])
+                 for i_submodel in range(n_submodels)]
+
+    # species
+    species = []
+    for i_species in range(n_species):
+        species_type = model.species_types.create(
+            id='metabolite_{}'.format(i_species),
+            type=onto['WC:metabolite'],
+            structure=wc_lang.ChemicalStructure(empirical_formula=EmpiricalFormula(FORMULA),
+                                                molecular_weight=MOLECULAR_WEIGHT,
+                                                charge=CHARGE))
+        a_species = model.species.create(species_type=species_type, compartment=compartment,
+                                         units=unit_registry.parse_units('molecule'))
+        a_species.id = a_species.gen_id()
+        init_conc = model.distribution_init_concentrations.create(
+            species=a_species, distribution=onto['WC:normal_distribution'],
+            mean=init_population, std=0., units=unit_registry.parse_units('molecule'))
+        init_conc.id = init_conc.gen_id()
+        species.append(a_species)
+
+    # reactions
+    for i_reaction in range(n_reactions):
+        i_reactant = i_reaction % n_species
+        i_product = (i_reactant + rand.randrange(1, n_species)) % n_species
+        reaction = model.reactions.create(id='reaction_{}'.format(i_reaction),
+                                          submodel=submodels[i_reaction % n_submodels],
+                                          reversible=False,
+                                          rate_units=unit_registry.parse_units('s^-1'))
+        reaction.participants.add(species[i_reactant].species_coefficients.get_or_create(coefficient=-1.))
+        reaction.participants.add(species[i_product].species_coefficients.get_or_create(coefficient=1.))
+
+        k_cat_param = model.parameters.create(id='k_cat_{}'.format(i_reaction), type=onto['WC:k_cat'],
+                                              value=k_cat, units=unit_registry.parse_units('s^-1'))
+        rate_law = model.rate_laws.create(reaction=reaction,
+                                          direction=wc_lang.RateLawDirection.forward,
+                                          units=unit_registry.parse_units('s^-1'))
+        rate_law.id = rate_law.gen_id()
+        rate_law.expression, error = wc_lang.RateLawExpression.deserialize(k_cat_param.id, {
+            wc_lang.Parameter: {k_cat_param.id: k_cat_param},
+        })
+        assert error is None, str(error)
+
+    # additional parameters
+    for i_parameter in range(n_parameters):
+        model.parameters.create(id='parameter_{}'.format(i_parameter), value=1.,
+                                units=unit_registry.parse_units('dimensionless'))
+
+    return model
@@ -0,0 +1,238 @@
+""" Vectorized access to the predicted trajectories of simulations
+
+:Author: Jonathan Karr <jonrkarr@gmail.com>
+:Date: 2026-10-17
+:Copyright: 2026, Karr Lab
+:License: MIT
+"""
+
+from wc_test.profiling import profiler
+import numpy
+import weakref
+
+# Avogadro constant (mol^-1)
+AVOGADRO = 6.02214076e23
+
+# statistics which can be calculated by :obj:`Trajectory.summarize`
+STATISTICS = ('initial', 'final', 'delta', 'mean', 'min', 'max', 'auc')
+
+# dictionary which maps simulation results to their trajectories
+_trajectories = weakref.WeakKeyDictionary()
+
+
+class Trajectory(object):
+    """ Populations of species over time, stored as a species x time array
+
+    Attributes:
+        times (:obj:`numpy.ndarray`): times
+        species_ids (:obj:`list` of :obj:`str`): ids of the species
+        populations (:obj:`numpy.ndarray`): populations of the species (rows) at each
+            time (columns)
+        _species_indices (:obj:`dict`): dictionary which maps the ids of species to
+            their rows
+    """
+
+    def __init__(self, times, species_ids, populations):
+        """
+        Args:
+            times (:obj:`numpy.ndarray`): times
+            species_ids (:obj:`list` of :obj:`str`): ids of the species
+            populations (:obj:`numpy.ndarray`): populations of the species (rows) at each
+                time (columns)
+        """
+        self.times = numpy.asarray(times, dtype=numpy.float64)
+        self.species_ids = list(species_ids)
+        self.populations = numpy.ascontiguousarray(populations, dtype=numpy.float64)
+        self._species_indices = {id: i_species for i_species, id in enumerate(self.species_ids)}
+
+    @classmethod
+    def from_run_results(cls, run_results):
+        """ Get the trajectory of the results of a simulation
+
+        Args:
+            run_results (:obj:`wc_sim.run_results.RunResults`): results of a simulation
+
+        Returns:
+            :obj:`Trajectory`: trajectory
+        """
+        with profiler.phase('load_results'):
+            populations = run_results.get('populations')
+        return cls(populations.index.values, populations.columns, populations.values.T)
+
+    def get_species_indices(self, species_ids=None):
+        """ Get the rows of species
+
+        Args:
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults
+                to all species
+
+        Returns:
+            :obj:`numpy.ndarray` or :obj:`slice`: rows of the species
+
+        Raises:
+            :obj:`KeyError`: if a species is not part of the trajectory
+        """
+        if species_ids is None:
+            return slice(None)
+        try:
+            return numpy.array([self._species_indices[id] for id in species_ids], dtype=numpy.intp)
+        except KeyError as error:
+            raise KeyError('Species {} is not part of the trajectory'.format(error.args[0]))
+
+    def get_populations(self, species_ids=None):
+        """ Get the populations of species over time
+
+        Args:
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults
+                to all species
+
+        Returns:
+            :obj:`numpy.ndarray`: populations of the species (rows) at each time (columns)
+        """
+        return self.populations[self.get_species_indices(species_ids), :]
+
+    def initial(self, species_ids=None):
+        """ Get the initial populations of species
+
+        Args:
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults
+                to all species
+
+        Returns:
+            :obj:`numpy.ndarray`: initial population of each species
+        """
+        return self.populations[self.get_species_indices(species_ids), 0]
+
+    def final(self, species_ids=None):
+        """ Get the final populations of species
+
+        Args:
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults
+                to all species
+
+        Returns:
+            :obj:`numpy.ndarray`: final population of each species
+        """
+        return self.populations[self.get_species_indices(species_ids), -1]
+
+    def delta(self, species_ids=None):
+        """ Get the changes in the populations of species between the start and end of the trajectory
+
+        Args:
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults
+                to all species
+
+        Returns:
+            :obj:`numpy.ndarray`: change in the population of each species
+        """
+        rows = self.get_species_indices(species_ids)
+        return self.populations[rows, -1] - self.populations[rows, 0]
+
+    def mean(self, species_ids=None):
+        """ Get the mean populations of species over the time points of the trajectory
+
+        Args:
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults
+                to all species
+
+        Returns:
+            :obj:`numpy.ndarray`: mean population of each species
+        """
+        return self.get_populations(species_ids).mean(axis=1)
+
+    def min(self, species_ids=None):
+        """ Get the minimum populations of species
+
+        Args:
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults
+                to all species
+
+        Returns:
+            :obj:`numpy.ndarray`: minimum population of each species
+        """
+        return self.get_populations(species_ids).min(axis=1)
+
+    def max(self, species_ids=None):
+        """ Get the maximum populations of species
+
+        Args:
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults
+                to all species
+
+        Returns:
+            :obj:`numpy.ndarray`: maximum population of each species
+        """
+        return self.get_populations(species_ids).max(axis=1)
+
+    def auc(self, species_ids=None):
+        """ Get the areas under the population curves of species, using the trapezoidal rule
+
+        Args:
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults
+                to all species
+
+        Returns:
+            :obj:`numpy.ndarray`: area under the curve of each species
+        """
+        populations = self.get_populations(species_ids)
+        return ((populations[:, 1:] + populations[:, :-1]) * (numpy.diff(self.times) / 2.)).sum(axis=1)
+
+    def summarize(self, species_ids=None, statistics=STATISTICS):
+        """ Calculate statistics of the populations of species
+
+        Args:
+            species_ids (:obj:`list` of :obj:`str`, optional): ids of species; defaults
+                to all species
+            statistics (:obj:`list` of :obj:`str`, optional): names of the statistics
+                (see :obj:`STATISTICS`)
+
+        Returns:
+            :obj:`dict`: dictionary which maps the name of each statistic to its value for
+                each species
+        """
+        return {statistic: getattr(self, statistic)(species_ids) for statistic in statistics}
+
+
+def fit_exponential_growth(times, values):
+    """ Fit exponential growth, :math:`v = v_0 e^{r t}`, to each row of an array with a
+    vectorized log-linear least squares regression
+
+    Args:
+        times (:obj:`numpy.ndarray`): times
+        values (:obj:`numpy.ndarray`): positive values (rows) at each time (columns)
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`numpy.ndarray`: growth rate, :math:`r`, of each row
+            * :obj:`numpy.ndarray`: initial value, :math:`v_0`, of each row
+
+    Raises:
+        :obj:`ValueError`: if there are fewer than two times
+    """
+    times = numpy.asarray(times, dtype=numpy.float64)
+    if times.size < 2:
+        raise ValueError('At least two time points are required to fit growth')
+
+    log_values = numpy.log(numpy.atleast_2d(values))
+    centered_times = times - times.mean()
+    mean_log_values = log_values.mean(axis=1)
+    rates = (log_values - mean_log_values[:, numpy.newaxis]).dot(centered_times) / centered_times.dot(centered_times)
+    init_values = numpy.exp(mean_log_values - rates * times.mean())
+    return rates, init_values
+
+
+def get_trajectory(run_results):
+    """ Get the trajectory of the results of a simulation, loading the populations only
+    once per results
+
+    Args:
+        run_results (:obj:`wc_sim.run_results.RunResults`): results of a simulation
+
+    Returns:
+        :obj:`Trajectory`: trajectory
+    """
+    trajectory = _trajectories.get(run_results, None)
+    if trajectory is None:
+        trajectory = _trajectories[run_results] = Trajectory.from_run_results(run_results)
+    return trajectory